@@ -1,6 +1,7 @@
 from datetime import date
-from dataclasses import fields, asdict
-from typing import Dict, Any, Type, TypeVar, List
+import json
+from dataclasses import asdict
+from typing import Dict, Any, Type, TypeVar, List, Optional, Iterable, Iterator, Hashable, Union
 from Rentables import (
     AddOn,
     Room
@@ -8,7 +9,9 @@ from Rentables import (
 from Rentables.utils import (
     Rate,
     Param,
-    RateRegistry
+    RateRegistry,
+    RateCacheInfo,
+    fingerprint
 )
 from Discounts import (
     Discount,
@@ -17,12 +20,17 @@ from Discounts import (
 from Invoiceables import Invoiceable
 from Invoices import (
     PricingEngine,
+    PricingCache,
+    PricingCacheStats,
+    FixedPoint,
     InvoiceBuilder,
+    IncrementalInvoice,
     Invoice
 )
 from .Exceptions import (
     RegistryError,
-    ValidationError
+    ValidationError,
+    InvoiceError
 )
 from .DTOs import (
     RateDTO,
@@ -32,28 +40,33 @@ from .DTOs import (
     InvoiceableDTO,
     InvoiceDTO
 )
+from .Decoders import decodeDTO
 
 
 DTO = TypeVar("DTO")
 
+DISCOUNT_MEMO_SIZE = 1024
+
 
 class API:
 
     
-    def __init__(self):
-
-        self._rateRegistry     = RateRegistry()
+    def __init__(
+            self,
+            coerceTypes: bool = False,
+            rateCacheSize: int = 1024,
+            pricingCache: Optional[PricingCache] = None,
+            money: Optional[FixedPoint] = None
+    ):
+
+        self._rateRegistry     = RateRegistry(rateCacheSize)
         self._discountRegistry = DiscountRegistry()
-        self._pricingEngine    = PricingEngine()
+        self._pricingEngine    = PricingEngine(pricingCache, money)
         self._invoiceBuilder   = InvoiceBuilder(self._pricingEngine)
 
-        self._DTOMap: Dict[str, Type[Any]] = {
-            "rate": RateDTO,
-            "discounts": DiscountDTO,
-            "addOns": AddOnDTO,
-            "rooms": RoomDTO,
-            "invoiceable": InvoiceableDTO
-        }
+        self.coerceTypes = coerceTypes
+
+        self._sharedDiscounts: Dict[Hashable, Discount] = {}
 
 
     def listRates(self):
@@ -66,59 +79,56 @@ class API:
         return self._rateRegistry.registerRate(name, params)
     
 
-    def getRateParams(self, name: str) -> List[Dict[str, Any]]:
+    def rateCacheInfo(self) -> RateCacheInfo:
 
-        params = self._rateRegistry.getRateParams(name)
-        return [asdict(param) for param in params]
-    
+        return self._rateRegistry.cacheInfo()
 
-    def listDiscounts(self):
 
-        return self._discountRegistry.listDiscounts()
-    
+    def pricingCacheStats(self) -> Optional[PricingCacheStats]:
 
-    def registerDiscount(self, name: str, params: List[Param]):
+        cache = self._pricingEngine.cache
 
-        return self._discountRegistry.registerDiscount(name, params)
-    
+        return cache.stats() if cache is not None else None
 
-    def getDiscountParams(self, name: str) -> List[Dict[str, Any]]:
 
-        params = self._discountRegistry.getDiscountParams(name)
+    def getRateParams(self, name: str) -> List[Dict[str, Any]]:
+
+        params = self._rateRegistry.getRateParams(name)
         return [asdict(param) for param in params]
     
 
-    def _jsonToDTO(self, DTOCls: Type[DTO], json: Dict[str, Any]) -> DTO:
-
-        kwargs: Dict[str, Any] = {}
-
-        for field in fields(DTOCls):
+    def listDiscounts(self):
 
-            key = field.name
+        return self._discountRegistry.listDiscounts()
+    
 
-            if key not in json:
+    def registerDiscount(self, name: str, params: List[Param]):
 
-                continue
+        register = self._discountRegistry.registerDiscount(name, params)
 
-            val = json[key]
+        def decorator(func):
 
-            if key in self._DTOMap:
+            func = register(func)
 
-                cls = self._DTOMap[key]
+            # Discounts built by a replaced builder must not be shared any more.
+            for key in [key for key in self._sharedDiscounts if key[0] == name]:
 
-                if isinstance(val, list):
+                self._sharedDiscounts.pop(key, None)
 
-                    kwargs[key] = [self._jsonToDTO(cls, item) for item in val]
+            return func
 
-                else:
+        return decorator
+    
 
-                    kwargs[key] = self._jsonToDTO(cls, val)
+    def getDiscountParams(self, name: str) -> List[Dict[str, Any]]:
 
-            else:
+        params = self._discountRegistry.getDiscountParams(name)
+        return [asdict(param) for param in params]
+    
 
-                kwargs[key] = val
+    def _jsonToDTO(self, DTOCls: Type[DTO], json: Dict[str, Any]) -> DTO:
 
-        return DTOCls(**kwargs)
+        return decodeDTO(DTOCls, json, self.coerceTypes)
     
 
     def _buildRate(self, rateDTO: RateDTO) -> Rate:
@@ -129,7 +139,7 @@ class API:
         
         except Exception as e:
 
-            raise RegistryError(f"Invalid rate definition: {rateDTO}") from e
+            raise RegistryError("Invalid rate definition", rateDTO) from e
         
 
     def buildRateFromJSON(self, rateJSON: Dict[str, Any]) -> Rate:
@@ -147,7 +157,7 @@ class API:
         
         except Exception as e:
 
-            raise RegistryError(f"Invalid discount definition: {discountDTO}") from e
+            raise RegistryError("Invalid discount definition", discountDTO) from e
         
 
     def buildDiscountFromJSON(self, discountJSON: Dict[str, Any]) -> Discount:
@@ -167,7 +177,7 @@ class API:
         
         except Exception as e:
 
-            raise ValidationError(f"Invalid Add-On: {addOnDTO}") from e
+            raise ValidationError("Invalid Add-On", addOnDTO) from e
         
 
     def buildAddOnFromJSON(self, addOnJSON: Dict[str, Any]) -> AddOn:
@@ -188,10 +198,42 @@ class API:
         
         except Exception as e:
 
-            raise ValidationError(f"Invalid Room: {roomDTO}") from e
+            raise ValidationError("Invalid Room", roomDTO) from e
         
 
-    def buildRoomFromJSON(self, roomJSON: Dict[str, Any]) -> Room:
+    def _buildRoomFromRefs(self, roomJSON: Dict[str, Any], addOns: Dict[str, AddOn]) -> Room:
+
+        roomDTO = self._jsonToDTO(RoomDTO, {**roomJSON, "addOns": []})
+
+        try:
+
+            rate = self._buildRate(roomDTO.rate)
+            refs = []
+
+            for addOnID in roomJSON["addOns"]:
+
+                if addOnID not in addOns:
+
+                    raise ValueError(f"Unknown Add-On id '{addOnID}'")
+
+                refs.append(addOns[addOnID])
+
+            return Room(id=roomDTO.id, name=roomDTO.name, rate=rate, addOns=tuple(refs))
+
+        except Exception as e:
+
+            raise ValidationError("Invalid Room", roomJSON) from e
+
+
+    def buildRoomFromJSON(
+            self,
+            roomJSON: Dict[str, Any],
+            addOns: Optional[Dict[str, AddOn]] = None
+    ) -> Room:
+
+        if addOns is not None:
+
+            return self._buildRoomFromRefs(roomJSON, addOns)
 
         roomDTO = self._jsonToDTO(RoomDTO, roomJSON)
 
@@ -210,15 +252,44 @@ class API:
         
         except Exception as e:
 
-            raise ValidationError(f"Invalid Invoiceable: {invoiceableDTO}") from e
+            raise ValidationError("Invalid Invoiceable", invoiceableDTO) from e
         
 
+    def _buildSharedDiscount(self, discountDTO: DiscountDTO) -> Discount:
+
+        # Discounts are immutable, so each distinct definition is built once
+        # and shared by every invoice, single or batched; the memo is dropped
+        # when it grows past its bound. Sharing them lets the pricing engine
+        # reuse the DiscountIndex it compiled for a repeated discount list.
+        shared = self._sharedDiscounts
+
+        try:
+
+            key = (discountDTO.discountType, fingerprint(discountDTO.params))
+
+            discount = shared.get(key)
+
+        except TypeError:
+
+            return self._buildDiscount(discountDTO)
+
+        if discount is None:
+
+            if len(shared) >= DISCOUNT_MEMO_SIZE:
+
+                shared.clear()
+
+            discount = shared[key] = self._buildDiscount(discountDTO)
+
+        return discount
+
+
     def _buildInvoice(self, invoiceDTO: InvoiceDTO) -> Invoice:
 
         try:
 
             invoiceable = self._buildInvoiceable(invoiceDTO.invoiceable)
-            discounts   = [self._buildDiscount(discount) for discount in invoiceDTO.discounts]
+            discounts   = [self._buildSharedDiscount(discount) for discount in invoiceDTO.discounts]
 
             return self._invoiceBuilder.build(
                 invoiceNum=invoiceDTO.invoiceNum,
@@ -231,7 +302,7 @@ class API:
         
         except Exception as e:
 
-            raise ValidationError(f"Failed to build invoice: {invoiceDTO}") from e
+            raise ValidationError("Failed to build invoice", invoiceDTO) from e
 
 
     def buildInvoiceFromJSON(self, invoiceJSON: Dict[str, Any]) -> Invoice:
@@ -239,3 +310,33 @@ class API:
         invoiceDTO = self._jsonToDTO(InvoiceDTO, invoiceJSON)
 
         return self._buildInvoice(invoiceDTO)
+
+
+    def buildInvoicesFromJSON(
+            self,
+            invoicesJSON: Iterable[Union[Dict[str, Any], str, bytes]],
+            start: int = 0
+    ) -> Iterator[Union[Invoice, InvoiceError]]:
+
+        for index, invoiceJSON in enumerate(invoicesJSON, start):
+
+            try:
+
+                if isinstance(invoiceJSON, (str, bytes)):
+
+                    invoiceJSON = json.loads(invoiceJSON)
+
+                invoiceDTO = self._jsonToDTO(InvoiceDTO, invoiceJSON)
+
+                yield self._buildInvoice(invoiceDTO)
+
+            except Exception as e:
+
+                yield InvoiceError(index, invoiceJSON, e)
+
+
+    def startQuote(self, discountsJSON: List[Dict[str, Any]], t: float) -> IncrementalInvoice:
+
+        discounts = [self.buildDiscountFromJSON(discount) for discount in discountsJSON]
+
+        return IncrementalInvoice(self._pricingEngine, discounts, t)
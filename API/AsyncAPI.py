@@ -0,0 +1,112 @@
+from concurrent.futures import Executor
+from dataclasses import replace
+from datetime import date
+from typing import Any, Dict, Hashable, Optional, Union
+import asyncio
+from Rentables.utils import fingerprint
+from Invoices import Invoice
+from .API import API
+from .DTOs import InvoiceDTO
+from .Decoders import decodeDTO
+from .InvoicePool import InvoicePool
+from .Exceptions import ValidationError
+
+
+class AsyncAPI:
+
+
+    def __init__(self, api: API, executor: Optional[Union[Executor, InvoicePool]] = None, maxConcurrency: int = 8):
+
+        if maxConcurrency < 1:
+
+            raise ValueError("maxConcurrency must be at least 1")
+
+        self.api            = api
+        self.executor       = executor
+        self.maxConcurrency = maxConcurrency
+        self.coalesced      = 0
+
+        self._semaphore: Optional[asyncio.Semaphore]   = None
+        self._inFlight: Dict[Hashable, asyncio.Future] = {}
+
+
+    def _quoteKey(self, invoiceJSON: Dict[str, Any]) -> Optional[Hashable]:
+
+        try:
+
+            key = fingerprint((invoiceJSON["invoiceable"], invoiceJSON.get("discounts", [])))
+
+            hash(key)
+
+        except (KeyError, TypeError):
+
+            return None
+
+        return key
+
+
+    async def _run(self, invoiceJSON: Dict[str, Any]) -> Invoice:
+
+        if self._semaphore is None:
+
+            self._semaphore = asyncio.Semaphore(self.maxConcurrency)
+
+        async with self._semaphore:
+
+            # A pool's workers price with their own API, since the bound
+            # methods of this one cannot be pickled.
+            if isinstance(self.executor, InvoicePool):
+
+                return await asyncio.wrap_future(self.executor.submit(invoiceJSON))
+
+            loop = asyncio.get_running_loop()
+
+            return await loop.run_in_executor(self.executor, self.api.buildInvoiceFromJSON, invoiceJSON)
+
+
+    async def buildInvoiceFromJSON(self, invoiceJSON: Dict[str, Any]) -> Invoice:
+
+        key = self._quoteKey(invoiceJSON)
+
+        if key is None:
+
+            return await self._run(invoiceJSON)
+
+        # Identical baskets share one pricing run. Each caller checks its own
+        # header first, so a bad header never fails the other waiters, then
+        # gets the shared invoice re-stamped with that header.
+        try:
+
+            header      = decodeDTO(InvoiceDTO, invoiceJSON, self.api.coerceTypes)
+            dateCreated = date.fromisoformat(header.dateCreated)
+            dateDue     = date.fromisoformat(header.dateDue)
+
+        except Exception as e:
+
+            raise ValidationError("Failed to build invoice", invoiceJSON) from e
+
+        shared = self._inFlight.get(key)
+
+        if shared is None:
+
+            shared = asyncio.ensure_future(self._run(invoiceJSON))
+
+            self._inFlight[key] = shared
+
+            shared.add_done_callback(lambda _: self._inFlight.pop(key, None))
+
+        else:
+
+            self.coalesced += 1
+
+        invoice = await asyncio.shield(shared)
+
+        return replace(
+            invoice,
+            invoiceNum=header.invoiceNum,
+            payee=header.payee,
+            dateCreated=dateCreated,
+            dateDue=dateDue,
+            invoiceItems=list(invoice.invoiceItems),
+            discountItems=list(invoice.discountItems)
+        )
@@ -56,3 +56,12 @@ class InvoiceDTO:
     dateDue: str
     invoiceable: InvoiceableDTO
     discounts: List[DiscountDTO]
+
+
+DTO_MAP: Dict[str, type] = {
+    "rate": RateDTO,
+    "discounts": DiscountDTO,
+    "addOns": AddOnDTO,
+    "rooms": RoomDTO,
+    "invoiceable": InvoiceableDTO
+}
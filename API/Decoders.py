@@ -0,0 +1,105 @@
+from dataclasses import fields
+from typing import Dict, Any, Type, Callable, List, Optional
+from .DTOs import DTO_MAP
+
+
+Decoder = Callable[[Dict[str, Any]], Any]
+
+# Decoders depend only on the DTO class and the coercion flag, so they are
+# compiled once per process and shared by every API and its helpers.
+_decoders: Dict[bool, Dict[Type[Any], Decoder]] = {False: {}, True: {}}
+
+
+def _coercer(type_: Any) -> Optional[Callable[[Any], Any]]:
+
+    if type_ not in (int, float, str):
+
+        return None
+
+    def coerce(val: Any) -> Any:
+
+        return val if isinstance(val, type_) else type_(val)
+
+    return coerce
+
+
+def compileDecoder(
+        DTOCls: Type[Any],
+        DTOMap: Dict[str, Type[Any]],
+        cache: Dict[Type[Any], Decoder],
+        coerceTypes: bool = False
+) -> Decoder:
+
+    if DTOCls in cache:
+
+        return cache[DTOCls]
+
+    namespace: Dict[str, Any] = {"DTOCls": DTOCls}
+    complete: List[str]       = []
+    partial: List[str]        = []
+
+    for index, field in enumerate(fields(DTOCls)):
+
+        key = field.name
+
+        # Nested DTOs are matched by field name, as the reflective decoder did,
+        # but their decoders are resolved here rather than on every call.
+        if key in DTOMap:
+
+            namespace[f"decode{index}"] = compileDecoder(DTOMap[key], DTOMap, cache, coerceTypes)
+
+            value = (
+                f"[decode{index}(item) for item in {{ref}}] "
+                f"if isinstance({{first}}, list) else decode{index}({{ref}})"
+            )
+
+        elif coerceTypes and (coerce := _coercer(field.type)) is not None:
+
+            namespace[f"coerce{index}"] = coerce
+
+            value = f"coerce{index}({{first}})"
+
+        else:
+
+            value = "{first}"
+
+        ref = f"val{index}"
+
+        complete.append(f"            {key}={value.format(first=f'({ref} := json[{key!r}])', ref=ref)},")
+        partial.append(f"    if {key!r} in json:\n        {ref} = json[{key!r}]\n        kwargs[{key!r}] = {value.format(first=ref, ref=ref)}")
+
+    # Every key present is the common case and decodes in a single call; a
+    # missing key falls back to passing only the keys that exist, so the DTO
+    # raises the same TypeError the reflective decoder did.
+    source = "\n".join([
+        "def decode(json):",
+        "    try:",
+        "        return DTOCls(",
+        *complete,
+        "        )",
+        "    except KeyError:",
+        "        return decodePartial(json)",
+        "",
+        "def decodePartial(json):",
+        "    kwargs = {}",
+        *partial,
+        "    return DTOCls(**kwargs)"
+    ])
+
+    exec(compile(source, f"<decoder {DTOCls.__name__}>", "exec"), namespace)
+
+    cache[DTOCls] = namespace["decode"]
+
+    return cache[DTOCls]
+
+
+def decodeDTO(DTOCls: Type[Any], json: Dict[str, Any], coerceTypes: bool = False) -> Any:
+
+    cache   = _decoders[bool(coerceTypes)]
+    decoder = cache.get(DTOCls)
+
+    if decoder is None:
+
+        decoder = compileDecoder(DTOCls, DTO_MAP, cache, bool(coerceTypes))
+
+    return decoder(json)
@@ -1,8 +1,92 @@
-class RegistryError(Exception):
+from typing import Any, Dict, Optional
+
+
+_NO_SUBJECT = object()
+
+
+class APIError(Exception):
+
+    # The subject (usually a DTO) is only formatted when the message is read,
+    # so failures in large batches do not pay for reprs nobody looks at.
+    def __init__(self, message: str, subject: Any = _NO_SUBJECT):
+
+        super().__init__(message)
+
+        self.message = message
+        self.subject = subject
+
+
+    def __str__(self) -> str:
+
+        if self.subject is _NO_SUBJECT:
+
+            return self.message
+
+        return f"{self.message}: {self.subject}"
+
+
+class RegistryError(APIError):
 
     pass
 
 
-class ValidationError(Exception):
+class ValidationError(APIError):
 
     pass
+
+
+class InvoiceError(ValidationError):
+
+
+    def __init__(self, index: int, invoiceJSON: Any, cause: BaseException):
+
+        super().__init__("Failed to build invoice")
+
+        self.index       = index
+        self.invoiceJSON = invoiceJSON
+        self.cause       = cause
+
+        self.__cause__ = cause
+
+
+    def __reduce__(self) -> Any:
+
+        # Exception chains do not survive pickling, so errors sent back from
+        # worker processes carry their root reason as the cause.
+        return (InvoiceError, (self.index, self.invoiceJSON, self.reason))
+
+
+    @property
+    def invoiceNum(self) -> Optional[Any]:
+
+        return self.invoiceJSON.get("invoiceNum") if isinstance(self.invoiceJSON, dict) else None
+
+
+    @property
+    def reason(self) -> BaseException:
+
+        reason = self.cause
+
+        while reason.__cause__ is not None:
+
+            reason = reason.__cause__
+
+        return reason
+
+
+    def toJSON(self) -> Dict[str, Any]:
+
+        return {
+            "index": self.index,
+            "invoiceNum": self.invoiceNum,
+            "error": type(self.reason).__name__,
+            "message": str(self.reason)
+        }
+
+
+    def __str__(self) -> str:
+
+        return (
+            f"{self.message} at index {self.index} (invoiceNum: {self.invoiceNum}): "
+            f"{type(self.reason).__name__}: {self.reason}"
+        )
@@ -0,0 +1,128 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import os
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+from Invoices import Invoice
+from .API import API
+from .Exceptions import InvoiceError
+
+
+Setup       = Callable[[API], Any]
+InvoiceSpec = Union[Dict[str, Any], str, bytes]
+
+_workerAPI: Optional[API] = None
+
+
+def _initWorker(setup: Sequence[Setup], apiOptions: Dict[str, Any]):
+
+    global _workerAPI
+
+    _workerAPI = API(**apiOptions)
+
+    for register in setup:
+
+        register(_workerAPI)
+
+
+def _buildChunk(start: int, invoicesJSON: List[InvoiceSpec]) -> List[Union[Invoice, InvoiceError]]:
+
+    return list(_workerAPI.buildInvoicesFromJSON(invoicesJSON, start))
+
+
+def _buildInvoice(invoiceJSON: Dict[str, Any]) -> Invoice:
+
+    return _workerAPI.buildInvoiceFromJSON(invoiceJSON)
+
+
+# Rates and discounts close over lambdas and local classes and cannot be
+# pickled, so workers receive plain invoice JSON and build everything with
+# their own API, set up once per process by the given setup callables.
+# Passing specs as JSON text rather than dicts keeps the parent's share of
+# the work, and so the serial fraction of a run, small.
+class InvoicePool:
+
+
+    def __init__(
+            self,
+            setup: Sequence[Setup] = (registerDefaultRates, registerDefaultDiscounts),
+            workers: Optional[int] = None,
+            chunkSize: int = 256,
+            maxPendingChunks: Optional[int] = None,
+            **apiOptions: Any
+    ):
+
+        if chunkSize < 1:
+
+            raise ValueError("chunkSize must be at least 1")
+
+        self.workers          = workers or os.cpu_count() or 1
+        self.chunkSize        = chunkSize
+        self.maxPendingChunks = maxPendingChunks or self.workers * 2
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initWorker,
+            initargs=(tuple(setup), apiOptions)
+        )
+
+
+    def _chunks(self, invoicesJSON: Iterable[InvoiceSpec]) -> Iterator[Tuple[int, List[InvoiceSpec]]]:
+
+        invoicesJSON = iter(invoicesJSON)
+        start        = 0
+
+        while chunk := list(islice(invoicesJSON, self.chunkSize)):
+
+            yield start, chunk
+
+            start += len(chunk)
+
+
+    def buildInvoicesFromJSON(self, invoicesJSON: Iterable[InvoiceSpec]) -> Iterator[Union[Invoice, InvoiceError]]:
+
+        # Only a bounded window of chunks is in flight, so arbitrarily long
+        # inputs stream through without being read ahead in full.
+        pending: Deque[Future] = deque()
+
+        try:
+
+            for start, chunk in self._chunks(invoicesJSON):
+
+                pending.append(self._executor.submit(_buildChunk, start, chunk))
+
+                if len(pending) >= self.maxPendingChunks:
+
+                    yield from pending.popleft().result()
+
+            while pending:
+
+                yield from pending.popleft().result()
+
+        finally:
+
+            for future in pending:
+
+                future.cancel()
+
+
+    def submit(self, invoiceJSON: Dict[str, Any]) -> "Future[Invoice]":
+
+        return self._executor.submit(_buildInvoice, invoiceJSON)
+
+
+    def close(self):
+
+        self._executor.shutdown()
+
+
+    def __enter__(self) -> "InvoicePool":
+
+        return self
+
+
+    def __exit__(self, *exc: Any):
+
+        self.close()
@@ -1,3 +1,10 @@
 from .API import API
+from .InvoicePool import InvoicePool
+from .AsyncAPI import AsyncAPI
+from .Exceptions import (
+    RegistryError,
+    ValidationError,
+    InvoiceError
+)
 
-__all__ = ["API"]
+__all__ = ["API", "InvoicePool", "AsyncAPI", "RegistryError", "ValidationError", "InvoiceError"]
@@ -0,0 +1,71 @@
+import json
+import pickle
+from API import InvoiceError
+
+
+def testBatchMatchesSingleInvoices(api, invoiceJSON):
+
+    specs = [invoiceJSON(i, rooms=i % 4 + 1, t=i + 0.5) for i in range(10)]
+
+    assert list(api.buildInvoicesFromJSON(specs)) == [api.buildInvoiceFromJSON(spec) for spec in specs]
+
+
+def testErrorsStayWithTheirItem(api, invoiceJSON):
+
+    good    = invoiceJSON(1)
+    unknown = {**invoiceJSON(2), "discounts": [{"discountType": "Nope", "params": {}}]}
+    missing = {key: value for key, value in invoiceJSON(3).items() if key != "payee"}
+    results = list(api.buildInvoicesFromJSON([good, unknown, "{not json", json.dumps(invoiceJSON(4)), missing], start=10))
+
+    assert [type(result).__name__ for result in results] == ["Invoice", "InvoiceError", "InvoiceError", "Invoice", "InvoiceError"]
+    errors = [result for result in results if isinstance(result, InvoiceError)]
+
+    assert [error.index for error in errors] == [11, 12, 14]
+    assert [error.invoiceNum for error in errors] == [2, None, 3]
+    assert results[3] == api.buildInvoiceFromJSON(invoiceJSON(4))
+    assert isinstance(results[2].reason, json.JSONDecodeError)
+    assert isinstance(results[4].reason, TypeError)
+    assert results[1].toJSON()["index"] == 11 and "index 11 (invoiceNum: 2)" in str(results[1])
+
+
+def testPullsOneItemAtATime(api, invoiceJSON):
+
+    pulled = []
+
+    def specs():
+
+        for i in range(5):
+
+            pulled.append(i)
+
+            yield invoiceJSON(i)
+
+    invoices = api.buildInvoicesFromJSON(specs())
+
+    assert next(invoices).invoiceNum == 0 and pulled == [0]
+    assert next(invoices).invoiceNum == 1 and pulled == [0, 1]
+
+
+def testErrorsPickleWithTheirReason(api):
+
+    error, = api.buildInvoicesFromJSON([{"invoiceNum": 9}])
+    copy   = pickle.loads(pickle.dumps(error))
+
+    assert isinstance(copy, InvoiceError)
+    assert copy.toJSON() == error.toJSON()
+
+
+def testEqualDiscountsAreShared(api, invoiceJSON):
+
+    list(api.buildInvoicesFromJSON([invoiceJSON(1), invoiceJSON(2), invoiceJSON(3, bundle=["Room 2"])]))
+    api.buildInvoiceFromJSON(invoiceJSON(4))
+
+    assert len(api._sharedDiscounts) == 2
+
+    @api.registerDiscount("Room Bundle Discount", [])
+    def buildNoDiscount(params):
+
+        raise ValueError("replaced")
+
+    assert api._sharedDiscounts == {}
+    assert isinstance(next(api.buildInvoicesFromJSON([invoiceJSON(5)])).reason, ValueError)
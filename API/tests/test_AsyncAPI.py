@@ -0,0 +1,79 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+import pytest
+from API import AsyncAPI, ValidationError
+
+
+def gather(asyncAPI, specs):
+
+    async def run():
+
+        return await asyncio.gather(*(asyncAPI.buildInvoiceFromJSON(spec) for spec in specs), return_exceptions=True)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(2)])
+def testCoalescesIdenticalBaskets(api, invoiceJSON, executor):
+
+    asyncAPI = AsyncAPI(api, executor)
+    specs    = [{**invoiceJSON(i), "payee": f"Payee {i}"} for i in range(5)] + [invoiceJSON(5, rooms=1)]
+    invoices = gather(asyncAPI, specs)
+
+    assert invoices == [api.buildInvoiceFromJSON(spec) for spec in specs]
+    assert asyncAPI.coalesced == 4
+    assert asyncAPI._inFlight == {}
+
+    # Coalesced invoices share no mutable state.
+    invoices[0].invoiceItems.clear()
+
+    assert invoices[1].invoiceItems
+
+
+def testBadHeadersOnlyFailTheirCaller(api, invoiceJSON):
+
+    asyncAPI = AsyncAPI(api)
+    specs    = [invoiceJSON(1), {**invoiceJSON(2), "dateDue": "soon"}, invoiceJSON(3)]
+    results  = gather(asyncAPI, specs)
+
+    assert isinstance(results[1], ValidationError)
+    assert [results[0].invoiceNum, results[2].invoiceNum] == [1, 3]
+    assert results[2].dateDue == date(2024, 1, 31)
+
+
+def testUnkeyableSpecsAreBuiltDirectly(api, invoiceJSON):
+
+    asyncAPI = AsyncAPI(api)
+    spec     = {key: value for key, value in invoiceJSON(1).items() if key != "invoiceable"}
+
+    result, = gather(asyncAPI, [spec])
+
+    assert isinstance(result, TypeError)
+    assert asyncAPI.coalesced == 0
+
+
+def testCancellingOneWaiterKeepsTheOthers(api, invoiceJSON):
+
+    asyncAPI = AsyncAPI(api)
+
+    async def run():
+
+        first  = asyncio.ensure_future(asyncAPI.buildInvoiceFromJSON(invoiceJSON(1)))
+        second = asyncio.ensure_future(asyncAPI.buildInvoiceFromJSON(invoiceJSON(2)))
+
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        return await second
+
+    assert asyncio.run(run()) == api.buildInvoiceFromJSON(invoiceJSON(2))
+    assert asyncAPI.coalesced == 1
+
+
+def testRejectsNoConcurrency(api):
+
+    with pytest.raises(ValueError, match="maxConcurrency"):
+
+        AsyncAPI(api, maxConcurrency=0)
@@ -0,0 +1,90 @@
+from dataclasses import fields
+import pytest
+from API.DTOs import DTO_MAP, RateDTO, AddOnDTO, RoomDTO, InvoiceableDTO, InvoiceDTO
+from API.Decoders import decodeDTO
+
+
+RATE  = {"rateType": "Fixed Rate", "params": {"Rate": 10}}
+ADDON = {"id": "a1", "name": "Projector", "rate": RATE}
+ROOM  = {"id": "r1", "name": "Hall", "rate": RATE, "addOns": [ADDON, {**ADDON, "id": "a2"}]}
+
+INVOICE = {
+    "invoiceNum": 7,
+    "payee": "ACME",
+    "dateCreated": "2026-01-01",
+    "dateDue": "2026-02-01",
+    "invoiceable": {"rooms": [ROOM], "addOns": [ADDON], "t": 2.5},
+    "discounts": [{"discountType": "Bulk Discount", "params": {"rate": 0.1}}],
+    "ignored": True
+}
+
+
+def reflective(DTOCls, json):
+
+    # The reflective decoder the compiled ones replaced.
+    kwargs = {}
+
+    for field in fields(DTOCls):
+
+        if field.name not in json:
+
+            continue
+
+        val = json[field.name]
+
+        if field.name in DTO_MAP:
+
+            cls = DTO_MAP[field.name]
+
+            kwargs[field.name] = [reflective(cls, item) for item in val] if isinstance(val, list) else reflective(cls, val)
+
+        else:
+
+            kwargs[field.name] = val
+
+    return DTOCls(**kwargs)
+
+
+@pytest.mark.parametrize("DTOCls, json", [
+    (RateDTO, RATE),
+    (AddOnDTO, ADDON),
+    (RoomDTO, ROOM),
+    (RoomDTO, {**ROOM, "rate": [RATE, RATE]}),
+    (InvoiceableDTO, INVOICE["invoiceable"]),
+    (InvoiceDTO, INVOICE)
+])
+def testMatchesTheReflectiveDecoder(DTOCls, json):
+
+    assert decodeDTO(DTOCls, json) == reflective(DTOCls, json)
+
+
+@pytest.mark.parametrize("json", [
+    {key: value for key, value in ROOM.items() if key != "name"},
+    {**ROOM, "addOns": [{"id": "a1", "rate": RATE}]},
+    {}
+])
+def testMissingKeysRaiseTheSameError(json):
+
+    with pytest.raises(TypeError) as compiled:
+
+        decodeDTO(RoomDTO, json)
+
+    with pytest.raises(TypeError) as expected:
+
+        reflective(RoomDTO, json)
+
+    assert str(compiled.value) == str(expected.value)
+
+
+def testCoercesScalarFields():
+
+    invoiceable = decodeDTO(InvoiceableDTO, {"rooms": [], "addOns": [], "t": "2.5"}, coerceTypes=True)
+    invoice     = decodeDTO(InvoiceDTO, {**INVOICE, "invoiceNum": "7", "payee": 12}, coerceTypes=True)
+
+    assert invoiceable.t == 2.5
+    assert (invoice.invoiceNum, invoice.payee) == (7, "12")
+    assert decodeDTO(InvoiceableDTO, {"rooms": [], "addOns": [], "t": "2.5"}).t == "2.5"
+
+    with pytest.raises(ValueError):
+
+        decodeDTO(InvoiceableDTO, {"rooms": [], "addOns": [], "t": "soon"}, coerceTypes=True)
@@ -0,0 +1,45 @@
+import json
+import pytest
+from API import InvoicePool, InvoiceError
+
+
+@pytest.fixture(scope="module")
+def pool():
+
+    with InvoicePool(workers=2, chunkSize=3, maxPendingChunks=2) as pool:
+
+        yield pool
+
+
+def testMatchesSerialBuilds(api, pool, invoiceJSON):
+
+    specs = [invoiceJSON(i, rooms=i % 3 + 1, t=i / 4) for i in range(20)]
+
+    specs[4]  = {"invoiceNum": 4}
+    specs[11] = json.dumps(specs[11])
+    specs[17] = "{not json"
+
+    results  = list(pool.buildInvoicesFromJSON(iter(specs)))
+    expected = list(api.buildInvoicesFromJSON(specs))
+
+    assert [type(result) for result in results] == [type(result) for result in expected]
+    assert [result.index for result in results if isinstance(result, InvoiceError)] == [4, 17]
+    assert [result for result in results if not isinstance(result, InvoiceError)] == [
+        result for result in expected if not isinstance(result, InvoiceError)
+    ]
+
+
+def testSubmitBuildsOneInvoice(api, pool, invoiceJSON):
+
+    assert pool.submit(invoiceJSON(7)).result() == api.buildInvoiceFromJSON(invoiceJSON(7))
+
+    with pytest.raises(TypeError):
+
+        pool.submit({"invoiceNum": 8}).result()
+
+
+def testRejectsEmptyChunks():
+
+    with pytest.raises(ValueError, match="chunkSize"):
+
+        InvoicePool(chunkSize=0)
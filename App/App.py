@@ -5,8 +5,9 @@ from Rentables.utils import registerDefaultRates
 from Discounts import registerDefaultDiscounts
 from API import API
 from .utils import (
-    AddOnRepo,
-    RoomRepo
+    makeAddOnRepo,
+    makeRoomRepo,
+    migrateJSONToSqlite
 )
 
 
@@ -18,8 +19,8 @@ api = API()
 registerDefaultRates(api)
 registerDefaultDiscounts(api)
 
-addOnRepo = AddOnRepo(api)
-roomRepo  = RoomRepo(api)
+addOnRepo = makeAddOnRepo(api)
+roomRepo  = makeRoomRepo(api, addOnRepo)
 
 console = Console()
 
@@ -30,6 +31,17 @@ def cli():
     pass
 
 
+@cli.command("migrate")
+def migrate():
+
+    addOnCount, roomCount = migrateJSONToSqlite(api)
+
+    console.print(
+        f"\n[{SUCCESS_COLOUR}][SUCCESS][/{SUCCESS_COLOUR}] " \
+        f"Migrated {addOnCount} Add-On(s) and {roomCount} Room(s) to SQLite"
+    )
+
+
 @cli.group()
 def addOns():
 
@@ -232,10 +244,45 @@ def deleteAddOn():
         console.print(f"\n[{ERROR_COLOUR}][ERROR][/{ERROR_COLOUR}] {e}")
 
 
+def pageOptions(command):
+
+    command = click.option("--after", default=None, help="Only list entries with an id after this one")(command)
+    command = click.option("--offset", type=click.IntRange(min=0), default=0, help="Number of entries to skip")(command)
+    command = click.option("--limit", type=click.IntRange(min=0), default=None, help="Maximum number of entries")(command)
+
+    return command
+
+
+def printNextPage(entries, limit):
+
+    if limit and len(entries) == limit:
+
+        console.print(f"\nMore results may follow, continue with --after {entries[-1]['id']}")
+
+
 @addOns.command("ls")
-def listAddOns():
+@click.option("--rate-type", default=None, help="Only list Add-Ons with this rate type")
+@click.option("--name-prefix", default=None, help="Only list Add-Ons whose name starts with this")
+@pageOptions
+def listAddOns(rate_type, name_prefix, limit, offset, after):
+
+    fields  = ["id", "name", "rateType"]
+    filters = (rate_type, name_prefix, limit, after)
+
+    if all(option is None for option in filters) and offset == 0:
+
+        addOns = addOnRepo.ls(fields=fields)
 
-    addOns = addOnRepo.ls()
+    else:
+
+        addOns = addOnRepo.query(
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            after=after,
+            rateType=rate_type,
+            namePrefix=name_prefix
+        )
 
     if not addOns:
 
@@ -260,13 +307,40 @@ def listAddOns():
     for addOn in addOns:
 
         table.add_row(
-            addOn.id,
-            addOn.name,
-            addOn.rate.name
+            addOn["id"],
+            addOn["name"],
+            addOn["rateType"]
         )
 
     console.print(table)
 
+    printNextPage(addOns, limit)
+
+
+@addOns.command("import")
+@click.argument("source", type=click.File("r"))
+def importAddOns(source):
+
+    try:
+
+        count = addOnRepo.importStream(source)
+
+        console.print(
+            f"\n[{SUCCESS_COLOUR}][SUCCESS][/{SUCCESS_COLOUR}] " \
+            f"Imported {count} Add-On(s)"
+        )
+
+    except ValueError as e:
+
+        console.print(f"\n[{ERROR_COLOUR}][ERROR][/{ERROR_COLOUR}] {e}")
+
+
+@addOns.command("export")
+@click.argument("destination", type=click.File("w"), default="-")
+def exportAddOns(destination):
+
+    destination.writelines(addOnRepo.exportStream())
+
 
 # ============================================================================ #
 
@@ -303,9 +377,9 @@ def newRoom():
     metaRateParams = api.getRateParams(rateType)
     rateParams     = promptParams(metaRateParams)
 
-    addOnsObjs    = addOnRepo.ls()
-    addOnNames    = [addOn.name for addOn in addOnsObjs]
-    addOnNameToAddOn = {addOn.name: addOn for addOn in addOnsObjs}
+    addOnsObjs    = addOnRepo.ls(fields=["id", "name"])
+    addOnNames    = [addOn["name"] for addOn in addOnsObjs]
+    addOnNameToID = {addOn["name"]: addOn["id"] for addOn in addOnsObjs}
 
     addOns = []
     count  = 1
@@ -329,18 +403,8 @@ def newRoom():
                 break
 
             addOnName = click.Choice(addOnNames).convert(addOnName, None, None)
-            addOn     = addOnNameToAddOn[addOnName]
-
-            addOns.append(
-                {
-                    "id": addOn.id,
-                    "name": addOn.name,
-                    "rate": {
-                        "rateType": addOn.rate.name,
-                        "params": addOn.rate.params
-                    }
-                }
-            )
+
+            addOns.append(addOnNameToID[addOnName])
 
             count += 1
 
@@ -377,6 +441,17 @@ def newRoom():
         console.print(f"\n[{ERROR_COLOUR}][ERROR][/{ERROR_COLOUR}] {e}")
 
 
+@rooms.command("migrate-addons")
+def migrateRoomAddOns():
+
+    migrated = roomRepo.migrateAddOnRefs()
+
+    console.print(
+        f"\n[{SUCCESS_COLOUR}][SUCCESS][/{SUCCESS_COLOUR}] " \
+        f"Normalized Add-On references in {migrated} Room(s)"
+    )
+
+
 @rooms.command("delete")
 def deleteRoom():
 
@@ -401,9 +476,30 @@ def deleteRoom():
 
 
 @rooms.command("ls")
-def listRooms():
+@click.option("--rate-type", default=None, help="Only list Rooms with this rate type")
+@click.option("--name-prefix", default=None, help="Only list Rooms whose name starts with this")
+@click.option("--add-on", default=None, help="Only list Rooms supporting the Add-On with this id")
+@pageOptions
+def listRooms(rate_type, name_prefix, add_on, limit, offset, after):
+
+    fields  = ["id", "name", "rateType", "addOns"]
+    filters = (rate_type, name_prefix, add_on, limit, after)
+
+    if all(option is None for option in filters) and offset == 0:
 
-    rooms = roomRepo.ls()
+        rooms = roomRepo.ls(fields=fields)
+
+    else:
+
+        rooms = roomRepo.query(
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            after=after,
+            rateType=rate_type,
+            namePrefix=name_prefix,
+            addOnID=add_on
+        )
 
     if not rooms:
 
@@ -426,17 +522,46 @@ def listRooms():
     table.add_column("Rate")
     table.add_column("Add-Ons")
 
+    addOnNames = {addOn["id"]: addOn["name"] for addOn in addOnRepo.ls(fields=["id", "name"])}
+
     for room in rooms:
 
         table.add_row(
-            room.id,
-            room.name,
-            room.rate.name,
-            ", ".join([addOn.name for addOn in room.addOns])
+            room["id"],
+            room["name"],
+            room["rateType"],
+            ", ".join([addOnNames[addOnID] for addOnID in room["addOns"] if addOnID in addOnNames])
         )
 
     console.print(table)
 
+    printNextPage(rooms, limit)
+
+
+@rooms.command("import")
+@click.argument("source", type=click.File("r"))
+def importRooms(source):
+
+    try:
+
+        count = roomRepo.importStream(source)
+
+        console.print(
+            f"\n[{SUCCESS_COLOUR}][SUCCESS][/{SUCCESS_COLOUR}] " \
+            f"Imported {count} Room(s)"
+        )
+
+    except ValueError as e:
+
+        console.print(f"\n[{ERROR_COLOUR}][ERROR][/{ERROR_COLOUR}] {e}")
+
+
+@rooms.command("export")
+@click.argument("destination", type=click.File("w"), default="-")
+def exportRooms(destination):
+
+    destination.writelines(roomRepo.exportStream())
+
 
 # ============================================================================ #
 
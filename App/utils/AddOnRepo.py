@@ -1,6 +1,10 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Callable, ContextManager, Iterable, Iterator, Any
+from Rentables.utils import thaw
 from .Repo import Repo
-from .Store import Store
+from .Config import makeStore
+from .NDJSON import readNDJSON, writeNDJSON, chunked, firstDuplicate
+from .Projection import Field, LazyEntity, projectStore
+from .StoreIndex import StoreIndex
 
 
 if TYPE_CHECKING:
@@ -8,63 +12,188 @@ if TYPE_CHECKING:
     from API import API
 
 
+ADD_ON_LAYOUT = (
+    ("id",),
+    ("name",),
+    ("rate", "rateType"),
+    ("rate", "params")
+)
+
+ADD_ON_FIELDS: dict[str, Field] = {
+    "id": (("id",), None),
+    "name": (("name",), None),
+    "rateType": (("rate", "rateType"), None),
+    "rateParams": (("rate", "params"), None)
+}
+
+
 class AddOnRepo(Repo):
 
     
     def __init__(self, api: "API"):
 
         self.api   = api
-        self.store = Store("data/addons.json")
+        self.store = makeStore("addons.json", ADD_ON_LAYOUT)
+        self.index = StoreIndex(self.store, ADD_ON_FIELDS, ["rateType"])
+
+        self._built: dict[str, tuple[dict[str, Any], Any]] = {}
+        self.onDelete: list[Callable[[str], Any]]           = []
+
+
+    def _toJSON(self, addOn: Any) -> dict[str, Any]:
+
+        return {
+            "id": addOn.id,
+            "name": addOn.name,
+            "rate": {
+                "rateType": addOn.rate.name,
+                "params": thaw(addOn.rate.params)
+            }
+        }
+
+
+    def _build(self, record: dict[str, Any]) -> Any:
+
+        cached = self._built.get(record["id"])
+
+        if cached is not None and cached[0] == record:
+
+            return cached[1]
+
+        addOn = self.api.buildAddOnFromJSON(record)
+
+        self._built[record["id"]] = (record, addOn)
+
+        return addOn
+
+
+    def ls(self, fields: list[str] | None = None, lazy: bool = False) -> list[Any]:
+
+        if fields is not None:
+
+            return projectStore(self.store, fields, ADD_ON_FIELDS)
+
+        data = self.store.iterRecords()
+
+        if lazy:
+
+            return [LazyEntity(addOn, self._build) for addOn in data]
+
+        return [self._build(addOn) for addOn in data]
+
+
+    def query(
+            self,
+            fields: list[str] | None = None,
+            limit: int | None = None,
+            offset: int = 0,
+            after: str | None = None,
+            rateType: str | None = None,
+            namePrefix: str | None = None
+    ) -> list[Any]:
+
+        objIDs = self.index.select({"rateType": rateType}, namePrefix, limit, offset, after)
+
+        if fields is not None:
+
+            return self.index.fetch(objIDs, fields)
 
+        addOns = self.lookup(objIDs)
 
-    def ls(self) -> list[Any]:
+        return [addOns[objID] for objID in objIDs if objID in addOns]
 
-        data = self.store.load()
 
-        return [self.api.buildAddOnFromJSON(addOn) for addOn in data]
+    def lookup(self, objIDs: Iterable[str]) -> dict[str, Any]:
+
+        records = self.store.getMany(objIDs)
+
+        return {objID: self._build(record) for objID, record in records.items()}
     
 
     def add(self, addOnJSON: dict[str, Any]) -> Any:
 
         addOn = self.api.buildAddOnFromJSON(addOnJSON)
-        data  = self.store.load()
 
-        if any(a["id"] == addOn.id for a in data):
+        with self.store.transaction():
 
-            raise ValueError(f"Add-On {addOn.name} (id: {addOn.id}) already exists")
-        
-        data.append({
-            "id": addOn.id,
-            "name": addOn.name,
-            "rate": {
-                "rateType": addOn.rate.name,
-                "params": addOn.rate.params
-            }
-        })
+            if self.store.contains(addOn.id):
 
-        self.store.save(data)
+                raise ValueError(f"Add-On {addOn.name} (id: {addOn.id}) already exists")
+
+            self.store.put(self._toJSON(addOn))
 
         return addOn
 
     
     def get(self, objID: str) -> Any | None:
 
-        data = self.store.load()
+        addOn = self.store.get(objID)
 
-        for addOn in data:
+        if addOn is None:
 
-            if addOn["id"] == objID:
+            raise ValueError(f"Add-On with id '{objID}' does not exist")
 
-                return self.api.buildAddOnFromJSON(addOn)
-            
-        raise ValueError(f"Add-On with id '{objID}' does not exist")
+        return self._build(addOn)
     
 
     def delete(self, objID: str):
 
-        self.get(objID)
+        with self.store.transaction():
+
+            if not self.store.contains(objID):
+
+                raise ValueError(f"Add-On with id '{objID}' does not exist")
+
+            # Referrers (the room repo) drop their references first, so no
+            # room is left pointing at a deleted add-on.
+            for dropRefs in self.onDelete:
+
+                dropRefs(objID)
+
+            self.store.remove(objID)
+
+
+    def transaction(self) -> ContextManager[Any]:
+
+        return self.store.transaction()
+
+
+    def importStream(self, lines: Iterable[str], chunkSize: int = 1000) -> int:
+
+        count = 0
+
+        with self.store.transaction():
+
+            for chunk in chunked(readNDJSON(lines), chunkSize):
+
+                addOns = []
+
+                for lineNum, addOnJSON in chunk:
+
+                    try:
+
+                        addOns.append(self.api.buildAddOnFromJSON(addOnJSON))
+
+                    except Exception as e:
+
+                        raise ValueError(f"Invalid Add-On on line {lineNum}: {e}") from e
+
+                # putMany would silently keep the last of two rows sharing an id,
+                # so repeats within the chunk are rejected like existing ids.
+                existing  = self.store.existing(addOn.id for addOn in addOns)
+                duplicate = existing[0] if existing else firstDuplicate(addOn.id for addOn in addOns)
+
+                if duplicate is not None:
+
+                    raise ValueError(f"Add-On with id '{duplicate}' already exists")
+
+                self.store.putMany(self._toJSON(addOn) for addOn in addOns)
+
+                count += len(addOns)
+
+        return count
+
 
-        data = self.store.load()
-        data = [addOn for addOn in data if addOn["id"] != objID]
+    def exportStream(self) -> Iterator[str]:
 
-        self.store.save(data)
+        return writeNDJSON(self.store.iterRecords())
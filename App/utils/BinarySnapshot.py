@@ -0,0 +1,269 @@
+from typing import Any, Iterable, Iterator
+from pathlib import Path
+import threading
+import marshal
+import struct
+import os
+
+
+MAGIC          = b"INPYSNAP"
+FORMAT_VERSION = 2
+BLOCK_SIZE     = 4096
+
+Layout = tuple[tuple[str, ...], ...]
+
+_header = struct.Struct("<8sHHqq")
+_length = struct.Struct("<I")
+
+
+def _layoutSpec(layout: Layout) -> dict[str, Any]:
+
+    spec: dict[str, Any] = {}
+
+    for path in layout:
+
+        node = spec
+
+        for key in path[:-1]:
+
+            node = node.setdefault(key, {})
+
+        node[path[-1]] = None
+
+    return spec
+
+
+class BinarySnapshot:
+
+
+    def __init__(self, path: Path, layout: Layout):
+
+        self.path   = path
+        self.layout = layout
+
+        self._spec = _layoutSpec(layout)
+
+
+    def _conforms(self, record: Any, spec: dict[str, Any]) -> bool:
+
+        if not isinstance(record, dict) or record.keys() != spec.keys():
+
+            return False
+
+        return all(
+            sub is None or self._conforms(record[key], sub)
+            for key, sub in spec.items()
+        )
+
+
+    def _flatten(self, record: dict[str, Any]) -> list[Any]:
+
+        values = []
+
+        for path in self.layout:
+
+            value = record
+
+            for key in path:
+
+                value = value[key]
+
+            values.append(value)
+
+        return values
+
+
+    def _unflatten(self, values: Iterator[Any], spec: dict[str, Any]) -> dict[str, Any]:
+
+        return {
+            key: next(values) if sub is None else self._unflatten(values, sub)
+            for key, sub in spec.items()
+        }
+
+
+    def openBlocks(
+            self,
+            stamp: tuple[int, int],
+            columns: list[int] | None = None
+    ) -> Iterator[tuple[list[Any] | None, ...]] | None:
+
+        try:
+
+            file = self.path.open("rb")
+
+        except FileNotFoundError:
+
+            return None
+
+        # The whole snapshot is decoded up front, so a truncated or corrupt
+        # file is rejected here and the caller falls back to the JSON store,
+        # rather than failing partway through iterating it.
+        with file:
+
+            try:
+
+                blocks = self._readBlocks(file, stamp, columns)
+
+            except (struct.error, EOFError, ValueError, TypeError):
+
+                return None
+
+        return iter(blocks) if blocks is not None else None
+
+
+    def _readBlocks(
+            self,
+            file: Any,
+            stamp: tuple[int, int],
+            columns: list[int] | None
+    ) -> list[tuple[list[Any] | None, ...]] | None:
+
+        magic, formatVersion, marshalVersion, mtime, size = _header.unpack(file.read(_header.size))
+
+        if (
+            magic != MAGIC
+            or formatVersion != FORMAT_VERSION
+            or marshalVersion != marshal.version
+            or (mtime, size) != stamp
+        ):
+
+            return None
+
+        (layoutLength,) = _length.unpack(file.read(_length.size))
+
+        if tuple(marshal.loads(file.read(layoutLength))) != self.layout:
+
+            return None
+
+        wanted                                     = set(range(len(self.layout)) if columns is None else columns)
+        blocks: list[tuple[list[Any] | None, ...]] = []
+
+        while True:
+
+            (rows,) = _length.unpack(file.read(_length.size))
+
+            if rows == 0:
+
+                return blocks
+
+            block: list[list[Any] | None] = []
+
+            for index in range(len(self.layout)):
+
+                (length,) = _length.unpack(file.read(_length.size))
+
+                if index not in wanted:
+
+                    file.seek(length, os.SEEK_CUR)
+
+                    block.append(None)
+
+                    continue
+
+                data = file.read(length)
+
+                if len(data) != length:
+
+                    raise EOFError("Truncated snapshot column")
+
+                block.append(marshal.loads(data))
+
+            blocks.append(tuple(block))
+
+
+    def openRecords(self, stamp: tuple[int, int]) -> Iterator[dict[str, Any]] | None:
+
+        blocks = self.openBlocks(stamp)
+
+        if blocks is None:
+
+            return None
+
+        def records() -> Iterator[dict[str, Any]]:
+
+            for columns in blocks:
+
+                for values in zip(*columns):
+
+                    yield self._unflatten(iter(values), self._spec)
+
+        return records()
+
+
+    def tee(self, stamp: tuple[int, int], records: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+
+        # Writes the snapshot as a side effect of a full pass over the records.
+        # The snapshot is only published if the pass completes and every record
+        # matches the layout.
+        temp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        try:
+
+            with temp.open("wb") as file:
+
+                layout = marshal.dumps(self.layout)
+
+                file.write(_header.pack(MAGIC, FORMAT_VERSION, marshal.version, *stamp))
+                file.write(_length.pack(len(layout)))
+                file.write(layout)
+
+                block: list[list[Any]] = []
+                valid                  = True
+
+                for record in records:
+
+                    if valid and self._conforms(record, self._spec):
+
+                        block.append(self._flatten(record))
+
+                        if len(block) == BLOCK_SIZE:
+
+                            self._writeBlock(file, block)
+
+                            block = []
+
+                    else:
+
+                        valid = False
+
+                    yield record
+
+                if not valid:
+
+                    return
+
+                if block:
+
+                    self._writeBlock(file, block)
+
+                file.write(_length.pack(0))
+                file.flush()
+
+                os.fsync(file.fileno())
+
+            os.replace(temp, self.path)
+
+        finally:
+
+            temp.unlink(missing_ok=True)
+
+
+    def _writeBlock(self, file: Any, block: list[list[Any]]):
+
+        # Columns are framed separately so that readers can seek past the ones
+        # a projection does not need.
+        file.write(_length.pack(len(block)))
+
+        for column in zip(*block):
+
+            data = marshal.dumps(list(column))
+
+            file.write(_length.pack(len(data)))
+            file.write(data)
+
+
+    def write(self, stamp: tuple[int, int], records: Iterable[dict[str, Any]]):
+
+        for _ in self.tee(stamp, records):
+
+            pass
@@ -0,0 +1,28 @@
+import os
+from .Store import Store
+from .JournalStore import JournalStore
+from .BinarySnapshot import Layout
+
+
+DATA_DIR      = os.environ.get("INPY_DATA_DIR", "data")
+STORE_BACKEND = os.environ.get("INPY_STORE_BACKEND", "json")
+SQLITE_PATH   = os.environ.get("INPY_SQLITE_PATH", os.path.join(DATA_DIR, "inpy.db"))
+
+BINARY_SNAPSHOT           = os.environ.get("INPY_BINARY_SNAPSHOT", "1") != "0"
+JOURNAL_COMPACT_THRESHOLD = int(os.environ.get("INPY_JOURNAL_COMPACT_THRESHOLD", 1 << 20))
+
+
+def makeStore(fileName: str, layout: Layout | None = None) -> Store:
+
+    filePath = os.path.join(DATA_DIR, fileName)
+    layout   = layout if BINARY_SNAPSHOT else None
+
+    if STORE_BACKEND == "json":
+
+        return Store(filePath, layout)
+
+    if STORE_BACKEND == "journal":
+
+        return JournalStore(filePath, layout, compactThreshold=JOURNAL_COMPACT_THRESHOLD)
+
+    raise ValueError(f"Unknown store backend: {STORE_BACKEND}")
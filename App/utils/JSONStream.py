@@ -0,0 +1,116 @@
+from typing import Any, Iterator, TextIO
+import json
+
+
+_decode = json.JSONDecoder().raw_decode
+
+NUMBER_START = frozenset("-0123456789")
+NUMBER_CHARS = frozenset("0123456789+-.eE")
+
+
+def _skipWhitespace(buffer: str, pos: int) -> int:
+
+    while pos < len(buffer) and buffer[pos] in " \t\r\n":
+
+        pos += 1
+
+    return pos
+
+
+def _mayContinue(buffer: str, start: int, end: int) -> bool:
+
+    # Numbers are the only values without a closing delimiter: "12" may be the
+    # start of "123" and "1." that of "1.5", so a number decoded at the end of
+    # the buffer, or followed by what could extend it, needs more input.
+    return buffer[start] in NUMBER_START and (end == len(buffer) or buffer[end] in NUMBER_CHARS)
+
+
+def iterJSONArray(file: TextIO, chunkSize: int = 1 << 16) -> Iterator[Any]:
+
+    buffer = ""
+    pos    = 0
+    first  = True
+    opened = False
+
+    while True:
+
+        pos = _skipWhitespace(buffer, pos)
+
+        if pos == len(buffer):
+
+            chunk = file.read(chunkSize)
+
+            if not chunk:
+
+                raise ValueError("Unexpected end of JSON array")
+
+            buffer = chunk
+            pos    = 0
+
+            continue
+
+        if not opened:
+
+            if buffer[pos] != "[":
+
+                raise ValueError(f"Expected '[' but found {buffer[pos]!r}")
+
+            opened = True
+            pos   += 1
+
+            continue
+
+        if buffer[pos] == "]":
+
+            return
+
+        if not first:
+
+            if buffer[pos] != ",":
+
+                raise ValueError(f"Expected ',' or ']' but found {buffer[pos]!r}")
+
+            pos += 1
+
+        while True:
+
+            pos = _skipWhitespace(buffer, pos)
+
+            try:
+
+                value, end = _decode(buffer, pos)
+                error      = None
+
+            except json.JSONDecodeError as e:
+
+                error = e
+
+            if error is None and not _mayContinue(buffer, pos, end):
+
+                break
+
+            # The value straddles the end of the buffer. Read at least as
+            # much again so that large records are re-scanned O(log n) times.
+            chunk = file.read(max(chunkSize, len(buffer) - pos))
+
+            if not chunk:
+
+                if error is not None:
+
+                    raise error
+
+                break
+
+            buffer = buffer[pos:] + chunk
+            pos    = 0
+
+        pos = end
+
+        yield value
+
+        first = False
+
+        if pos >= chunkSize:
+
+            buffer = buffer[pos:]
+            pos    = 0
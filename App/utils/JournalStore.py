@@ -0,0 +1,334 @@
+from typing import Any, Iterable, Iterator
+from contextlib import nullcontext
+from pathlib import Path
+import threading
+import json
+import os
+from .Store import Store, fcntl
+from .JSONStream import iterJSONArray
+from .BinarySnapshot import Layout
+
+
+def applyEntry(records: dict[str, dict[str, Any]], entry: dict[str, Any]):
+
+    if entry["op"] == "put":
+
+        record = entry["record"]
+
+        records[record["id"]] = record
+
+    elif entry["op"] == "remove":
+
+        records.pop(entry["id"], None)
+
+    else:
+
+        raise ValueError(f"Unknown journal operation: {entry['op']}")
+
+
+def readStore(filePath: str) -> list[dict[str, Any]]:
+
+    # Reads a JSON or journal store without opening it as one, which would
+    # create its lock and journal files; the lock is only shared if a writer
+    # already created it.
+    file     = Path(filePath)
+    journal  = Path(f"{filePath}.journal")
+    lockFile = Path(f"{filePath}.lock")
+    records  = {}
+
+    with (lockFile.open() if lockFile.exists() else nullcontext()) as lock:
+
+        if lock is not None and fcntl is not None:
+
+            fcntl.flock(lock.fileno(), fcntl.LOCK_SH)
+
+        if file.exists():
+
+            with file.open() as source:
+
+                records = {record["id"]: record for record in iterJSONArray(source)}
+
+        if journal.exists():
+
+            with journal.open("rb") as source:
+
+                for line in source:
+
+                    if not line.endswith(b"\n"):
+
+                        break
+
+                    applyEntry(records, json.loads(line))
+
+    return list(records.values())
+
+
+class JournalStore(Store):
+
+
+    def __init__(
+            self,
+            filePath: str,
+            layout: Layout | None = None,
+            compactThreshold: int = 1 << 20,
+            compactInBackground: bool = True
+    ):
+
+        super().__init__(filePath, layout)
+
+        self.journal             = Path(f"{filePath}.journal")
+        self.compactThreshold    = compactThreshold
+        self.compactInBackground = compactInBackground
+
+        self.journal.touch(exist_ok=True)
+
+        self._journalOffset                      = 0
+        self._pending: list[bytes]               = []
+        self._compactor: threading.Thread | None = None
+
+
+    def _refresh(self):
+
+        stamp = self._statStamp()
+
+        if stamp != self._stamp:
+
+            self._records       = {record["id"]: record for record in self._snapshotRecords(stamp)}
+            self._stamp         = stamp
+            self._journalOffset = 0
+
+        if self.journal.stat().st_size < self._journalOffset:
+
+            self._stamp = None
+
+            return self._refresh()
+
+        self._replay()
+
+
+    def _isFresh(self) -> bool:
+
+        return super()._isFresh() and self.journal.stat().st_size == self._journalOffset
+
+
+    def _openRecords(self) -> Iterator[dict[str, Any]]:
+
+        overrides: dict[str, dict[str, Any] | None] = {}
+
+        with self.journal.open("rb") as journal:
+
+            for line in journal:
+
+                if not line.endswith(b"\n"):
+
+                    break
+
+                entry = json.loads(line)
+
+                if entry["op"] == "put":
+
+                    overrides[entry["record"]["id"]] = entry["record"]
+
+                else:
+
+                    overrides[entry["id"]] = None
+
+        snapshot = super()._openRecords()
+
+        def stream() -> Iterator[dict[str, Any]]:
+
+            for record in snapshot:
+
+                if record["id"] not in overrides:
+
+                    yield record
+
+                elif (override := overrides.pop(record["id"])) is not None:
+
+                    yield override
+
+            for override in overrides.values():
+
+                if override is not None:
+
+                    yield override
+
+        return stream()
+
+
+    def version(self) -> tuple[int, ...] | None:
+
+        with self._fileLock(exclusive=False):
+
+            version = super().version()
+
+            if version is None:
+
+                return None
+
+            return (*version, self.journal.stat().st_size)
+
+
+    def iterBlocks(self, columns: list[int] | None = None) -> Iterator[tuple[list[Any] | None, ...]] | None:
+
+        with self._fileLock(exclusive=False):
+
+            if self.journal.stat().st_size > 0:
+
+                return None
+
+            return super().iterBlocks(columns)
+
+
+    def _replay(self):
+
+        with self.journal.open("rb") as journal:
+
+            journal.seek(self._journalOffset)
+
+            for line in journal:
+
+                if not line.endswith(b"\n"):
+
+                    break
+
+                self._apply(json.loads(line))
+
+                self._journalOffset += len(line)
+
+
+    def _apply(self, entry: dict[str, Any]):
+
+        applyEntry(self._records, entry)
+
+
+    def _append(self, entry: dict[str, Any]):
+
+        with self.transaction():
+
+            self._apply(entry)
+
+            self._pending.append((json.dumps(entry) + "\n").encode())
+
+            self._dirty = True
+
+            if entry["op"] == "put":
+
+                self._changed(entry["record"]["id"], entry["record"])
+
+            else:
+
+                self._changed(entry["id"], None)
+
+
+    def _commit(self):
+
+        if not self._pending:
+
+            return
+
+        lines = b"".join(self._pending)
+
+        # Everything past the replayed offset is a torn entry, and entries
+        # written after a torn one could never be replayed; so new entries
+        # overwrite it, and a failed write is cut off again.
+        try:
+
+            with self.journal.open("r+b") as journal:
+
+                journal.seek(self._journalOffset)
+                journal.write(lines)
+                journal.truncate()
+                journal.flush()
+
+                os.fsync(journal.fileno())
+
+        except BaseException:
+
+            os.truncate(self.journal, self._journalOffset)
+
+            raise
+
+        self._pending        = []
+        self._journalOffset += len(lines)
+        self._dirty          = False
+
+        if self._journalOffset > self.compactThreshold:
+
+            self._scheduleCompaction()
+
+
+    def _rollback(self):
+
+        self._pending = []
+
+        super()._rollback()
+
+
+    def _scheduleCompaction(self):
+
+        if not self.compactInBackground:
+
+            self.compact()
+
+            return
+
+        if self._compactor is not None and self._compactor.is_alive():
+
+            return
+
+        self._compactor = threading.Thread(target=self.compact, name=f"compact:{self.file.name}")
+        self._compactor.start()
+
+
+    def _write(self):
+
+        super()._write()
+
+        self.journal.write_bytes(b"")
+
+        self._pending       = []
+        self._journalOffset = 0
+
+
+    def compact(self):
+
+        # Replaying the journal is idempotent, so a crash between the snapshot
+        # write and the journal truncation leaves the store consistent.
+        with self.transaction():
+
+            if self._journalOffset == 0 and not self._pending:
+
+                return
+
+            self._write()
+
+
+    def put(self, record: dict[str, Any]):
+
+        self._append({"op": "put", "record": record})
+
+
+    def putMany(self, records: Iterable[dict[str, Any]]):
+
+        with self.transaction():
+
+            for record in records:
+
+                self._append({"op": "put", "record": record})
+
+
+    def remove(self, recordID: str):
+
+        self._append({"op": "remove", "id": recordID})
+
+
+    def save(self, data: list[dict[str, Any]]):
+
+        with self.transaction():
+
+            self._records = {record["id"]: record for record in data}
+            self._changes = None
+            self._dirty   = True
+
+            self._write()
@@ -0,0 +1,55 @@
+from typing import Any, Iterable, Iterator
+from itertools import islice
+import json
+
+
+def readNDJSON(lines: Iterable[str]) -> Iterator[tuple[int, dict[str, Any]]]:
+
+    for lineNum, line in enumerate(lines, start=1):
+
+        line = line.strip()
+
+        if not line:
+
+            continue
+
+        try:
+
+            yield lineNum, json.loads(line)
+
+        except json.JSONDecodeError as e:
+
+            raise ValueError(f"Malformed JSON on line {lineNum}: {e}") from e
+
+
+def writeNDJSON(records: Iterable[dict[str, Any]]) -> Iterator[str]:
+
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    for record in records:
+
+        yield encode(record) + "\n"
+
+
+def chunked(iterable: Iterable[Any], chunkSize: int) -> Iterator[list[Any]]:
+
+    iterator = iter(iterable)
+
+    while chunk := list(islice(iterator, chunkSize)):
+
+        yield chunk
+
+
+def firstDuplicate(recordIDs: Iterable[str]) -> str | None:
+
+    seen = set()
+
+    for recordID in recordIDs:
+
+        if recordID in seen:
+
+            return recordID
+
+        seen.add(recordID)
+
+    return None
@@ -0,0 +1,126 @@
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+
+if TYPE_CHECKING:
+
+    from .Store import Store
+
+
+# A field is a path into the stored record plus an optional transform, which
+# maps a whole column of values so it can run once per snapshot block.
+Field = tuple[tuple[str, ...], Callable[[list[Any]], list[Any]] | None]
+
+
+def _select(
+        fields: list[str],
+        spec: dict[str, Field]
+) -> list[tuple[str, tuple[str, ...], Callable[[list[Any]], list[Any]] | None]]:
+
+    unknown = [field for field in fields if field not in spec]
+
+    if unknown:
+
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+
+    return [(field, *spec[field]) for field in fields]
+
+
+def _extract(record: dict[str, Any], path: tuple[str, ...]) -> Any:
+
+    for key in path:
+
+        record = record[key]
+
+    return record
+
+
+def project(
+        records: Iterable[dict[str, Any]],
+        fields: list[str],
+        spec: dict[str, Field]
+) -> list[dict[str, Any]]:
+
+    selected = _select(fields, spec)
+
+    return [
+        {
+            field: _extract(record, path) if post is None else post([_extract(record, path)])[0]
+            for field, path, post in selected
+        }
+        for record in records
+    ]
+
+
+def projectBlocks(
+        blocks: Iterator[tuple[list[Any] | None, ...]],
+        layout: tuple[tuple[str, ...], ...],
+        fields: list[str],
+        spec: dict[str, Field]
+) -> list[dict[str, Any]]:
+
+    selected = [(field, layout.index(path), post) for field, path, post in _select(fields, spec)]
+    names    = [field for field, _, _ in selected]
+    results  = []
+
+    for columns in blocks:
+
+        values = [
+            columns[index] if post is None else post(columns[index])
+            for _, index, post in selected
+        ]
+
+        results.extend(dict(zip(names, row)) for row in zip(*values))
+
+    return results
+
+
+def projectStore(store: "Store", fields: list[str], spec: dict[str, Field]) -> list[dict[str, Any]]:
+
+    selected = _select(fields, spec)
+    blocks   = None
+
+    if store.snapshot is not None:
+
+        blocks = store.iterBlocks([store.snapshot.layout.index(path) for _, path, _ in selected])
+
+    if blocks is None:
+
+        return project(store.iterRecords(), fields, spec)
+
+    return projectBlocks(blocks, store.snapshot.layout, fields, spec)
+
+
+# Stands in for a Room or Add-On: id and name come straight from the stored
+# record, anything else builds the full object on first access.
+class LazyEntity:
+
+
+    __slots__ = ("id", "name", "_record", "_builder", "_entity")
+
+
+    def __init__(self, record: dict[str, Any], builder: Callable[[dict[str, Any]], Any]):
+
+        self.id       = record["id"]
+        self.name     = record["name"]
+        self._record  = record
+        self._builder = builder
+        self._entity  = None
+
+
+    def resolve(self) -> Any:
+
+        if self._entity is None:
+
+            self._entity = self._builder(self._record)
+
+        return self._entity
+
+
+    def __getattr__(self, attr: str) -> Any:
+
+        return getattr(self.resolve(), attr)
+
+
+    def __repr__(self) -> str:
+
+        return f"LazyEntity(id={self.id!r}, name={self.name!r})"
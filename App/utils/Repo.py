@@ -1,12 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import ContextManager, Iterable, Iterator, Optional, List, Any
 
 
 class Repo(ABC):
 
 
     @abstractmethod
-    def ls(self) -> List[Any]:
+    def ls(self, fields: Optional[List[str]] = None, lazy: bool = False) -> List[Any]:
+
+        pass
+
+
+    @abstractmethod
+    def query(
+            self,
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            offset: int = 0,
+            after: Optional[str] = None,
+            **filters: Any
+    ) -> List[Any]:
 
         pass
 
@@ -27,3 +40,21 @@ class Repo(ABC):
     def delete(self, objID: str):
 
         pass
+
+
+    @abstractmethod
+    def transaction(self) -> ContextManager[Any]:
+
+        pass
+
+
+    @abstractmethod
+    def importStream(self, lines: Iterable[str], chunkSize: int = 1000) -> int:
+
+        pass
+
+
+    @abstractmethod
+    def exportStream(self) -> Iterator[str]:
+
+        pass
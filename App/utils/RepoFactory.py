@@ -0,0 +1,64 @@
+from typing import TYPE_CHECKING
+import os
+from . import Config
+from .Repo import Repo
+from .JournalStore import readStore
+from .AddOnRepo import AddOnRepo
+from .RoomRepo import RoomRepo
+from .RoomRepoMixin import addOnIDs
+from .SqliteAddOnRepo import SqliteAddOnRepo
+from .SqliteRoomRepo import SqliteRoomRepo
+
+
+if TYPE_CHECKING:
+
+    from API import API
+
+
+def makeAddOnRepo(api: "API") -> Repo:
+
+    if Config.STORE_BACKEND == "sqlite":
+
+        return SqliteAddOnRepo(api, Config.SQLITE_PATH)
+
+    return AddOnRepo(api)
+
+
+def makeRoomRepo(api: "API", addOnRepo: Repo) -> Repo:
+
+    if Config.STORE_BACKEND == "sqlite":
+
+        return SqliteRoomRepo(api, Config.SQLITE_PATH, addOnRepo)
+
+    return RoomRepo(api, addOnRepo)
+
+
+def migrateJSONToSqlite(api: "API") -> tuple[int, int]:
+
+    addOns = readStore(os.path.join(Config.DATA_DIR, "addons.json"))
+    rooms  = readStore(os.path.join(Config.DATA_DIR, "rooms.json"))
+
+    known = {addOn["id"] for addOn in addOns}
+
+    for room in rooms:
+
+        for addOn in room["addOns"]:
+
+            if isinstance(addOn, dict) and addOn["id"] not in known:
+
+                addOns.append(addOn)
+                known.add(addOn["id"])
+
+    built = {addOn["id"]: api.buildAddOnFromJSON(addOn) for addOn in addOns}
+
+    for room in rooms:
+
+        api.buildRoomFromJSON({**room, "addOns": addOnIDs(room["addOns"])}, addOns=built)
+
+    addOnRepo = SqliteAddOnRepo(api, Config.SQLITE_PATH)
+
+    addOnRepo.importRecords(addOns)
+
+    SqliteRoomRepo(api, Config.SQLITE_PATH, addOnRepo).importRecords(rooms)
+
+    return len(addOns), len(rooms)
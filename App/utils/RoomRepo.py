@@ -1,6 +1,12 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, ContextManager, Iterator, Any
+from itertools import chain
+from Rentables.utils import thaw
 from .Repo import Repo
-from .Store import Store
+from .Config import makeStore
+from .NDJSON import writeNDJSON
+from .Projection import Field, LazyEntity, projectStore
+from .StoreIndex import StoreIndex
+from .RoomRepoMixin import RoomRepoMixin, addOnIDs
 
 
 if TYPE_CHECKING:
@@ -8,76 +14,169 @@ if TYPE_CHECKING:
     from API import API
 
 
-class RoomRepo(Repo):
+def addOnIDColumn(column: list[list[Any]]) -> list[list[str]]:
 
+    if set(map(type, chain.from_iterable(column))) <= {str}:
 
-    def __init__(self, api: "API"):
+        return column
 
-        self.api   = api
-        self.store = Store("data/rooms.json")
+    return [addOnIDs(addOns) for addOns in column]
 
 
-    def ls(self) -> list[Any]:
+ROOM_LAYOUT = (
+    ("id",),
+    ("name",),
+    ("rate", "rateType"),
+    ("rate", "params"),
+    ("addOns",)
+)
 
-        data = self.store.load()
+ROOM_FIELDS: dict[str, Field] = {
+    "id": (("id",), None),
+    "name": (("name",), None),
+    "rateType": (("rate", "rateType"), None),
+    "rateParams": (("rate", "params"), None),
+    "addOns": (("addOns",), addOnIDColumn)
+}
 
-        return [self.api.buildRoomFromJSON(room) for room in data]
+
+class RoomRepo(RoomRepoMixin, Repo):
+
+
+    def __init__(self, api: "API", addOnRepo: Repo):
+
+        self.api       = api
+        self.addOnRepo = addOnRepo
+        self.store     = makeStore("rooms.json", ROOM_LAYOUT)
+        self.index     = StoreIndex(self.store, ROOM_FIELDS, ["rateType", "addOns"])
+
+        addOnRepo.onDelete.append(self.dropAddOnRefs)
+
+
+    def _toJSON(self, room: Any) -> dict[str, Any]:
+
+        return {
+            "id": room.id,
+            "name": room.name,
+            "rate": {
+                "rateType": room.rate.name,
+                "params": thaw(room.rate.params)
+            },
+            "addOns": [addOn.id for addOn in room.addOns]
+        }
+
+
+    def ls(self, fields: list[str] | None = None, lazy: bool = False) -> list[Any]:
+
+        if fields is not None:
+
+            return projectStore(self.store, fields, ROOM_FIELDS)
+
+        data = self.store.iterRecords()
+
+        if lazy:
+
+            return [LazyEntity(room, self._hydrate) for room in data]
+
+        addOns = {addOn.id: addOn for addOn in self.addOnRepo.ls()}
+
+        return [self._build(room, addOns) for room in data]
+    
+
+    def query(
+            self,
+            fields: list[str] | None = None,
+            limit: int | None = None,
+            offset: int = 0,
+            after: str | None = None,
+            rateType: str | None = None,
+            namePrefix: str | None = None,
+            addOnID: str | None = None
+    ) -> list[Any]:
+
+        objIDs = self.index.select({"rateType": rateType, "addOns": addOnID}, namePrefix, limit, offset, after)
+
+        if fields is not None:
+
+            return self.index.fetch(objIDs, fields)
+
+        records = self.store.getMany(objIDs)
+        records = [records[objID] for objID in objIDs if objID in records]
+        addOns  = self.addOnRepo.lookup(chain.from_iterable(addOnIDs(record["addOns"]) for record in records))
+
+        return [self._build(record, addOns) for record in records]
     
 
     def add(self, roomJSON: dict[str, Any]) -> Any:
 
-        room = self.api.buildRoomFromJSON(roomJSON)
-        data = self.store.load()
-
-        if any(r["id"] == room.id for r in data):
-
-            raise ValueError(f"Room {room} (id: {room.id}) already exists")
-        
-        data.append(
-            {
-                "id": room.id,
-                "name": room.name,
-                "rate": {
-                    "rateType": room.rate.name,
-                    "params": room.rate.params
-                },
-                "addOns": [
-                    {
-                        "id": addOn.id,
-                        "name": addOn.name,
-                        "rate": {
-                            "rateType": addOn.rate.name,
-                            "params": addOn.rate.params
-                        }
-                    }
-                    for addOn in room.addOns
-                ]
-            }
-        )
-
-        self.store.save(data)
+        addOns = self.addOnRepo.lookup(addOnIDs(roomJSON.get("addOns", [])))
+        room   = self._buildNew(roomJSON, addOns)
+
+        with self.store.transaction():
+
+            if self.store.contains(room.id):
+
+                raise ValueError(f"Room {room} (id: {room.id}) already exists")
+
+            self.store.put(self._toJSON(room))
 
         return room
     
 
     def get(self, objID: str) -> Any | None:
 
-        data = self.store.load()
+        room = self.store.get(objID)
 
-        for room in data:
+        if room is None:
 
-            if room["id"] == objID:
+            raise ValueError(f"Room with id '{objID}' does not exist")
 
-                return self.api.buildRoomFromJSON(room)
-            
-        raise ValueError(f"Room with id '{objID}' does not exist")
+        return self._hydrate(room)
     
 
     def delete(self, objID: str):
 
-        self.get(objID)
+        with self.store.transaction():
+
+            if not self.store.contains(objID):
+
+                raise ValueError(f"Room with id '{objID}' does not exist")
+
+            self.store.remove(objID)
+
+
+    def transaction(self) -> ContextManager[Any]:
+
+        return self.store.transaction()
+
+
+    def _records(self) -> list[dict[str, Any]]:
+
+        return self.store.load()
+
+
+    def _referencing(self, addOnID: str) -> list[dict[str, Any]]:
+
+        return list(self.store.getMany(self.index.select({"addOns": addOnID})).values())
+
+
+    def _existingIDs(self, roomIDs: list[str]) -> list[str]:
+
+        return self.store.existing(roomIDs)
+
+
+    def _insert(self, rooms: list[Any]):
+
+        self.store.putMany(self._toJSON(room) for room in rooms)
+
+
+    def _setAddOns(self, refs: dict[str, list[str]]):
+
+        rooms = self.store.getMany(refs)
+
+        self.store.putMany({**rooms[roomID], "addOns": addOns} for roomID, addOns in refs.items())
+
 
-        data = self.store.load()
-        data = [room for room in data if room["id"] != objID]
+    def exportStream(self) -> Iterator[str]:
 
-        self.store.save(data)
+        return writeNDJSON(self.store.iterRecords())
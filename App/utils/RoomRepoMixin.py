@@ -0,0 +1,165 @@
+from typing import TYPE_CHECKING, Iterable, Any
+from abc import abstractmethod
+from .Repo import Repo
+from .NDJSON import readNDJSON, chunked, firstDuplicate
+
+
+if TYPE_CHECKING:
+
+    from API import API
+
+
+def addOnIDs(addOns: list[Any]) -> list[str]:
+
+    # Rooms written before add-ons were normalized embed full add-on records.
+    return [addOn["id"] if isinstance(addOn, dict) else addOn for addOn in addOns]
+
+
+# The room logic shared by the JSON and SQLite room repos. Rooms store add-on
+# ids, which are resolved against the add-on repo when rooms are built; each
+# backend only supplies how records are read and written.
+class RoomRepoMixin:
+
+
+    api: "API"
+    addOnRepo: Repo
+
+
+    @abstractmethod
+    def _records(self) -> list[dict[str, Any]]:
+
+        pass
+
+
+    @abstractmethod
+    def _referencing(self, addOnID: str) -> list[dict[str, Any]]:
+
+        pass
+
+
+    @abstractmethod
+    def _existingIDs(self, roomIDs: list[str]) -> list[str]:
+
+        pass
+
+
+    @abstractmethod
+    def _insert(self, rooms: list[Any]):
+
+        pass
+
+
+    @abstractmethod
+    def _setAddOns(self, refs: dict[str, list[str]]):
+
+        pass
+
+
+    def _build(self, record: dict[str, Any], addOns: dict[str, Any]) -> Any:
+
+        # References to add-ons that no longer exist are dropped, so a room
+        # stays readable whatever happened to its add-ons.
+        refs = [addOnID for addOnID in addOnIDs(record["addOns"]) if addOnID in addOns]
+
+        return self.api.buildRoomFromJSON({**record, "addOns": refs}, addOns=addOns)
+
+
+    def _buildNew(self, roomJSON: dict[str, Any], addOns: dict[str, Any]) -> Any:
+
+        refs = addOnIDs(roomJSON.get("addOns", []))
+
+        for addOnID in refs:
+
+            if addOnID not in addOns:
+
+                raise ValueError(f"Add-On with id '{addOnID}' does not exist")
+
+        return self.api.buildRoomFromJSON({**roomJSON, "addOns": refs}, addOns=addOns)
+
+
+    def _hydrate(self, record: dict[str, Any]) -> Any:
+
+        return self._build(record, self.addOnRepo.lookup(addOnIDs(record["addOns"])))
+
+
+    def dropAddOnRefs(self, addOnID: str) -> int:
+
+        with self.transaction():
+
+            rooms = self._referencing(addOnID)
+
+            self._setAddOns({
+                room["id"]: [ref for ref in addOnIDs(room["addOns"]) if ref != addOnID]
+                for room in rooms
+            })
+
+        return len(rooms)
+
+
+    def importStream(self, lines: Iterable[str], chunkSize: int = 1000) -> int:
+
+        count  = 0
+        addOns = {addOn.id: addOn for addOn in self.addOnRepo.ls()}
+
+        with self.transaction():
+
+            for chunk in chunked(readNDJSON(lines), chunkSize):
+
+                rooms = []
+
+                for lineNum, roomJSON in chunk:
+
+                    try:
+
+                        rooms.append(self._buildNew(roomJSON, addOns))
+
+                    except Exception as e:
+
+                        raise ValueError(f"Invalid Room on line {lineNum}: {e}") from e
+
+                # Writes would silently keep the last of two rows sharing an
+                # id, so repeats within the chunk are rejected like existing ids.
+                roomIDs   = [room.id for room in rooms]
+                existing  = self._existingIDs(roomIDs)
+                duplicate = existing[0] if existing else firstDuplicate(roomIDs)
+
+                if duplicate is not None:
+
+                    raise ValueError(f"Room with id '{duplicate}' already exists")
+
+                self._insert(rooms)
+
+                count += len(rooms)
+
+        return count
+
+
+    def migrateAddOnRefs(self) -> int:
+
+        refs: dict[str, list[str]] = {}
+
+        with self.addOnRepo.transaction(), self.transaction():
+
+            for room in self._records():
+
+                embedded = [addOn for addOn in room["addOns"] if isinstance(addOn, dict)]
+
+                if not embedded:
+
+                    continue
+
+                known = self.addOnRepo.lookup(addOn["id"] for addOn in embedded)
+
+                for addOn in embedded:
+
+                    if addOn["id"] not in known:
+
+                        self.addOnRepo.add(addOn)
+
+                        known[addOn["id"]] = addOn
+
+                refs[room["id"]] = addOnIDs(room["addOns"])
+
+            self._setAddOns(refs)
+
+        return len(refs)
@@ -0,0 +1,256 @@
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+import sqlite3
+import json
+from Rentables.utils import thaw
+from .SqliteRepo import SqliteRepo
+from .NDJSON import readNDJSON, writeNDJSON, chunked, firstDuplicate
+from .Projection import LazyEntity
+
+
+if TYPE_CHECKING:
+
+    from API import API
+
+
+ADD_ON_COLUMNS = {
+    "id": None,
+    "name": None,
+    "rateType": None,
+    "rateParams": json.loads
+}
+
+
+class SqliteAddOnRepo(SqliteRepo):
+
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS addons (
+            id         TEXT PRIMARY KEY,
+            name       TEXT NOT NULL,
+            rateType   TEXT NOT NULL,
+            rateParams TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS addons_name ON addons (name);
+        CREATE INDEX IF NOT EXISTS addons_rateType ON addons (rateType);
+    """
+
+
+    def __init__(self, api: "API", dbPath: str):
+
+        super().__init__(api, dbPath)
+
+        self._built: dict[str, tuple[tuple[Any, ...], Any]] = {}
+        self.onDelete: list[Callable[[str], Any]]            = []
+
+
+    def _rowToJSON(self, row: tuple[Any, ...]) -> dict[str, Any]:
+
+        id, name, rateType, rateParams = row
+
+        return {
+            "id": id,
+            "name": name,
+            "rate": {
+                "rateType": rateType,
+                "params": json.loads(rateParams)
+            }
+        }
+
+
+    def _toRow(self, addOn: Any) -> tuple[Any, ...]:
+
+        return (addOn.id, addOn.name, addOn.rate.name, json.dumps(thaw(addOn.rate.params)))
+
+
+    def _build(self, row: tuple[Any, ...]) -> Any:
+
+        cached = self._built.get(row[0])
+
+        if cached is not None and cached[0] == row:
+
+            return cached[1]
+
+        addOn = self.api.buildAddOnFromJSON(self._rowToJSON(row))
+
+        self._built[row[0]] = (row, addOn)
+
+        return addOn
+
+
+    def ls(self, fields: list[str] | None = None, lazy: bool = False) -> list[Any]:
+
+        if fields is not None:
+
+            return self._project("addons", fields, ADD_ON_COLUMNS)
+
+        rows = self._execute("SELECT id, name, rateType, rateParams FROM addons ORDER BY rowid")
+
+        if lazy:
+
+            return [LazyEntity({"id": row[0], "name": row[1]}, lambda _, row=row: self._build(row)) for row in rows]
+
+        return [self._build(row) for row in rows]
+
+
+    def query(
+            self,
+            fields: list[str] | None = None,
+            limit: int | None = None,
+            offset: int = 0,
+            after: str | None = None,
+            rateType: str | None = None,
+            namePrefix: str | None = None
+    ) -> list[Any]:
+
+        filters = []
+
+        if rateType is not None:
+
+            filters.append(("rateType = ?", (rateType,)))
+
+        if namePrefix is not None:
+
+            filters.append(self._prefixFilter(namePrefix))
+
+        if fields is not None:
+
+            self._checkFields(fields, ADD_ON_COLUMNS)
+
+            rows = self._page("addons", fields, filters, limit, offset, after)
+
+            return self._decodeRows(fields, ADD_ON_COLUMNS, rows)
+
+        rows = self._page("addons", list(ADD_ON_COLUMNS), filters, limit, offset, after)
+
+        return [self._build(row) for row in rows]
+
+
+    def lookup(self, objIDs: Iterable[str]) -> dict[str, Any]:
+
+        objIDs = list(dict.fromkeys(objIDs))
+        addOns = {}
+
+        for chunk in chunked(objIDs, 500):
+
+            rows = self._execute(
+                f"SELECT id, name, rateType, rateParams FROM addons WHERE id IN ({', '.join('?' * len(chunk))})",
+                tuple(chunk)
+            )
+
+            for row in rows:
+
+                addOns[row[0]] = self._build(row)
+
+        return addOns
+
+
+    def add(self, addOnJSON: dict[str, Any]) -> Any:
+
+        addOn = self.api.buildAddOnFromJSON(addOnJSON)
+
+        try:
+
+            self._execute(
+                "INSERT INTO addons (id, name, rateType, rateParams) VALUES (?, ?, ?, ?)",
+                self._toRow(addOn)
+            )
+
+        except sqlite3.IntegrityError as e:
+
+            raise ValueError(f"Add-On {addOn.name} (id: {addOn.id}) already exists") from e
+
+        return addOn
+
+
+    def get(self, objID: str) -> Any | None:
+
+        row = self._execute(
+            "SELECT id, name, rateType, rateParams FROM addons WHERE id = ?",
+            (objID,)
+        ).fetchone()
+
+        if row is None:
+
+            raise ValueError(f"Add-On with id '{objID}' does not exist")
+
+        return self._build(row)
+
+
+    def delete(self, objID: str):
+
+        with self.transaction():
+
+            # Referrers (the room repo) drop their references in the same
+            # transaction, so no room is left pointing at a deleted add-on.
+            for dropRefs in self.onDelete:
+
+                dropRefs(objID)
+
+            if self._execute("DELETE FROM addons WHERE id = ?", (objID,)).rowcount == 0:
+
+                raise ValueError(f"Add-On with id '{objID}' does not exist")
+
+
+    def importRecords(self, records: list[dict[str, Any]]):
+
+        with self.transaction():
+
+            self.db.executemany(
+                "INSERT OR REPLACE INTO addons (id, name, rateType, rateParams) VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        record["id"],
+                        record["name"],
+                        record["rate"]["rateType"],
+                        json.dumps(record["rate"]["params"])
+                    )
+                    for record in records
+                )
+            )
+
+
+    def importStream(self, lines: Iterable[str], chunkSize: int = 1000) -> int:
+
+        count = 0
+
+        with self.transaction():
+
+            for chunk in chunked(readNDJSON(lines), chunkSize):
+
+                rows = []
+
+                for lineNum, addOnJSON in chunk:
+
+                    try:
+
+                        rows.append(self._toRow(self.api.buildAddOnFromJSON(addOnJSON)))
+
+                    except Exception as e:
+
+                        raise ValueError(f"Invalid Add-On on line {lineNum}: {e}") from e
+
+                # Rows are checked up front so a repeated or existing id is
+                # reported the same way as by the JSON-backed repo.
+                ids       = [row[0] for row in rows]
+                existing  = self._existing("addons", ids)
+                duplicate = existing[0] if existing else firstDuplicate(ids)
+
+                if duplicate is not None:
+
+                    raise ValueError(f"Add-On with id '{duplicate}' already exists")
+
+                self.db.executemany(
+                    "INSERT INTO addons (id, name, rateType, rateParams) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+
+                count += len(rows)
+
+        return count
+
+
+    def exportStream(self) -> Iterator[str]:
+
+        rows = self._execute("SELECT id, name, rateType, rateParams FROM addons ORDER BY rowid")
+
+        return writeNDJSON(self._rowToJSON(row) for row in rows)
@@ -0,0 +1,166 @@
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Any
+from contextlib import contextmanager
+from pathlib import Path
+import sqlite3
+from .Repo import Repo
+
+
+if TYPE_CHECKING:
+
+    from API import API
+
+
+class SqliteRepo(Repo):
+
+
+    SCHEMA: str = ""
+
+    # Repos over the same database share a connection so that a transaction
+    # opened through one of them also covers writes made through the other.
+    _connections: dict[str, sqlite3.Connection] = {}
+
+
+    def __init__(self, api: "API", dbPath: str):
+
+        self.api = api
+        self.db  = self._connect(dbPath)
+
+        self.db.executescript(self.SCHEMA)
+
+
+    @classmethod
+    def _connect(cls, dbPath: str) -> sqlite3.Connection:
+
+        key = str(Path(dbPath).resolve())
+
+        if key not in cls._connections:
+
+            Path(dbPath).parent.mkdir(parents=True, exist_ok=True)
+
+            db = sqlite3.connect(dbPath, isolation_level=None)
+
+            db.execute("PRAGMA journal_mode=WAL")
+
+            cls._connections[key] = db
+
+        return cls._connections[key]
+
+
+    def _execute(self, sql: str, params: tuple[Any, ...] = ()) -> sqlite3.Cursor:
+
+        return self.db.execute(sql, params)
+
+
+    def _decodeRows(
+            self,
+            fields: list[str],
+            decoders: dict[str, Callable[[Any], Any] | None],
+            rows: Iterable[tuple[Any, ...]]
+    ) -> list[dict[str, Any]]:
+
+        columns = [(field, decoders[field]) for field in fields]
+
+        return [
+            {field: decode(value) if decode else value for (field, decode), value in zip(columns, row)}
+            for row in rows
+        ]
+
+
+    def _checkFields(self, fields: list[str], decoders: dict[str, Callable[[Any], Any] | None]):
+
+        unknown = [field for field in fields if field not in decoders]
+
+        if unknown:
+
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+
+
+    def _project(
+            self,
+            table: str,
+            fields: list[str],
+            decoders: dict[str, Callable[[Any], Any] | None]
+    ) -> list[dict[str, Any]]:
+
+        self._checkFields(fields, decoders)
+
+        rows = self._execute(f"SELECT {', '.join(fields)} FROM {table} ORDER BY rowid")
+
+        return self._decodeRows(fields, decoders, rows)
+
+
+    def _page(
+            self,
+            table: str,
+            columns: list[str],
+            filters: list[tuple[str, tuple[Any, ...]]],
+            limit: int | None,
+            offset: int,
+            after: str | None
+    ) -> sqlite3.Cursor:
+
+        if offset < 0 or (limit is not None and limit < 0):
+
+            raise ValueError("limit and offset must not be negative")
+
+        clauses = [clause for clause, _ in filters]
+        params  = [param for _, values in filters for param in values]
+
+        if after is not None:
+
+            clauses.append("id > ?")
+            params.append(after)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        return self._execute(
+            f"SELECT {', '.join(columns)} FROM {table}{where} ORDER BY id LIMIT ? OFFSET ?",
+            (*params, -1 if limit is None else limit, offset)
+        )
+
+
+    def _existing(self, table: str, recordIDs: list[str]) -> list[str]:
+
+        found = set()
+
+        for start in range(0, len(recordIDs), 500):
+
+            chunk = recordIDs[start:start + 500]
+
+            found.update(
+                row[0] for row in self._execute(
+                    f"SELECT id FROM {table} WHERE id IN ({', '.join('?' * len(chunk))})", tuple(chunk)
+                )
+            )
+
+        return [recordID for recordID in recordIDs if recordID in found]
+
+
+    def _prefixFilter(self, namePrefix: str) -> tuple[str, tuple[Any, ...]]:
+
+        # A range rather than LIKE so the lookup can use the name index.
+        return ("name >= ? AND name < ?", (namePrefix, namePrefix + "\U0010ffff"))
+
+
+    @contextmanager
+    def transaction(self) -> Iterator["SqliteRepo"]:
+
+        if self.db.in_transaction:
+
+            yield self
+
+            return
+
+        self.db.execute("BEGIN IMMEDIATE")
+
+        try:
+
+            yield self
+
+        except BaseException:
+
+            self.db.execute("ROLLBACK")
+
+            raise
+
+        self.db.execute("COMMIT")
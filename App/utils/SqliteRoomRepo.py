@@ -0,0 +1,255 @@
+from typing import TYPE_CHECKING, Any, Iterator
+from itertools import chain
+import sqlite3
+import json
+from Rentables.utils import thaw
+from .Repo import Repo
+from .SqliteRepo import SqliteRepo
+from .RoomRepoMixin import RoomRepoMixin, addOnIDs
+from .NDJSON import writeNDJSON
+from .Projection import LazyEntity
+
+
+if TYPE_CHECKING:
+
+    from API import API
+
+
+ROOM_COLUMNS = {
+    "id": None,
+    "name": None,
+    "rateType": None,
+    "rateParams": json.loads,
+    "addOns": lambda addOns: addOnIDs(json.loads(addOns))
+}
+
+
+class SqliteRoomRepo(RoomRepoMixin, SqliteRepo):
+
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rooms (
+            id         TEXT PRIMARY KEY,
+            name       TEXT NOT NULL,
+            rateType   TEXT NOT NULL,
+            rateParams TEXT NOT NULL,
+            addOns     TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS rooms_name ON rooms (name);
+        CREATE INDEX IF NOT EXISTS rooms_rateType ON rooms (rateType);
+
+        CREATE TABLE IF NOT EXISTS room_addons (
+            addOnID TEXT NOT NULL,
+            roomID  TEXT NOT NULL,
+            PRIMARY KEY (addOnID, roomID)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS room_addons_roomID ON room_addons (roomID);
+
+        CREATE TRIGGER IF NOT EXISTS rooms_addons_insert AFTER INSERT ON rooms BEGIN
+            DELETE FROM room_addons WHERE roomID = NEW.id;
+            INSERT OR IGNORE INTO room_addons (addOnID, roomID)
+                SELECT CASE addOn.type WHEN 'object' THEN json_extract(addOn.value, '$.id') ELSE addOn.value END, NEW.id
+                FROM json_each(NEW.addOns) AS addOn;
+        END;
+        CREATE TRIGGER IF NOT EXISTS rooms_addons_update AFTER UPDATE OF id, addOns ON rooms BEGIN
+            DELETE FROM room_addons WHERE roomID = OLD.id;
+            INSERT OR IGNORE INTO room_addons (addOnID, roomID)
+                SELECT CASE addOn.type WHEN 'object' THEN json_extract(addOn.value, '$.id') ELSE addOn.value END, NEW.id
+                FROM json_each(NEW.addOns) AS addOn;
+        END;
+        CREATE TRIGGER IF NOT EXISTS rooms_addons_delete AFTER DELETE ON rooms BEGIN
+            DELETE FROM room_addons WHERE roomID = OLD.id;
+        END;
+    """
+
+
+    def __init__(self, api: "API", dbPath: str, addOnRepo: Repo):
+
+        super().__init__(api, dbPath)
+
+        self.addOnRepo = addOnRepo
+
+        addOnRepo.onDelete.append(self.dropAddOnRefs)
+
+
+    def _rowToJSON(self, row: tuple[Any, ...]) -> dict[str, Any]:
+
+        id, name, rateType, rateParams, addOns = row
+
+        return {
+            "id": id,
+            "name": name,
+            "rate": {
+                "rateType": rateType,
+                "params": json.loads(rateParams)
+            },
+            "addOns": json.loads(addOns)
+        }
+
+
+    def _toRow(self, room: Any) -> tuple[Any, ...]:
+
+        addOns = [addOn.id for addOn in room.addOns]
+
+        return (room.id, room.name, room.rate.name, json.dumps(thaw(room.rate.params)), json.dumps(addOns))
+
+
+    def ls(self, fields: list[str] | None = None, lazy: bool = False) -> list[Any]:
+
+        if fields is not None:
+
+            return self._project("rooms", fields, ROOM_COLUMNS)
+
+        rows = self._execute("SELECT id, name, rateType, rateParams, addOns FROM rooms ORDER BY rowid")
+
+        if lazy:
+
+            return [LazyEntity(self._rowToJSON(row), self._hydrate) for row in rows]
+
+        addOns = {addOn.id: addOn for addOn in self.addOnRepo.ls()}
+
+        return [self._build(self._rowToJSON(row), addOns) for row in rows]
+
+
+    def query(
+            self,
+            fields: list[str] | None = None,
+            limit: int | None = None,
+            offset: int = 0,
+            after: str | None = None,
+            rateType: str | None = None,
+            namePrefix: str | None = None,
+            addOnID: str | None = None
+    ) -> list[Any]:
+
+        filters = []
+
+        if rateType is not None:
+
+            filters.append(("rateType = ?", (rateType,)))
+
+        if namePrefix is not None:
+
+            filters.append(self._prefixFilter(namePrefix))
+
+        if addOnID is not None:
+
+            filters.append(("id IN (SELECT roomID FROM room_addons WHERE addOnID = ?)", (addOnID,)))
+
+        if fields is not None:
+
+            self._checkFields(fields, ROOM_COLUMNS)
+
+            rows = self._page("rooms", fields, filters, limit, offset, after)
+
+            return self._decodeRows(fields, ROOM_COLUMNS, rows)
+
+        records = [self._rowToJSON(row) for row in self._page("rooms", list(ROOM_COLUMNS), filters, limit, offset, after)]
+        addOns  = self.addOnRepo.lookup(chain.from_iterable(addOnIDs(record["addOns"]) for record in records))
+
+        return [self._build(record, addOns) for record in records]
+
+
+    def add(self, roomJSON: dict[str, Any]) -> Any:
+
+        addOns = self.addOnRepo.lookup(addOnIDs(roomJSON.get("addOns", [])))
+        room   = self._buildNew(roomJSON, addOns)
+
+        try:
+
+            self._execute(
+                "INSERT INTO rooms (id, name, rateType, rateParams, addOns) VALUES (?, ?, ?, ?, ?)",
+                self._toRow(room)
+            )
+
+        except sqlite3.IntegrityError as e:
+
+            raise ValueError(f"Room {room} (id: {room.id}) already exists") from e
+
+        return room
+
+
+    def get(self, objID: str) -> Any | None:
+
+        row = self._execute(
+            "SELECT id, name, rateType, rateParams, addOns FROM rooms WHERE id = ?",
+            (objID,)
+        ).fetchone()
+
+        if row is None:
+
+            raise ValueError(f"Room with id '{objID}' does not exist")
+
+        return self._hydrate(self._rowToJSON(row))
+
+
+    def delete(self, objID: str):
+
+        if self._execute("DELETE FROM rooms WHERE id = ?", (objID,)).rowcount == 0:
+
+            raise ValueError(f"Room with id '{objID}' does not exist")
+
+
+    def _records(self) -> list[dict[str, Any]]:
+
+        rows = self._execute("SELECT id, name, rateType, rateParams, addOns FROM rooms ORDER BY rowid")
+
+        return [self._rowToJSON(row) for row in rows]
+
+
+    def _referencing(self, addOnID: str) -> list[dict[str, Any]]:
+
+        rows = self._execute(
+            "SELECT id, name, rateType, rateParams, addOns FROM rooms"
+            " WHERE id IN (SELECT roomID FROM room_addons WHERE addOnID = ?)",
+            (addOnID,)
+        )
+
+        return [self._rowToJSON(row) for row in rows]
+
+
+    def _existingIDs(self, roomIDs: list[str]) -> list[str]:
+
+        return self._existing("rooms", roomIDs)
+
+
+    def _insert(self, rooms: list[Any]):
+
+        self.db.executemany(
+            "INSERT INTO rooms (id, name, rateType, rateParams, addOns) VALUES (?, ?, ?, ?, ?)",
+            (self._toRow(room) for room in rooms)
+        )
+
+
+    def _setAddOns(self, refs: dict[str, list[str]]):
+
+        self.db.executemany(
+            "UPDATE rooms SET addOns = ? WHERE id = ?",
+            ((json.dumps(addOns), roomID) for roomID, addOns in refs.items())
+        )
+
+
+    def importRecords(self, records: list[dict[str, Any]]):
+
+        with self.transaction():
+
+            self.db.executemany(
+                "INSERT OR REPLACE INTO rooms (id, name, rateType, rateParams, addOns) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        record["id"],
+                        record["name"],
+                        record["rate"]["rateType"],
+                        json.dumps(record["rate"]["params"]),
+                        json.dumps(addOnIDs(record.get("addOns", [])))
+                    )
+                    for record in records
+                )
+            )
+
+
+    def exportStream(self) -> Iterator[str]:
+
+        rows = self._execute("SELECT id, name, rateType, rateParams, addOns FROM rooms ORDER BY rowid")
+
+        return writeNDJSON(self._rowToJSON(row) for row in rows)
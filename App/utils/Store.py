@@ -1,27 +1,398 @@
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
+import threading
 import json
+import os
+from .JSONStream import iterJSONArray
+from .BinarySnapshot import BinarySnapshot, Layout
+
+try:
+
+    import fcntl
+
+except ImportError:
+
+    fcntl = None
+
+
+# Called after a transaction commits with the store version before and after
+# it and the final state of every record it changed (None for removed ones),
+# or None in place of the changes when the whole store was replaced.
+CommitHook = Callable[[tuple[int, ...] | None, tuple[int, ...] | None, dict[str, Any] | None], None]
 
 
 class Store:
 
 
-    def __init__(self, filePath: str):
+    def __init__(self, filePath: str, layout: Layout | None = None):
 
-        self.file = Path(filePath)
+        self.file     = Path(filePath)
+        self.lockFile = Path(f"{filePath}.lock")
+        self.snapshot = BinarySnapshot(Path(f"{filePath}.bin"), layout) if layout else None
+
+        self._records: dict[str, dict[str, Any]] = {}
+        self._stamp: tuple[int, int] | None   = None
+        self._changes: dict[str, Any] | None  = {}
+        self.onCommit: list[CommitHook]       = []
+
+        self._lock             = threading.RLock()
+        self._lockHandle       = None
+        self._lockDepth        = 0
+        self._lockExclusive    = False
+        self._transactionDepth = 0
+        self._dirty            = False
 
         self.file.parent.mkdir(parents=True, exist_ok=True)
 
-        if not self.file.exists():
+        with self._fileLock(exclusive=True):
+
+            if not self.file.exists():
+
+                self._atomicWrite(self.file, "[]")
+
+
+    def _statStamp(self) -> tuple[int, int]:
+
+        stat = self.file.stat()
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+    def _refresh(self):
+
+        stamp = self._statStamp()
+
+        if stamp == self._stamp:
+
+            return
+
+        self._records = {record["id"]: record for record in self._snapshotRecords(stamp)}
+        self._stamp   = stamp
+
+
+    def _snapshotRecords(self, stamp: tuple[int, int]) -> Iterator[dict[str, Any]]:
+
+        if self.snapshot is not None:
+
+            records = self.snapshot.openRecords(stamp)
+
+            if records is not None:
+
+                return records
+
+        # Snapshots are replaced by rename, so an open handle keeps reading a
+        # consistent file even if a writer commits while we stream it.
+        file = self.file.open()
+
+        def stream() -> Iterator[dict[str, Any]]:
+
+            with file:
+
+                yield from iterJSONArray(file)
+
+        if self.snapshot is None:
+
+            return stream()
+
+        return self.snapshot.tee(stamp, stream())
+
+
+    def _atomicWrite(self, path: Path, text: str):
+
+        temp = path.with_name(f"{path.name}.tmp")
+
+        with temp.open("w") as file:
+
+            file.write(text)
+            file.flush()
+
+            os.fsync(file.fileno())
+
+        os.replace(temp, path)
+
+
+    def _encode(self) -> str:
+
+        # One compact record per line keeps the file readable while letting
+        # json use its C encoder, which indent= disables.
+        encode = json.JSONEncoder(separators=(", ", ": ")).encode
+
+        return "[\n" + ",\n".join(encode(record) for record in self._records.values()) + "\n]"
+
+
+    def _write(self):
+
+        self._atomicWrite(self.file, self._encode())
+
+        self._stamp = self._statStamp()
+
+        if self.snapshot is not None:
+
+            self.snapshot.write(self._stamp, self._records.values())
+
+
+    def _commit(self):
+
+        self._write()
+
+
+    def _rollback(self):
+
+        self._stamp = None
+
+
+    @contextmanager
+    def _fileLock(self, exclusive: bool) -> Iterator[None]:
+
+        with self._lock:
+
+            if self._lockDepth == 0:
+
+                self._lockHandle    = self.lockFile.open("a")
+                self._lockExclusive = exclusive
+
+                if fcntl is not None:
+
+                    fcntl.flock(self._lockHandle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+            elif exclusive and not self._lockExclusive:
+
+                raise RuntimeError(f"Cannot upgrade a shared lock on '{self.file}' to exclusive")
+
+            self._lockDepth += 1
+
+            try:
+
+                yield
+
+            finally:
+
+                self._lockDepth -= 1
+
+                if self._lockDepth == 0:
+
+                    if fcntl is not None:
+
+                        fcntl.flock(self._lockHandle.fileno(), fcntl.LOCK_UN)
+
+                    self._lockHandle.close()
+
+                    self._lockHandle = None
+
+
+    @contextmanager
+    def transaction(self) -> Iterator["Store"]:
+
+        with self._fileLock(exclusive=True):
+
+            if self._transactionDepth == 0:
+
+                self._refresh()
+
+                self._changes = {}
+
+                before = self.version() if self.onCommit else None
+
+            self._transactionDepth += 1
+
+            try:
+
+                yield self
+
+            except BaseException:
+
+                self._transactionDepth -= 1
+
+                if self._transactionDepth == 0 and self._dirty:
+
+                    self._dirty = False
+
+                    self._rollback()
+
+                raise
 
-            self.file.write_text("[]")
+            self._transactionDepth -= 1
+
+            if self._transactionDepth == 0:
+
+                # The cache only stops counting as dirty once the write has
+                # landed; a failed commit drops it so reads go back to disk.
+                if self._dirty:
+
+                    try:
+
+                        self._commit()
+
+                    except BaseException:
+
+                        self._rollback()
+
+                        raise
+
+                    finally:
+
+                        self._dirty = False
+
+                if self.onCommit:
+
+                    self._notify(before, self._changes)
+
+
+    def _notify(self, before: tuple[int, ...] | None, changes: dict[str, Any] | None):
+
+        after = self.version()
+
+        if after == before:
+
+            return
+
+        for hook in self.onCommit:
+
+            hook(before, after, changes)
+
+
+    def _read(self):
+
+        with self._fileLock(exclusive=False):
+
+            self._refresh()
+
+
+    def _isFresh(self) -> bool:
+
+        return self._stamp is not None and self._stamp == self._statStamp()
+
+
+    def _openRecords(self) -> Iterator[dict[str, Any]]:
+
+        return self._snapshotRecords(self._statStamp())
+
+
+    def iterRecords(self) -> Iterator[dict[str, Any]]:
+
+        with self._fileLock(exclusive=False):
+
+            if self._isFresh():
+
+                records = iter(list(self._records.values()))
+
+            else:
+
+                records = self._openRecords()
+
+        yield from records
+
+
+    def version(self) -> tuple[int, ...] | None:
+
+        with self._fileLock(exclusive=False):
+
+            if self._dirty:
+
+                return None
+
+            return self._statStamp()
+
+
+    def iterBlocks(self, columns: list[int] | None = None) -> Iterator[tuple[list[Any] | None, ...]] | None:
+
+        if self.snapshot is None:
+
+            return None
+
+        with self._fileLock(exclusive=False):
+
+            if self._dirty:
+
+                return None
+
+            return self.snapshot.openBlocks(self._statStamp(), columns)
 
 
     def load(self) -> list[dict[str, Any]]:
 
-        return json.loads(self.file.read_text())
-    
+        self._read()
+
+        return list(self._records.values())
+
+
+    def getMany(self, recordIDs: Iterable[str]) -> dict[str, dict[str, Any]]:
+
+        wanted = set(recordIDs)
+
+        # A stale cache is reloaded once per stamp, so later lookups stay O(1)
+        # instead of each one streaming the whole file.
+        with self._fileLock(exclusive=False):
+
+            self._refresh()
+
+            return {recordID: self._records[recordID] for recordID in wanted if recordID in self._records}
+
+
+    def get(self, recordID: str) -> dict[str, Any] | None:
+
+        return self.getMany([recordID]).get(recordID)
+
+
+    def contains(self, recordID: str) -> bool:
+
+        return self.get(recordID) is not None
+
+
+    def existing(self, recordIDs: Iterable[str]) -> list[str]:
+
+        recordIDs = list(recordIDs)
+        found     = self.getMany(recordIDs)
+
+        return [recordID for recordID in recordIDs if recordID in found]
+
+
+    def _changed(self, recordID: str, record: dict[str, Any] | None):
+
+        if self._changes is not None:
+
+            self._changes[recordID] = record
+
+
+    def put(self, record: dict[str, Any]):
+
+        with self.transaction():
+
+            self._records[record["id"]] = record
+            self._dirty                 = True
+
+            self._changed(record["id"], record)
+
+
+    def putMany(self, records: Iterable[dict[str, Any]]):
+
+        with self.transaction():
+
+            for record in records:
+
+                self._records[record["id"]] = record
+
+                self._changed(record["id"], record)
+
+            self._dirty = True
+
+
+    def remove(self, recordID: str):
+
+        with self.transaction():
+
+            self._records.pop(recordID, None)
+
+            self._dirty = True
+
+            self._changed(recordID, None)
+
 
     def save(self, data: list[dict[str, Any]]):
 
-        self.file.write_text(json.dumps(data, indent=2))
+        with self.transaction():
+
+            self._records = {record["id"]: record for record in data}
+            self._dirty   = True
+            self._changes = None
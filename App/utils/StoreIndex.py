@@ -0,0 +1,316 @@
+from typing import TYPE_CHECKING, Any
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from pathlib import Path
+import threading
+import marshal
+import os
+from .Projection import Field, project, projectStore
+
+
+if TYPE_CHECKING:
+
+    from .Store import Store
+
+
+MAX_QUEUED_COMMITS = 1024
+INDEX_FORMAT       = 1
+
+
+# Secondary indexes over a JSON store. Commits made through the store are
+# applied to the postings record by record; the index is only rebuilt from the
+# projected index columns when the store changed some other way (another
+# process, or a wholesale save). Ids are kept sorted so every query pages in
+# id order and the last id of a page works as the cursor for the next one.
+#
+# A rebuilt index is also saved next to the store, stamped with the store
+# version it reflects, so that short-lived processes (each CLI command) load
+# it instead of projecting the whole store. Writes only update the index in
+# the process that made them; the first query in a later process after a
+# write rebuilds and re-saves it once.
+class StoreIndex:
+
+
+    def __init__(self, store: "Store", spec: dict[str, Field], keys: list[str]):
+
+        self.store   = store
+        self.spec    = spec
+        self.keys    = keys
+        self.columns = list(dict.fromkeys(["id", "name", *keys]))
+        self.path    = Path(f"{store.file}.{'+'.join(keys)}.index")
+
+        # Rows are kept as tuples in column order, which keeps both rebuilding
+        # and loading a saved index cheap.
+        self._positions = {column: position for position, column in enumerate(self.columns)}
+
+        self._version: tuple[int, ...] | None = None
+
+        self._rows: dict[str, tuple[Any, ...]]          = {}
+        self._ids: list[str]                            = []
+        self._names: list[tuple[str, str]]              = []
+        self._postings: dict[str, dict[Any, list[str]]] = {}
+        self._commits: deque                            = deque()
+        self._lock                                      = threading.Lock()
+
+        store.onCommit.append(self._onCommit)
+
+
+    def _row(self, record: dict[str, Any]) -> tuple[Any, ...]:
+
+        return tuple(record[column] for column in self.columns)
+
+
+    def _values(self, row: tuple[Any, ...], key: str) -> list[Any]:
+
+        value = row[self._positions[key]]
+
+        return list(dict.fromkeys(value if isinstance(value, list) else [value]))
+
+
+    def _onCommit(
+            self,
+            before: tuple[int, ...] | None,
+            after: tuple[int, ...] | None,
+            changes: dict[str, Any] | None
+    ):
+
+        # Runs under the store's lock, so the commit is only queued here and
+        # applied by the next query; taking the index lock could deadlock.
+        if len(self._commits) >= MAX_QUEUED_COMMITS:
+
+            self._commits.clear()
+
+            changes = None
+
+        self._commits.append((before, after, changes))
+
+
+    def _applyCommits(self):
+
+        while self._commits:
+
+            before, after, changes = self._commits.popleft()
+
+            if changes is None or before is None or before != self._version:
+
+                self._version = None
+
+                continue
+
+            for recordID, record in changes.items():
+
+                self._unindex(recordID)
+
+                if record is not None:
+
+                    self._index(self._row(project([record], self.columns, self.spec)[0]))
+
+            self._version = after
+
+
+    def _unindex(self, recordID: str):
+
+        row = self._rows.pop(recordID, None)
+
+        if row is None:
+
+            return
+
+        del self._ids[bisect_left(self._ids, recordID)]
+        del self._names[bisect_left(self._names, (row[1], recordID))]
+
+        for key in self.keys:
+
+            for value in self._values(row, key):
+
+                posting = self._postings[key][value]
+
+                del posting[bisect_left(posting, recordID)]
+
+                if not posting:
+
+                    del self._postings[key][value]
+
+
+    def _index(self, row: tuple[Any, ...]):
+
+        recordID = row[0]
+
+        self._rows[recordID] = row
+
+        insort(self._ids, recordID)
+        insort(self._names, (row[1], recordID))
+
+        for key in self.keys:
+
+            for value in self._values(row, key):
+
+                insort(self._postings[key].setdefault(value, []), recordID)
+
+
+    def _refresh(self):
+
+        version = self.store.version()
+
+        self._applyCommits()
+
+        if version is not None and version == self._version:
+
+            return
+
+        if version is not None and self._load(version):
+
+            return
+
+        rows     = sorted(map(self._row, projectStore(self.store, self.columns, self.spec)))
+        postings = {key: {} for key in self.keys}
+
+        for row in rows:
+
+            for key, posting in postings.items():
+
+                for value in self._values(row, key):
+
+                    posting.setdefault(value, []).append(row[0])
+
+        self._rows     = {row[0]: row for row in rows}
+        self._ids      = [row[0] for row in rows]
+        self._names    = sorted((row[1], row[0]) for row in rows)
+        self._postings = postings
+        self._version  = version
+
+        if version is not None:
+
+            self._save()
+
+
+    def _header(self, version: tuple[int, ...]) -> tuple[Any, ...]:
+
+        return (INDEX_FORMAT, marshal.version, tuple(version), tuple(self.columns), tuple(self.keys))
+
+
+    def _load(self, version: tuple[int, ...]) -> bool:
+
+        try:
+
+            header, rows, names, postings = marshal.loads(self.path.read_bytes())
+
+        except (OSError, EOFError, ValueError, TypeError):
+
+            return False
+
+        if header != self._header(version):
+
+            return False
+
+        self._rows     = {row[0]: row for row in rows}
+        self._ids      = list(self._rows)
+        self._names    = names
+        self._postings = postings
+        self._version  = version
+
+        return True
+
+
+    def _save(self):
+
+        state = (self._header(self._version), list(self._rows.values()), self._names, self._postings)
+        temp  = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        # The saved index is only a cache: a missing, torn or stale file is
+        # rebuilt from the store, so it is not fsynced, and failing to write
+        # it (e.g. a read-only data directory) is not an error.
+        try:
+
+            temp.write_bytes(marshal.dumps(state))
+
+            os.replace(temp, self.path)
+
+        except (OSError, ValueError):
+
+            temp.unlink(missing_ok=True)
+
+
+    def _prefixed(self, prefix: str) -> set[str]:
+
+        start = bisect_left(self._names, (prefix, ""))
+        end   = bisect_left(self._names, (prefix + "\U0010ffff", ""))
+
+        return {recordID for _, recordID in self._names[start:end]}
+
+
+    def select(
+            self,
+            filters: dict[str, Any],
+            namePrefix: str | None = None,
+            limit: int | None = None,
+            offset: int = 0,
+            after: str | None = None
+    ) -> list[str]:
+
+        if offset < 0 or (limit is not None and limit < 0):
+
+            raise ValueError("limit and offset must not be negative")
+
+        unknown = [key for key in filters if key not in self.keys]
+
+        if unknown:
+
+            raise ValueError(f"Unknown index(es): {', '.join(unknown)}")
+
+        with self._lock:
+
+            self._refresh()
+
+            return self._select(filters, namePrefix, limit, offset, after)
+
+
+    def _select(
+            self,
+            filters: dict[str, Any],
+            namePrefix: str | None,
+            limit: int | None,
+            offset: int,
+            after: str | None
+    ) -> list[str]:
+
+        matches = [
+            self._postings[key].get(value, [])
+            for key, value in filters.items()
+            if value is not None
+        ]
+
+        if namePrefix is not None:
+
+            matches.append(sorted(self._prefixed(namePrefix)))
+
+        if not matches:
+
+            ids = self._ids
+
+        else:
+
+            matches.sort(key=len)
+
+            others = [set(match) for match in matches[1:]]
+            ids    = [recordID for recordID in matches[0] if all(recordID in other for other in others)]
+
+        start = offset if after is None else bisect_right(ids, after) + offset
+        end   = None if limit is None else start + limit
+
+        return ids[start:end]
+
+
+    def fetch(self, recordIDs: list[str], fields: list[str]) -> list[dict[str, Any]]:
+
+        if set(fields) <= set(self.columns):
+
+            return [
+                {field: self._rows[recordID][self._positions[field]] for field in fields}
+                for recordID in recordIDs
+                if recordID in self._rows
+            ]
+
+        records = self.store.getMany(recordIDs)
+
+        return project((records[recordID] for recordID in recordIDs if recordID in records), fields, self.spec)
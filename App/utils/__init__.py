@@ -1,4 +1,19 @@
 from .AddOnRepo import AddOnRepo
 from .RoomRepo import RoomRepo
+from .SqliteAddOnRepo import SqliteAddOnRepo
+from .SqliteRoomRepo import SqliteRoomRepo
+from .RepoFactory import (
+    makeAddOnRepo,
+    makeRoomRepo,
+    migrateJSONToSqlite
+)
 
-__all__ = ["AddOnRepo", "RoomRepo"]
+__all__ = [
+    "AddOnRepo",
+    "RoomRepo",
+    "SqliteAddOnRepo",
+    "SqliteRoomRepo",
+    "makeAddOnRepo",
+    "makeRoomRepo",
+    "migrateJSONToSqlite"
+]
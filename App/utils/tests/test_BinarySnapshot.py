@@ -0,0 +1,73 @@
+import json
+import pytest
+from App.utils.Store import Store
+from App.utils.BinarySnapshot import BLOCK_SIZE
+from App.utils.RoomRepo import ROOM_LAYOUT
+
+
+def rooms(count):
+
+    return [
+        {"id": f"r{i}", "name": f"Room {i}", "rate": {"rateType": "Fixed Rate", "params": {"Rate": i}}, "addOns": []}
+        for i in range(count)
+    ]
+
+
+def freshStore(path):
+
+    # A new instance has no cached records, so loading reads the files again.
+    return Store(str(path), ROOM_LAYOUT)
+
+
+@pytest.fixture
+def store(tmp_path):
+
+    store = Store(str(tmp_path / "rooms.json"), ROOM_LAYOUT)
+
+    store.save(rooms(BLOCK_SIZE + 10))
+
+    return store
+
+
+def testSnapshotMatchesJSON(store):
+
+    assert store.snapshot.path.exists()
+    assert list(store.snapshot.openRecords(store._statStamp())) == json.loads(store.file.read_text())
+
+
+def testProjectedColumnsSkipTheOthers(store):
+
+    blocks = list(store.iterBlocks([0]))
+
+    assert [len(block[0]) for block in blocks] == [BLOCK_SIZE, 10]
+    assert all(column is None for block in blocks for column in block[1:])
+
+
+@pytest.mark.parametrize("keep", [0.2, 0.5, 0.99])
+def testTruncatedSnapshotFallsBackToJSON(store, keep):
+
+    data = store.snapshot.path.read_bytes()
+
+    store.snapshot.path.write_bytes(data[:int(len(data) * keep)])
+
+    assert store.snapshot.openBlocks(store._statStamp()) is None
+    assert freshStore(store.file).load() == rooms(BLOCK_SIZE + 10)
+
+
+def testCorruptSnapshotFallsBackToJSON(store):
+
+    data = bytearray(store.snapshot.path.read_bytes())
+
+    data[len(data) // 2:len(data) // 2 + 64] = b"\xff" * 64
+
+    store.snapshot.path.write_bytes(bytes(data))
+
+    assert freshStore(store.file).load() == rooms(BLOCK_SIZE + 10)
+
+
+def testStaleSnapshotIsIgnored(store):
+
+    store.file.write_text(json.dumps(rooms(3)))
+
+    assert store.snapshot.openBlocks(store._statStamp()) is None
+    assert freshStore(store.file).load() == rooms(3)
@@ -0,0 +1,41 @@
+import io
+import json
+import pytest
+from App.utils.JSONStream import iterJSONArray
+
+
+DOCUMENTS = [
+    "[]",
+    " [ ] ",
+    "[12, 345]",
+    "[-1.5e+3,0,-0.25E-2 ,7]",
+    '[true, false, null, "a\\"b", "\\u00e9\\n"]',
+    '[\n  {"id": "r1", "addOns": [1, [2, {"x": "]"}]]},\n  {"id": "r2", "rate": 10.75}\n]',
+    '[NaN, Infinity, -Infinity, 1]',
+    "[" + ", ".join(str(i * 1001) for i in range(50)) + "]"
+]
+
+
+def stream(document, chunkSize):
+
+    return list(iterJSONArray(io.StringIO(document), chunkSize))
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def testEveryChunkSizeMatchesJSON(document):
+
+    expected = json.loads(document)
+
+    for chunkSize in range(1, len(document) + 2):
+
+        assert repr(stream(document, chunkSize)) == repr(expected), chunkSize
+
+
+@pytest.mark.parametrize("document", ["", "[1, 2", "{}", "[1 2]", "[1.]", "[1,]", '["abc'])
+def testRejectsInvalidArrays(document):
+
+    for chunkSize in (1, 2, 3, 1 << 16):
+
+        with pytest.raises(ValueError):
+
+            stream(document, chunkSize)
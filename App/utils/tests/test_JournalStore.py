@@ -0,0 +1,51 @@
+import json
+from App.utils.JournalStore import JournalStore
+
+
+def record(recordID, value=0):
+
+    return {"id": recordID, "value": value}
+
+
+def testReplaysOnlyTheNewEntries(tmp_path, monkeypatch):
+
+    store = JournalStore(str(tmp_path / "records.json"))
+    other = JournalStore(str(store.file))
+
+    store.save([record("a"), record("b")])
+
+    assert other.load() == [record("a"), record("b")]
+
+    # The snapshot is unchanged, so the other instance only replays the journal.
+    monkeypatch.setattr(JournalStore, "_snapshotRecords", None)
+
+    store.put(record("c"))
+    store.remove("a")
+
+    assert other.load() == [record("b"), record("c")]
+    assert other._journalOffset == store.journal.stat().st_size
+
+
+def testBackgroundCompactionFoldsTheJournal(tmp_path):
+
+    store = JournalStore(str(tmp_path / "records.json"), compactThreshold=256)
+    other = JournalStore(str(store.file))
+
+    for i in range(40):
+
+        store.put(record(f"r{i % 15}", i))
+
+        if i % 7 == 0:
+
+            store.remove(f"r{i % 5}")
+
+        assert other.load() == store.load()
+
+    store._compactor.join()
+
+    expected = store.load()
+
+    # Entries after the last compaction stay in the journal until the next.
+    assert store.journal.stat().st_size <= 256
+    assert json.loads(store.file.read_text())
+    assert other.load() == JournalStore(str(store.file)).load() == expected
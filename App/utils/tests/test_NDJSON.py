@@ -0,0 +1,69 @@
+import json
+import pytest
+from App.utils import Config, makeAddOnRepo
+from App.utils.NDJSON import readNDJSON, writeNDJSON, chunked, firstDuplicate
+
+
+def addOn(i):
+
+    return {"id": f"a{i}", "name": f"Add-On {i}", "rate": {"rateType": "Fixed Rate", "params": {"Rate": i}}}
+
+
+@pytest.fixture(params=["json", "journal", "sqlite"])
+def addOnRepo(request, api, tmp_path, monkeypatch):
+
+    monkeypatch.setattr(Config, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "STORE_BACKEND", request.param)
+    monkeypatch.setattr(Config, "SQLITE_PATH", str(tmp_path / "inpy.db"))
+
+    return makeAddOnRepo(api)
+
+
+def testWriteThenReadRoundTrips():
+
+    records = [{"id": "x", "nested": {"list": [1, 2.5, None], "text": "line\nbreak é"}}, {"id": "y"}]
+    lines   = list(writeNDJSON(records))
+
+    assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+    assert [record for _, record in readNDJSON(lines)] == records
+
+
+def testReadSkipsBlankLinesAndReportsLineNumbers():
+
+    assert list(readNDJSON(['{"id": 1}', "", "  \n", '{"id": 2}\n'])) == [(1, {"id": 1}), (4, {"id": 2})]
+
+    with pytest.raises(ValueError, match="Malformed JSON on line 3"):
+
+        list(readNDJSON(['{"id": 1}', "", "{nope"]))
+
+
+def testChunksAndDuplicates():
+
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunked([], 3)) == []
+    assert firstDuplicate(["a", "b", "c", "b", "a"]) == "b"
+    assert firstDuplicate(["a", "b"]) is None
+
+
+def testAddOnsRoundTrip(addOnRepo):
+
+    lines = [json.dumps(addOn(i)) for i in range(7)]
+
+    assert addOnRepo.importStream(lines, chunkSize=3) == 7
+    assert [json.loads(line) for line in addOnRepo.exportStream()] == [addOn(i) for i in range(7)]
+
+
+@pytest.mark.parametrize("lines, message", [
+    ([json.dumps(addOn(1)), json.dumps({"id": "bad"})], "Invalid Add-On on line 2"),
+    ([json.dumps(addOn(1)), json.dumps(addOn(2)), json.dumps(addOn(1))], "Add-On with id 'a1' already exists"),
+    ([json.dumps(addOn(0))], "Add-On with id 'a0' already exists")
+])
+def testFailedImportWritesNothing(addOnRepo, lines, message):
+
+    addOnRepo.add(addOn(0))
+
+    with pytest.raises(ValueError, match=message):
+
+        addOnRepo.importStream(lines, chunkSize=2)
+
+    assert [json.loads(line) for line in addOnRepo.exportStream()] == [addOn(0)]
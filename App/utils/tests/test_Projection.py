@@ -0,0 +1,113 @@
+import pytest
+from App.utils import Config, makeAddOnRepo, makeRoomRepo
+from App.utils.Store import Store
+from App.utils.JournalStore import JournalStore
+from App.utils.Projection import LazyEntity, project, projectStore
+from App.utils.RoomRepo import ROOM_LAYOUT, ROOM_FIELDS
+
+
+FIELDS = ["id", "name", "rateType", "rateParams", "addOns"]
+
+
+def room(i):
+
+    return {
+        "id": f"r{i}",
+        "name": f"Room {i}",
+        "rate": {"rateType": ["Fixed Rate", "Flat Rate"][i % 2], "params": {"Rate": i}},
+        "addOns": [f"a{j}" for j in range(i % 3)]
+    }
+
+
+def expected(rooms, fields):
+
+    columns = {
+        "id": lambda room: room["id"],
+        "name": lambda room: room["name"],
+        "rateType": lambda room: room["rate"]["rateType"],
+        "rateParams": lambda room: room["rate"]["params"],
+        "addOns": lambda room: room["addOns"]
+    }
+
+    return [{field: columns[field](room) for field in fields} for room in rooms]
+
+
+@pytest.mark.parametrize("storeCls", [Store, JournalStore])
+@pytest.mark.parametrize("fields", [FIELDS, ["name"], ["addOns", "id"]])
+def testProjectionsMatchTheRecords(tmp_path, storeCls, fields):
+
+    rooms = [room(i) for i in range(2100)]
+    store = storeCls(str(tmp_path / "rooms.json"), ROOM_LAYOUT)
+
+    store.save(rooms[:2000])
+
+    # The journal store has pending entries, so it projects the records
+    # instead of the snapshot blocks.
+    store.putMany(rooms[2000:])
+
+    assert projectStore(store, fields, ROOM_FIELDS) == expected(rooms, fields)
+    assert project(rooms, fields, ROOM_FIELDS) == expected(rooms, fields)
+
+
+def testEmbeddedAddOnsProjectToIDs():
+
+    record = {**room(1), "addOns": [{"id": "a0", "name": "A0"}, "a1"]}
+
+    assert project([record], ["addOns"], ROOM_FIELDS) == [{"addOns": ["a0", "a1"]}]
+
+
+def testRejectsUnknownFields(tmp_path):
+
+    with pytest.raises(ValueError, match="Unknown field"):
+
+        projectStore(Store(str(tmp_path / "rooms.json"), ROOM_LAYOUT), ["id", "price"], ROOM_FIELDS)
+
+
+def testLazyEntityBuildsOnce():
+
+    built = []
+
+    def builder(record):
+
+        built.append(record["id"])
+
+        return type("Built", (), {"rate": record["rate"]["rateType"]})()
+
+    entity = LazyEntity(room(1), builder)
+
+    assert (entity.id, entity.name) == ("r1", "Room 1")
+    assert built == []
+    assert entity.rate == entity.rate == "Flat Rate"
+    assert built == ["r1"]
+
+
+def summary(room):
+
+    return room.id, room.name, room.rate.name, [addOn.id for addOn in room.addOns]
+
+
+@pytest.mark.parametrize("backend", ["json", "journal", "sqlite"])
+def testRepoListingsAgree(api, tmp_path, monkeypatch, backend):
+
+    monkeypatch.setattr(Config, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "STORE_BACKEND", backend)
+    monkeypatch.setattr(Config, "SQLITE_PATH", str(tmp_path / "inpy.db"))
+
+    addOnRepo = makeAddOnRepo(api)
+    roomRepo  = makeRoomRepo(api, addOnRepo)
+    rooms     = [room(i) for i in range(6)]
+
+    for i in range(2):
+
+        addOnRepo.add({"id": f"a{i}", "name": f"A{i}", "rate": {"rateType": "Fixed Rate", "params": {"Rate": i}}})
+
+    for record in rooms:
+
+        roomRepo.add(record)
+
+    full = roomRepo.ls()
+    lazy = roomRepo.ls(lazy=True)
+
+    assert roomRepo.ls(fields=FIELDS) == expected(rooms, FIELDS)
+    assert [(entity.id, entity.name) for entity in lazy] == [(room.id, room.name) for room in full]
+    assert [summary(entity.resolve()) for entity in lazy] == [summary(room) for room in full]
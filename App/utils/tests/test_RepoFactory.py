@@ -0,0 +1,42 @@
+import json
+from App.utils import Config, SqliteAddOnRepo, SqliteRoomRepo, migrateJSONToSqlite
+
+
+PROJECTOR = {"id": "proj", "name": "Projector", "rate": {"rateType": "Flat Rate", "params": {"Rate": 5}}}
+CATERING  = {"id": "cat", "name": "Catering", "rate": {"rateType": "Fixed Rate", "params": {"Rate": 3}}}
+
+
+def room(roomID, addOns=()):
+
+    return {"id": roomID, "name": roomID.upper(), "rate": {"rateType": "Fixed Rate", "params": {"Rate": 2}}, "addOns": list(addOns)}
+
+
+def testMigrationLeavesTheJSONStoresUntouched(api, tmp_path, monkeypatch):
+
+    data = tmp_path / "data"
+
+    data.mkdir()
+
+    # An embedded add-on from before add-ons were normalized, and a pending
+    # journal whose last entry was torn by a crash.
+    (data / "addons.json").write_text(json.dumps([PROJECTOR]))
+    (data / "rooms.json").write_text(json.dumps([room("r1", ["proj", CATERING]), room("r2")]))
+    (data / "rooms.json.journal").write_text(
+        json.dumps({"op": "put", "record": room("r3")}) + "\n"
+        + json.dumps({"op": "remove", "id": "r2"}) + "\n"
+        + '{"op": "remove", "id": "r1'
+    )
+
+    before = {path.name: path.read_bytes() for path in data.iterdir()}
+
+    monkeypatch.setattr(Config, "DATA_DIR", str(data))
+    monkeypatch.setattr(Config, "SQLITE_PATH", str(tmp_path / "inpy.db"))
+
+    assert migrateJSONToSqlite(api) == (2, 2)
+    assert {path.name: path.read_bytes() for path in data.iterdir()} == before
+
+    addOnRepo = SqliteAddOnRepo(api, Config.SQLITE_PATH)
+    rooms     = SqliteRoomRepo(api, Config.SQLITE_PATH, addOnRepo).ls()
+
+    assert sorted(addOn.id for addOn in addOnRepo.ls()) == ["cat", "proj"]
+    assert [(room.id, [addOn.id for addOn in room.addOns]) for room in rooms] == [("r1", ["proj", "cat"]), ("r3", [])]
@@ -0,0 +1,104 @@
+import json
+import pytest
+from App.utils import Config, makeAddOnRepo, makeRoomRepo
+
+
+PROJECTOR = {"id": "proj", "name": "Projector", "rate": {"rateType": "Flat Rate", "params": {"Rate": 5}}}
+CATERING  = {"id": "cat", "name": "Catering", "rate": {"rateType": "Fixed Rate", "params": {"Rate": 3}}}
+
+
+def room(roomID, addOns=()):
+
+    return {"id": roomID, "name": roomID.upper(), "rate": {"rateType": "Fixed Rate", "params": {"Rate": 2}}, "addOns": list(addOns)}
+
+
+@pytest.fixture(params=["json", "journal", "sqlite"])
+def repos(request, api, tmp_path, monkeypatch):
+
+    monkeypatch.setattr(Config, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "STORE_BACKEND", request.param)
+    monkeypatch.setattr(Config, "SQLITE_PATH", str(tmp_path / "inpy.db"))
+
+    addOnRepo = makeAddOnRepo(api)
+
+    return addOnRepo, makeRoomRepo(api, addOnRepo)
+
+
+def testRoomsShareAddOns(repos):
+
+    addOnRepo, roomRepo = repos
+
+    addOnRepo.add(PROJECTOR)
+    roomRepo.add(room("r1", ["proj"]))
+    roomRepo.add(room("r2", ["proj"]))
+
+    first, second = roomRepo.ls()
+
+    assert first.addOns[0] is second.addOns[0]
+    assert json.loads(next(roomRepo.exportStream()))["addOns"] == ["proj"]
+
+
+def testRejectsUnknownAddOns(repos):
+
+    _, roomRepo = repos
+
+    with pytest.raises(ValueError, match="Add-On with id 'nope' does not exist"):
+
+        roomRepo.add(room("r1", ["nope"]))
+
+
+def testDeletingAnAddOnDropsItsReferences(repos):
+
+    addOnRepo, roomRepo = repos
+
+    addOnRepo.add(PROJECTOR)
+    addOnRepo.add(CATERING)
+    roomRepo.add(room("r1", ["proj", "cat"]))
+    roomRepo.add(room("r2", ["cat"]))
+
+    addOnRepo.delete("cat")
+
+    assert [[addOn.id for addOn in room.addOns] for room in roomRepo.ls()] == [["proj"], []]
+    assert roomRepo.query(fields=["id"], addOnID="cat") == []
+
+
+@pytest.mark.parametrize("rooms", [[room("r1"), room("r1")], [room("r0"), room("r1")]])
+def testImportRejectsRepeatedIDs(repos, rooms):
+
+    _, roomRepo = repos
+
+    roomRepo.add(room("r0"))
+
+    with pytest.raises(ValueError, match="already exists"):
+
+        roomRepo.importStream(json.dumps(record) for record in rooms)
+
+    assert [room.id for room in roomRepo.ls()] == ["r0"]
+
+
+def testImportStreamRoundTrips(repos):
+
+    addOnRepo, roomRepo = repos
+
+    addOnRepo.add(PROJECTOR)
+
+    lines = [json.dumps(room(f"r{i}", ["proj"] if i % 2 else [])) for i in range(5)]
+
+    assert roomRepo.importStream(lines, chunkSize=2) == 5
+    assert [json.loads(line) for line in roomRepo.exportStream()] == [json.loads(line) for line in lines]
+
+
+def testMigratesEmbeddedAddOns(repos):
+
+    addOnRepo, roomRepo = repos
+
+    addOnRepo.add(PROJECTOR)
+    roomRepo.add(room("r1"))
+
+    # Rooms written before add-ons were normalized embed full add-on records.
+    roomRepo._setAddOns({"r1": [PROJECTOR, CATERING]})
+
+    assert roomRepo.migrateAddOnRefs() == 1
+    assert roomRepo.migrateAddOnRefs() == 0
+    assert [addOn.id for addOn in roomRepo.get("r1").addOns] == ["proj", "cat"]
+    assert sorted(addOn.id for addOn in addOnRepo.ls()) == ["cat", "proj"]
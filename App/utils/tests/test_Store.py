@@ -0,0 +1,129 @@
+import os
+import pytest
+from App.utils.Store import Store
+from App.utils.JournalStore import JournalStore
+
+
+def record(recordID, value=0):
+
+    return {"id": recordID, "value": value}
+
+
+@pytest.fixture(params=[Store, JournalStore])
+def store(request, tmp_path):
+
+    store = request.param(str(tmp_path / "records.json"))
+
+    store.save([record("a"), record("b")])
+
+    return store
+
+
+def reopened(store):
+
+    return type(store)(str(store.file))
+
+
+def failing(*args, **kwargs):
+
+    raise OSError(28, "No space left on device")
+
+
+def testFailedTransactionRollsBack(store):
+
+    with pytest.raises(KeyError):
+
+        with store.transaction():
+
+            store.put(record("c"))
+            store.remove("a")
+
+            raise KeyError("c")
+
+    assert store.load() == reopened(store).load() == [record("a"), record("b")]
+
+
+def testFailedCommitServesTheFileOnDisk(store, monkeypatch):
+
+    monkeypatch.setattr(Store, "_atomicWrite", failing)
+    monkeypatch.setattr(os, "fsync", failing)
+
+    with pytest.raises(OSError):
+
+        store.put(record("c", 1))
+
+    with pytest.raises(OSError):
+
+        store.save([record("d")])
+
+    assert store.get("c") is None
+    assert store.load() == [record("a"), record("b")]
+    assert store.version() is not None
+
+    monkeypatch.undo()
+
+    store.put(record("c", 2))
+
+    assert reopened(store).load() == [record("a"), record("b"), record("c", 2)]
+
+
+def testEntriesAfterATornJournalEntryReplay(tmp_path):
+
+    store = JournalStore(str(tmp_path / "records.json"))
+
+    store.put(record("a"))
+
+    # A crash mid-append leaves a partial line at the end of the journal.
+    with store.journal.open("ab") as journal:
+
+        journal.write(b'{"op": "put", "record": {"id": "x"')
+
+    store.put(record("b"))
+
+    assert reopened(store).load() == [record("a"), record("b")]
+
+
+def testSynchronousCompaction(tmp_path):
+
+    store = JournalStore(str(tmp_path / "records.json"), compactThreshold=64, compactInBackground=False)
+
+    for i in range(10):
+
+        store.put(record(f"r{i}", i))
+
+    store.remove("r3")
+
+    assert store.journal.stat().st_size <= 64
+    assert store.version() is not None
+    assert reopened(store).load() == store.load() == [record(f"r{i}", i) for i in range(10) if i != 3]
+
+
+def testLookupsReuseTheParsedRecords(store, monkeypatch):
+
+    store.load()
+
+    monkeypatch.setattr(type(store), "_snapshotRecords", failing)
+
+    assert store.get("a") == record("a")
+    assert store.get("z") is None
+    assert store.contains("b") and not store.contains("z")
+    assert store.existing(["z", "b", "a"]) == ["b", "a"]
+    assert store.getMany(["a", "z"]) == {"a": record("a")}
+
+
+def testSeesWritesFromAnotherInstance(store):
+
+    other = reopened(store)
+
+    assert other.get("c") is None
+
+    store.put(record("c", 1))
+    store.remove("a")
+
+    assert other.get("c") == record("c", 1)
+    assert other.load() == [record("b"), record("c", 1)]
+
+    # A rewrite with the same size still changes the stamp through mtime.
+    store.put(record("c", 2))
+
+    assert other.get("c") == record("c", 2)
@@ -0,0 +1,124 @@
+import random
+from App.utils.Store import Store
+from App.utils.JournalStore import JournalStore
+from App.utils.StoreIndex import StoreIndex
+from App.utils.RoomRepo import ROOM_LAYOUT, ROOM_FIELDS
+
+
+KEYS     = ["rateType", "addOns"]
+FILTERS  = [{}, {"rateType": "Flat Rate"}, {"addOns": "a1"}, {"rateType": "Fixed Rate", "addOns": "a2"}]
+PREFIXES = [None, "Room 1", "Room 2"]
+
+
+def room(i, rng):
+
+    return {
+        "id": f"r{i:03}",
+        "name": f"Room {rng.randrange(40)}",
+        "rate": {"rateType": rng.choice(["Fixed Rate", "Flat Rate"]), "params": {"Rate": i}},
+        "addOns": rng.sample(["a1", "a2", "a3"], rng.randrange(3))
+    }
+
+
+def results(index):
+
+    return [
+        (index.select(filters, prefix), index.fetch(index.select(filters, prefix), ["id", "name", *KEYS]))
+        for filters in FILTERS
+        for prefix in PREFIXES
+    ]
+
+
+def rebuilt(store):
+
+    # A fresh index on a fresh store instance has no state of its own.
+    index = StoreIndex(type(store)(str(store.file), ROOM_LAYOUT), ROOM_FIELDS, KEYS)
+
+    index.path.unlink(missing_ok=True)
+
+    return index
+
+
+def testIncrementalUpdatesMatchARebuild(tmp_path):
+
+    rng   = random.Random(3)
+    store = JournalStore(str(tmp_path / "rooms.json"), ROOM_LAYOUT)
+    index = StoreIndex(store, ROOM_FIELDS, KEYS)
+
+    store.save([room(i, rng) for i in range(50)])
+
+    assert index.select({}) == [f"r{i:03}" for i in range(50)]
+
+    for step in range(60):
+
+        with store.transaction():
+
+            store.put(room(rng.randrange(80), rng))
+
+            if step % 3 == 0:
+
+                store.remove(f"r{rng.randrange(80):03}")
+
+        assert results(index) == results(rebuilt(store))
+
+
+def testPagesFollowTheCursor(tmp_path):
+
+    store = Store(str(tmp_path / "rooms.json"), ROOM_LAYOUT)
+    index = StoreIndex(store, ROOM_FIELDS, KEYS)
+
+    store.save([room(i, random.Random(i)) for i in range(25)])
+
+    pages = [index.select({}, limit=10)]
+
+    while pages[-1]:
+
+        pages.append(index.select({}, limit=10, after=pages[-1][-1]))
+
+    assert sum(pages, []) == index.select({})
+    assert [len(page) for page in pages] == [10, 10, 5, 0]
+
+
+def testLoadsTheSavedIndex(tmp_path, monkeypatch):
+
+    rng   = random.Random(5)
+    store = Store(str(tmp_path / "rooms.json"), ROOM_LAYOUT)
+    index = StoreIndex(store, ROOM_FIELDS, KEYS)
+
+    store.save([room(i, rng) for i in range(30)])
+
+    expected = results(index)
+
+    assert index.path.exists()
+
+    # Another process finds the saved index and never projects the store.
+    loaded = StoreIndex(Store(str(store.file), ROOM_LAYOUT), ROOM_FIELDS, KEYS)
+
+    monkeypatch.setattr("App.utils.StoreIndex.projectStore", None)
+
+    assert results(loaded) == expected
+
+
+def testRebuildsAStaleOrCorruptIndex(tmp_path):
+
+    rng   = random.Random(7)
+    store = Store(str(tmp_path / "rooms.json"), ROOM_LAYOUT)
+    index = StoreIndex(store, ROOM_FIELDS, KEYS)
+
+    store.save([room(i, rng) for i in range(30)])
+    index.select({})
+
+    saved = index.path.read_bytes()
+
+    store.put(room(99, rng))
+
+    assert index.select({})[-1] == "r099"
+
+    # The saved index predates the write, so like a torn file it is rebuilt.
+    for data in (saved, saved[:len(saved) // 2], b"garbage"):
+
+        index.path.write_bytes(data)
+
+        fresh = StoreIndex(Store(str(store.file), ROOM_LAYOUT), ROOM_FIELDS, KEYS)
+
+        assert results(fresh) == results(index)
@@ -0,0 +1,98 @@
+import sys
+import timeit
+from dataclasses import fields
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from API import API
+from API.DTOs import InvoiceDTO, DTO_MAP
+
+
+def reflectiveDecode(api, DTOCls, json):
+
+    kwargs = {}
+
+    for field in fields(DTOCls):
+
+        key = field.name
+
+        if key not in json:
+
+            continue
+
+        val = json[key]
+
+        if key in DTO_MAP:
+
+            cls = DTO_MAP[key]
+
+            if isinstance(val, list):
+
+                kwargs[key] = [reflectiveDecode(api, cls, item) for item in val]
+
+            else:
+
+                kwargs[key] = reflectiveDecode(api, cls, val)
+
+        else:
+
+            kwargs[key] = val
+
+    return DTOCls(**kwargs)
+
+
+def invoiceJSON(roomCount, addOnCount):
+
+    addOns = [
+        {"id": f"addOn{i}", "name": f"Add-On {i}", "rate": {"rateType": "Flat Rate", "params": {"Rate": 5}}}
+        for i in range(addOnCount)
+    ]
+
+    return {
+        "invoiceNum": 1,
+        "payee": "Payee",
+        "dateCreated": "2024-01-01",
+        "dateDue": "2024-01-31",
+        "invoiceable": {
+            "rooms": [
+                {
+                    "id": f"room{i}",
+                    "name": f"Room {i}",
+                    "rate": {"rateType": "Fixed Rate", "params": {"Rate": 20}},
+                    "addOns": addOns
+                }
+                for i in range(roomCount)
+            ],
+            "addOns": addOns,
+            "t": 3
+        },
+        "discounts": [{"discountType": "Room Bundle Discount", "params": {"room bundle names": [], "rate": 0.1}}]
+    }
+
+
+def main():
+
+    api = API()
+
+    for roomCount, addOnCount in ((1, 1), (10, 5), (100, 10)):
+
+        json   = invoiceJSON(roomCount, addOnCount)
+        number = max(1, 20000 // (roomCount * addOnCount))
+
+        assert reflectiveDecode(api, InvoiceDTO, json) == api._jsonToDTO(InvoiceDTO, json)
+
+        reflective = min(timeit.repeat(lambda: reflectiveDecode(api, InvoiceDTO, json), number=number, repeat=5))
+        compiled   = min(timeit.repeat(lambda: api._jsonToDTO(InvoiceDTO, json), number=number, repeat=5))
+
+        print(
+            f"{roomCount:>4} rooms x {addOnCount:>3} add-ons: "
+            f"reflective {reflective / number * 1e6:9.1f} us/invoice, "
+            f"compiled {compiled / number * 1e6:9.1f} us/invoice, "
+            f"{reflective / compiled:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+
+    main()
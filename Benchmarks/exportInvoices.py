@@ -0,0 +1,87 @@
+import sys
+import json
+import time
+import tempfile
+import tracemalloc
+from dataclasses import asdict, replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from API import API
+from Invoices import NDJSONInvoiceWriter, CSVInvoiceWriter
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+from decodeDTOs import invoiceJSON
+
+
+def dumpsNDJSON(file, invoices):
+
+    for invoice in invoices:
+
+        file.write(json.dumps(asdict(invoice), default=lambda value: value.isoformat()) + "\n")
+
+
+def writerExport(Writer):
+
+    def export(file, invoices):
+
+        with Writer(file) as writer:
+
+            writer.writeMany(invoices)
+
+    return export
+
+
+def run(export, invoices):
+
+    with tempfile.TemporaryFile("w", newline="") as file:
+
+        start = time.perf_counter()
+
+        export(file, invoices)
+
+        file.flush()
+
+        return time.perf_counter() - start, file.tell()
+
+
+def main(count=50000):
+
+    api = API()
+
+    registerDefaultRates(api)
+    registerDefaultDiscounts(api)
+
+    template = next(api.buildInvoicesFromJSON([invoiceJSON(10, 5)]))
+
+    def invoices():
+
+        return (replace(template, invoiceNum=i) for i in range(count))
+
+    exporters = (
+        ("json.dumps  ", dumpsNDJSON),
+        ("NDJSON      ", writerExport(NDJSONInvoiceWriter)),
+        ("CSV         ", writerExport(CSVInvoiceWriter))
+    )
+
+    print(f"{count} invoices x {len(template.invoiceItems)} lines")
+
+    for label, export in exporters:
+
+        took, written = run(export, invoices())
+
+        tracemalloc.start()
+
+        run(export, invoices())
+
+        peak = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.stop()
+
+        print(f"{label}: {count / took:9.0f} invoices/s, {written / took / 1e6:6.1f} MB/s, peak {peak / 1024:7.1f} KiB")
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,83 @@
+import sys
+import tracemalloc
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from API import API
+from Invoices import ColumnarInvoice, StringTable
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+from decodeDTOs import invoiceJSON
+
+
+@dataclass(frozen=True)
+class DictInvoiceLine:
+
+    name: str
+    rate: str
+    quantity: float
+    subtotal: float
+
+
+def measure(build):
+
+    tracemalloc.start()
+
+    before = tracemalloc.get_traced_memory()[0]
+    built  = build()
+    after  = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    return after - before, built
+
+
+def main(count=2000):
+
+    api = API()
+
+    registerDefaultRates(api)
+    registerDefaultDiscounts(api)
+
+    template = next(api.buildInvoicesFromJSON([invoiceJSON(10, 5)]))
+    rows     = [tuple(getattr(line, field.name) for field in fields(line)) for line in template.invoiceItems]
+
+    def dictInvoices():
+
+        return [
+            replace(template, invoiceNum=i, invoiceItems=[DictInvoiceLine(*row) for row in rows])
+            for i in range(count)
+        ]
+
+    def slottedInvoices():
+
+        return [
+            replace(template, invoiceNum=i, invoiceItems=[type(template.invoiceItems[0])(*row) for row in rows])
+            for i in range(count)
+        ]
+
+    table = StringTable()
+
+    def columnarInvoices():
+
+        return [ColumnarInvoice.fromInvoice(invoice, table) for invoice in slottedInvoices()]
+
+    baseline, _ = measure(dictInvoices)
+
+    print(f"{count} invoices x {len(rows)} lines")
+    print(f"dict lines    : {baseline / count:9.0f} bytes/invoice")
+
+    for label, build in (("slotted lines", slottedInvoices), ("columnar     ", columnarInvoices)):
+
+        size, built = measure(build)
+
+        assert all(invoice.invoiceItems == template.invoiceItems for invoice in built)
+
+        print(f"{label} : {size / count:9.0f} bytes/invoice ({1 - size / baseline:5.1%} smaller)")
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,93 @@
+import sys
+import time
+from datetime import date
+from decimal import Decimal, ROUND_HALF_EVEN
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from API import API
+from Invoices import FixedPoint, InvoiceBuilder, PricingEngine
+from Invoiceables import Invoiceable
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+from decodeDTOs import invoiceJSON
+
+
+CENT = Decimal("0.01")
+
+
+def toDecimal(invoice):
+
+    lines     = [Decimal(line.subtotal).quantize(CENT, ROUND_HALF_EVEN) for line in invoice.invoiceItems]
+    subtotal  = sum(lines, Decimal(0))
+    discounts = [Decimal(line.amount).quantize(CENT, ROUND_HALF_EVEN) for line in invoice.discountItems]
+
+    return lines, subtotal, discounts, subtotal - sum(discounts, Decimal(0))
+
+
+def invoiceables(api, count):
+
+    built = []
+
+    for invoiceNum in range(count):
+
+        spec = invoiceJSON(10, 5)
+
+        for index, room in enumerate(spec["invoiceable"]["rooms"]):
+
+            room["rate"] = {"rateType": "Fixed Rate", "params": {"Rate": 19.99 + (invoiceNum + index) % 97 * 0.13}}
+
+        rooms  = [api.buildRoomFromJSON(room) for room in spec["invoiceable"]["rooms"]]
+        addOns = [api.buildAddOnFromJSON(addOn) for addOn in spec["invoiceable"]["addOns"]]
+
+        built.append(Invoiceable(addOns=addOns, rooms=rooms, t=2.5))
+
+    return built, [api.buildDiscountFromJSON(discount) for discount in spec["discounts"]]
+
+
+def run(builder, batch, discounts, postProcess=None):
+
+    today = date.today()
+    start = time.perf_counter()
+
+    for invoiceNum, invoiceable in enumerate(batch):
+
+        invoice = builder.build(invoiceNum, "Payee", today, today, invoiceable, discounts)
+
+        if postProcess is not None:
+
+            postProcess(invoice)
+
+    return len(batch) / (time.perf_counter() - start)
+
+
+def main(count=20000):
+
+    api = API()
+
+    registerDefaultRates(api)
+    registerDefaultDiscounts(api)
+
+    batch, discounts = invoiceables(api, count)
+
+    floatBuilder = InvoiceBuilder(PricingEngine())
+    fixedBuilder = InvoiceBuilder(PricingEngine(money=FixedPoint(100, ROUND_HALF_EVEN)))
+
+    floatRate   = run(floatBuilder, batch, discounts)
+    decimalRate = run(floatBuilder, batch, discounts, toDecimal)
+    fixedRate   = run(fixedBuilder, batch, discounts)
+
+    print(f"{count} invoices x 15 lines")
+    print(f"float        : {floatRate:9.0f} invoices/s")
+    print(f"float+Decimal: {decimalRate:9.0f} invoices/s")
+    print(f"fixed-point  : {fixedRate:9.0f} invoices/s ({fixedRate / decimalRate:4.2f}x float+Decimal)")
+
+    lines = [0.1] * 1000
+
+    print(f"1000 x 0.10 : float sum {sum(lines)!r}, fixed-point {sum(map(FixedPoint().toMinor, lines))} cents")
+
+
+if __name__ == "__main__":
+
+    main()
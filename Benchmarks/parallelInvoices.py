@@ -0,0 +1,47 @@
+import sys
+import json
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from API import API, InvoicePool
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+from decodeDTOs import invoiceJSON
+
+
+def invoices(count):
+
+    for invoiceNum in range(count):
+
+        yield json.dumps({**invoiceJSON(10, 5), "invoiceNum": invoiceNum})
+
+
+def main(count=20000):
+
+    api = API()
+
+    registerDefaultRates(api)
+    registerDefaultDiscounts(api)
+
+    start  = time.perf_counter()
+    serial = sum(1 for _ in api.buildInvoicesFromJSON(invoices(count)))
+    base   = time.perf_counter() - start
+
+    print(f"serial    : {serial / base:10.0f} invoices/s")
+
+    for workers in sorted({1, 2, 4, 8, 16, 32}):
+
+        with InvoicePool(workers=workers, chunkSize=256) as pool:
+
+            start = time.perf_counter()
+            built = sum(1 for _ in pool.buildInvoicesFromJSON(invoices(count)))
+            took  = time.perf_counter() - start
+
+        print(f"{workers:>2} workers: {built / took:10.0f} invoices/s ({base / took:4.1f}x serial)")
+
+
+if __name__ == "__main__":
+
+    main()
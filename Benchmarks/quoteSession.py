@@ -0,0 +1,75 @@
+import sys
+import timeit
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from API import API
+from Invoiceables import Invoiceable
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+
+
+def main():
+
+    api = API()
+
+    registerDefaultRates(api)
+    registerDefaultDiscounts(api)
+
+    today     = date.today()
+    discounts = [
+        {"discountType": "Room Bundle Discount", "params": {"room bundle names": [f"Room {i}", f"Room {i + 1}"], "rate": 0.05}}
+        for i in range(0, 20, 2)
+    ]
+
+    for basketSize in (10, 100, 1000):
+
+        rooms = [
+            api.buildRoomFromJSON({
+                "id": f"room{i}",
+                "name": f"Room {i}",
+                "rate": {"rateType": "Fixed Rate", "params": {"Rate": 20 + i % 7}},
+                "addOns": []
+            })
+            for i in range(basketSize + 1)
+        ]
+
+        quote = api.startQuote(discounts, 3)
+
+        for room in rooms[:-1]:
+
+            quote.addRoom(room)
+
+        def incremental():
+
+            quote.addRoom(rooms[-1])
+
+            quote.total
+
+            quote.removeRoom(rooms[-1])
+
+            quote.total
+
+        def rebuild():
+
+            for selection in (rooms, rooms[:-1]):
+
+                api._invoiceBuilder.build(
+                    1, "Payee", today, today, Invoiceable(addOns=[], rooms=selection, t=3), quote.discounts
+                )
+
+        number      = max(1, 20000 // basketSize)
+        incremented = min(timeit.repeat(incremental, number=number, repeat=5)) / (2 * number)
+        rebuilt     = min(timeit.repeat(rebuild, number=number, repeat=5)) / (2 * number)
+
+        print(
+            f"{basketSize:>5} rooms: rebuild {rebuilt * 1e6:8.1f} us/change, "
+            f"incremental {incremented * 1e6:8.1f} us/change, {rebuilt / incremented:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,60 @@
+import sys
+import random
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from API import API
+from Rentables.utils import registerDefaultRates
+
+
+def loopTiers(breakpoints, rates, t):
+
+    cost  = 0.0
+    start = 0.0
+
+    for end, rate in zip([*breakpoints, float("inf")], rates):
+
+        if t <= start:
+
+            break
+
+        cost += rate * (min(t, end) - start)
+        start = end
+
+    return cost
+
+
+def main():
+
+    api = API()
+
+    registerDefaultRates(api)
+
+    rng = random.Random(0)
+
+    for tierCount in (2, 8, 32, 128):
+
+        breakpoints = sorted(rng.sample(range(1, 10 * tierCount), tierCount - 1))
+        rates       = [rng.uniform(1, 50) for _ in range(tierCount)]
+        ts          = [rng.uniform(0, 10 * tierCount) for _ in range(1000)]
+        rate        = api.buildRateFromJSON({"rateType": "Tiered Rate", "params": {"Breakpoints": breakpoints, "Rates": rates}})
+
+        assert all(abs(rate.calculate(t) - loopTiers(breakpoints, rates, t)) < 1e-6 for t in ts)
+
+        looped   = min(timeit.repeat(lambda: [loopTiers(breakpoints, rates, t) for t in ts], number=20, repeat=5))
+        bisected = min(timeit.repeat(lambda: [rate.calculate(t) for t in ts], number=20, repeat=5))
+        many     = min(timeit.repeat(lambda: rate.calculateMany(ts), number=20, repeat=5))
+        nanos    = 1e9 / (20 * len(ts))
+
+        print(
+            f"{tierCount:>4} tiers: loop {looped * nanos:7.1f} ns/t, "
+            f"bisect {bisected * nanos:7.1f} ns/t ({looped / bisected:5.1f}x), "
+            f"calculateMany {many * nanos:6.1f} ns/t"
+        )
+
+
+if __name__ == "__main__":
+
+    main()
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, Any
+from typing import TYPE_CHECKING, Dict, FrozenSet, Any
 from Rentables.utils import Param
 from Discounts import Discount
 from Invoiceables import Invoiceable
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from API import API
 
 
-def registerDefaultDiscounts(api: API):
+def registerDefaultDiscounts(api: "API"):
 
     @api.registerDiscount(
         "Room Bundle Discount",
@@ -28,7 +28,7 @@ def registerDefaultDiscounts(api: API):
     )
     def buildRoomBundleDiscount(params: Dict[str, Any]) -> Discount:
 
-        roomBundleNames = params["room bundle names"]
+        roomBundleNames = frozenset(params["room bundle names"])
         rate            = float(params["rate"])
 
 
@@ -37,9 +37,12 @@ def registerDefaultDiscounts(api: API):
 
             def applies(self, invoiceable: Invoiceable) -> bool:
 
-                selectedNames = {room.name for room in invoiceable.rooms}
+                return roomBundleNames.issubset(room.name for room in invoiceable.rooms)
 
-                return set(roomBundleNames).issubset(selectedNames)
+
+            def requiredRoomNames(self) -> FrozenSet[str]:
+
+                return roomBundleNames
             
 
         return _RoomBundleDiscount(
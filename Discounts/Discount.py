@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Callable
+from typing import Callable, FrozenSet, Optional
 from Invoiceables import Invoiceable
 
 
@@ -27,6 +27,9 @@ class Discount(ABC):
 
     rate(subtotal: float) -> float
         Computes the discounted rental cost.
+
+    requiredRoomNames() -> Optional[FrozenSet[str]]
+        Returns the room names whose selection makes this discount apply, if known.
     """
 
 
@@ -53,6 +56,23 @@ class Discount(ABC):
         pass
 
 
+    def requiredRoomNames(self) -> Optional[FrozenSet[str]]:
+        """
+        Returns the room names whose selection makes this discount apply, if known.
+
+        Discounts that return a set promise that applies() is True exactly when
+        every named room is selected, which lets a DiscountIndex match them
+        without calling applies(). The default, None, keeps applies() opaque.
+
+        Returns
+        -------
+        Optional[FrozenSet[str]]
+            The required room names, or None if eligibility depends on more.
+        """
+
+        return None
+
+
     def rate(self, subtotal: float) -> float:
         """
         Computes the discounted rental cost.
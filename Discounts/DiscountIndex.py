@@ -0,0 +1,97 @@
+from typing import Dict, List, Sequence, Tuple
+from Invoiceables import Invoiceable
+from .Discount import Discount
+
+
+class DiscountIndex:
+    """
+    Matches invoiceables against a fixed list of discounts without calling
+    applies() on every discount.
+
+    Each room name required by a discount is given a bit position, and each
+    such discount is compiled to the bitmask of its required rooms. An
+    inverted index from room name to the discounts requiring it yields the
+    candidates for a room selection, and a candidate applies when the
+    selection's mask covers its own. Discounts without declared requirements
+    (see Discount.requiredRoomNames) fall back to applies().
+
+    Methods
+    -------
+    applicable(invoiceable: Invoiceable) -> List[Discount]
+        Returns the discounts that apply to an invoiceable, in their original order.
+    """
+
+
+    def __init__(self, discounts: Sequence[Discount]):
+
+        self.discounts = list(discounts)
+
+        self._bits: Dict[str, int]               = {}
+        self._masks: Dict[int, int]              = {}
+        self._byRoom: Dict[str, List[int]]       = {}
+        self._always: List[int]                  = []
+        self._opaque: List[Tuple[int, Discount]] = []
+
+        for position, discount in enumerate(self.discounts):
+
+            required = discount.requiredRoomNames()
+
+            if required is None:
+
+                self._opaque.append((position, discount))
+
+                continue
+
+            if not required:
+
+                self._always.append(position)
+
+                continue
+
+            mask = 0
+
+            for name in required:
+
+                mask |= self._bits.setdefault(name, 1 << len(self._bits))
+
+                self._byRoom.setdefault(name, []).append(position)
+
+            self._masks[position] = mask
+
+
+    def applicable(self, invoiceable: Invoiceable) -> List[Discount]:
+        """
+        Returns the discounts that apply to an invoiceable, in their original order.
+
+        Parameters
+        ----------
+        invoiceable : Invoiceable
+            The invoiceable entity to match.
+
+        Returns
+        -------
+        List[Discount]
+            The applicable discounts.
+        """
+
+        selected   = 0
+        candidates = set(self._always)
+
+        for room in invoiceable.rooms:
+
+            bit = self._bits.get(room.name)
+
+            if bit is not None and not selected & bit:
+
+                selected |= bit
+
+                candidates.update(self._byRoom[room.name])
+
+        matched = [
+            position for position in candidates
+            if position not in self._masks or selected & self._masks[position] == self._masks[position]
+        ]
+
+        matched.extend(position for position, discount in self._opaque if discount.applies(invoiceable))
+
+        return [self.discounts[position] for position in sorted(matched)]
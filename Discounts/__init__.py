@@ -1,5 +1,6 @@
 from .Discount import Discount
 from .DiscountRegistry import DiscountRegistry
+from .DiscountIndex import DiscountIndex
 from .DefaultDiscounts import registerDefaultDiscounts
 
-__all__ = ["Discount", "DiscountRegistry", "registerDefaultDiscounts"]
+__all__ = ["Discount", "DiscountRegistry", "DiscountIndex", "registerDefaultDiscounts"]
@@ -0,0 +1,87 @@
+import random
+from dataclasses import dataclass
+from Invoiceables import Invoiceable
+from Invoices import PricingEngine
+from Invoices.PricingEngine import DISCOUNT_INDEX_CACHE_SIZE
+from Discounts import Discount
+from Discounts.DiscountIndex import DiscountIndex
+
+
+NAMES = [f"Room {i}" for i in range(8)]
+
+
+@dataclass(frozen=True)
+class LongStayDiscount(Discount):
+
+
+    minimum: float = 0
+
+
+    def applies(self, invoiceable: Invoiceable) -> bool:
+
+        return invoiceable.t >= self.minimum
+
+
+def bundle(api, names, rate=0.1):
+
+    return api.buildDiscountFromJSON({"discountType": "Room Bundle Discount", "params": {"room bundle names": names, "rate": rate}})
+
+
+def discounts(api, rng):
+
+    return [
+        *(bundle(api, rng.sample(NAMES, rng.randrange(4)), rng.random()) for _ in range(12)),
+        LongStayDiscount(name="Long Stay", rateFunc=lambda subtotal: subtotal * 0.05, minimum=5)
+    ]
+
+
+def invoiceables(api, rng, count):
+
+    rooms = [
+        api.buildRoomFromJSON({"id": f"r{i}", "name": name, "rate": {"rateType": "Flat Rate", "params": {"Rate": 10}}, "addOns": []})
+        for i, name in enumerate(NAMES + NAMES[:2])
+    ]
+
+    return [Invoiceable(rooms=rng.sample(rooms, rng.randrange(len(rooms))), addOns=[], t=rng.randrange(10)) for _ in range(count)]
+
+
+def testMatchesApplies(api):
+
+    rng = random.Random(19)
+
+    for _ in range(20):
+
+        candidates = discounts(api, rng)
+        index      = DiscountIndex(candidates)
+
+        for invoiceable in invoiceables(api, rng, 50):
+
+            assert index.applicable(invoiceable) == [discount for discount in candidates if discount.applies(invoiceable)]
+
+
+def testEngineMatchesAPlainScan(api):
+
+    rng        = random.Random(4)
+    engine     = PricingEngine()
+    candidates = discounts(api, rng)
+
+    for invoiceable in invoiceables(api, rng, 50):
+
+        subtotal = engine.calculateSubtotal(engine.getInvoiceLines(invoiceable))
+        expected = [discount.name for discount in candidates if discount.applies(invoiceable)]
+        lines    = engine.getDiscountLines(invoiceable, subtotal, candidates)
+
+        assert [line.name for line in lines] == expected
+        assert engine.getDiscountLines(invoiceable, subtotal, DiscountIndex(candidates)) == lines
+
+
+def testCompiledIndexesAreBounded(api):
+
+    engine      = PricingEngine()
+    invoiceable = Invoiceable(rooms=[], addOns=[], t=1)
+
+    for i in range(DISCOUNT_INDEX_CACHE_SIZE * 2):
+
+        engine.getDiscountLines(invoiceable, 10, [bundle(api, [], i / 1000)])
+
+    assert len(engine._discountIndexes) == DISCOUNT_INDEX_CACHE_SIZE
@@ -34,10 +34,22 @@ class Invoiceable:
     def approve(self):
         """
         Checks whether addOns is fully supported by the current room selection in rooms.
+
+        Raises
+        ------
+        ValueError
+            Naming every add-on that no selected room supports.
         """
 
-        for addOn in self.addOns:
+        supported   = frozenset().union(*(room.addOnIDs for room in self.rooms))
+        unsupported = [addOn.name for addOn in self.addOns if addOn.id not in supported]
+
+        if len(unsupported) == 1:
+
+            raise ValueError(f"Add-On '{unsupported[0]}' is not supported for current room selection.")
+
+        if unsupported:
 
-            if not any(room.supports(addOn) for room in self.rooms):
+            names = ", ".join(f"'{name}'" for name in unsupported)
 
-                raise ValueError(f"Add-On '{addOn.name}' is not supported for current room selection.")
+            raise ValueError(f"Add-Ons {names} are not supported for current room selection.")
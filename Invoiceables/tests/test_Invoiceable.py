@@ -0,0 +1,67 @@
+import random
+import pytest
+from Rentables import AddOn, Room
+from Invoiceables import Invoiceable
+
+
+def addOns(api, count):
+
+    rate = api.buildRateFromJSON({"rateType": "Flat Rate", "params": {"Rate": 5}})
+
+    return [AddOn(id=f"a{i}", name=f"Add-On {i}", rate=rate) for i in range(count)]
+
+
+def rooms(api, available, rng, count):
+
+    rate = api.buildRateFromJSON({"rateType": "Fixed Rate", "params": {"Rate": 20}})
+
+    return [Room(id=f"r{i}", name=f"Room {i}", rate=rate, addOns=tuple(rng.sample(available, rng.randrange(4)))) for i in range(count)]
+
+
+def testMatchesPerRoomSupport(api):
+
+    rng       = random.Random(20)
+    available = addOns(api, 10)
+
+    for _ in range(200):
+
+        selected    = rooms(api, available, rng, rng.randrange(4))
+        wanted      = rng.sample(available, rng.randrange(4))
+        unsupported = [addOn for addOn in wanted if not any(room.supports(addOn) for room in selected)]
+
+        if not unsupported:
+
+            Invoiceable(addOns=wanted, rooms=selected, t=1).approve()
+
+            continue
+
+        with pytest.raises(ValueError) as error:
+
+            Invoiceable(addOns=wanted, rooms=selected, t=1).approve()
+
+        assert all(f"'{addOn.name}'" in str(error.value) for addOn in unsupported)
+
+
+def testMessages(api):
+
+    available = addOns(api, 3)
+    room      = Room(id="r", name="Room", rate=available[0].rate, addOns=(available[0],))
+
+    with pytest.raises(ValueError, match=r"^Add-On 'Add-On 1' is not supported for current room selection\.$"):
+
+        Invoiceable(addOns=available[:2], rooms=[room], t=1).approve()
+
+    with pytest.raises(ValueError, match=r"^Add-Ons 'Add-On 1', 'Add-On 2' are not supported"):
+
+        Invoiceable(addOns=available, rooms=[room], t=1).approve()
+
+
+def testSupportIsByID(api):
+
+    available = addOns(api, 1)
+    room      = Room(id="r", name="Room", rate=available[0].rate, addOns=tuple(available))
+    renamed   = AddOn(id="a0", name="Renamed", rate=available[0].rate)
+
+    assert room.supports(renamed)
+    assert room.addOnIDs == {"a0"}
+    assert not Room(id="s", name="Bare", rate=available[0].rate).supports(renamed)
@@ -0,0 +1,142 @@
+from typing import List, Sequence, Any
+from .InvoiceLine import InvoiceLine
+from .DiscountLine import DiscountLine
+
+
+class BatchPricing:
+    """
+    Holds the priced lines and totals of a batch of invoiceables in columnar form.
+
+    Line columns are laid out invoice by invoice, so the lines of invoice i
+    occupy the slice lineOffsets[i]:lineOffsets[i + 1] (and likewise for
+    discounts). Columns are NumPy arrays when the batch was priced with NumPy,
+    and lists otherwise. Under a money policy, subtotals, discounted amounts
+    and totals are integer minor units.
+
+    Attributes
+    ----------
+    lineNames : List[str]
+        The name of the rentable on each invoice line.
+
+    lineRates : List[str]
+        The name of the rate applied on each invoice line.
+
+    lineQuantities : Sequence[float]
+        The quantity of time rented on each invoice line.
+
+    lineSubtotals : Sequence[float]
+        The rental cost subtotal of each invoice line.
+
+    lineOffsets : List[int]
+        Where each invoice's lines start, followed by the total line count.
+
+    discountNames : List[str]
+        The name of each applied discount.
+
+    discountAmounts : Sequence[float]
+        The discounted amount of each applied discount.
+
+    discountOffsets : List[int]
+        Where each invoice's discounts start, followed by the total discount count.
+
+    subtotals : Sequence[float]
+        The subtotal of each invoice.
+
+    totals : Sequence[float]
+        The total of each invoice.
+
+    Methods
+    -------
+    getInvoiceLines(index: int) -> List[InvoiceLine]
+        Builds the invoice line items of one invoice.
+
+    getDiscountLines(index: int) -> List[DiscountLine]
+        Builds the discount line items of one invoice.
+    """
+
+
+    def __init__(
+            self,
+            lineNames: List[str],
+            lineRates: List[str],
+            lineQuantities: Sequence[float],
+            lineSubtotals: Sequence[float],
+            lineOffsets: List[int],
+            discountNames: List[str],
+            discountAmounts: Sequence[float],
+            discountOffsets: List[int],
+            subtotals: Sequence[float],
+            totals: Sequence[float]
+    ):
+
+        self.lineNames       = lineNames
+        self.lineRates       = lineRates
+        self.lineQuantities  = lineQuantities
+        self.lineSubtotals   = lineSubtotals
+        self.lineOffsets     = lineOffsets
+        self.discountNames   = discountNames
+        self.discountAmounts = discountAmounts
+        self.discountOffsets = discountOffsets
+        self.subtotals       = subtotals
+        self.totals          = totals
+
+
+    def __len__(self) -> int:
+
+        return len(self.lineOffsets) - 1
+
+
+    def getInvoiceLines(self, index: int) -> List[InvoiceLine]:
+        """
+        Builds the invoice line items of one invoice.
+
+        Parameters
+        ----------
+        index : int
+            The position of the invoiceable in the priced batch.
+
+        Returns
+        -------
+        List[InvoiceLine]
+            The invoice line items, as PricingEngine.getInvoiceLines would produce them.
+        """
+
+        start, end = self.lineOffsets[index], self.lineOffsets[index + 1]
+
+        return [
+            InvoiceLine(
+                name=self.lineNames[line],
+                rate=self.lineRates[line],
+                quantity=_scalar(self.lineQuantities[line]),
+                subtotal=_scalar(self.lineSubtotals[line])
+            )
+            for line in range(start, end)
+        ]
+
+
+    def getDiscountLines(self, index: int) -> List[DiscountLine]:
+        """
+        Builds the discount line items of one invoice.
+
+        Parameters
+        ----------
+        index : int
+            The position of the invoiceable in the priced batch.
+
+        Returns
+        -------
+        List[DiscountLine]
+            The discount line items, as PricingEngine.getDiscountLines would produce them.
+        """
+
+        start, end = self.discountOffsets[index], self.discountOffsets[index + 1]
+
+        return [
+            DiscountLine(name=self.discountNames[line], amount=_scalar(self.discountAmounts[line]))
+            for line in range(start, end)
+        ]
+
+
+def _scalar(value: Any) -> Any:
+
+    return value.item() if hasattr(value, "item") else value
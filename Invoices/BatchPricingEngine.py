@@ -0,0 +1,257 @@
+from itertools import chain
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+import math
+from Invoiceables import Invoiceable
+from Discounts import Discount, DiscountIndex
+from Rentables.utils import Rate
+from .BatchPricing import BatchPricing
+from .FixedPoint import FixedPoint
+
+try:
+
+    import numpy
+
+except ImportError:
+
+    numpy = None
+
+
+class BatchPricingEngine:
+    """
+    Prices many Invoiceable objects at once in columnar passes.
+
+    Every room and add-on of the batch becomes one row of flat line columns.
+    Rows whose rate type provides a batchFunc are grouped by rate type, and
+    each type is evaluated with a single call over a column per param and a
+    column of durations, however many distinct price points it has. Other
+    rows are grouped by rate and evaluated with Rate.calculateMany.
+    Subtotals, discounts and totals are then reduced per invoice. With NumPy
+    the columns are arrays; without it (or with useNumpy=False) the same
+    passes run over plain lists.
+
+    A PricingCache is not consulted: every rate type is evaluated once per
+    batch, so repeated price points cost no more than distinct ones.
+
+    Attributes
+    ----------
+    useNumpy : bool
+        Whether batches are priced with NumPy.
+
+    money : Optional[FixedPoint]
+        An opt-in fixed-point money policy, applied exactly as PricingEngine
+        applies it, so that line subtotals, discounted amounts, subtotals and
+        totals are integer minor units.
+
+    Methods
+    -------
+    price(invoiceables: Sequence[Invoiceable], discounts: Optional[Sequence[Sequence[Discount]]]) -> BatchPricing
+        Prices a batch of invoiceables.
+    """
+
+
+    def __init__(self, useNumpy: Optional[bool] = None, money: Optional[FixedPoint] = None):
+
+        if useNumpy and numpy is None:
+
+            raise ValueError("NumPy is not installed")
+
+        self.useNumpy = numpy is not None if useNumpy is None else useNumpy
+        self.money    = money
+
+
+    def _evaluate(self, rates: List[Rate], quantities: List[float]) -> Sequence[float]:
+
+        if not self.useNumpy:
+
+            return [rate.calculate(t) for rate, t in zip(rates, quantities)]
+
+        groups: Dict[Hashable, Tuple[Rate, List[int]]] = {}
+
+        for row, rate in enumerate(rates):
+
+            if rate.batchFunc is not None:
+
+                key = (rate.name, rate.batchFunc)
+
+            else:
+
+                key = rate.fingerprint if rate.fingerprint is not None else id(rate)
+
+            groups.setdefault(key, (rate, []))[1].append(row)
+
+        ts        = numpy.asarray(quantities, dtype=float)
+        subtotals = numpy.empty(len(quantities), dtype=float)
+
+        for rate, rows in groups.values():
+
+            rows = numpy.asarray(rows, dtype=numpy.intp)
+
+            if rate.batchFunc is None:
+
+                subtotals[rows] = rate.calculateMany(ts[rows])
+
+                continue
+
+            kind    = [rates[row] for row in rows.tolist()]
+            columns = {name: [each.params.get(name) for each in kind] for name in rate.params}
+
+            subtotals[rows] = rate.batchFunc(columns, ts[rows])
+
+        return subtotals
+
+
+    def _toMinor(self, values: Sequence[float]) -> Sequence[int]:
+
+        if not self.useNumpy:
+
+            return [self.money.toMinor(value) for value in values]
+
+        return numpy.fromiter(map(self.money.toMinor, values.tolist()), dtype=numpy.int64, count=len(values))
+
+
+    def _discountAmount(self, discount: Discount, subtotal: float) -> float:
+
+        if self.money is None:
+
+            return discount.rate(subtotal)
+
+        return self.money.toMinor(discount.rate(self.money.toMajor(subtotal)))
+
+
+    def _subtotalPerInvoice(self, values: Sequence[float], offsets: List[int]) -> Sequence[float]:
+
+        if self.money is not None:
+
+            return self._sumPerInvoice(values, offsets)
+
+        # Float subtotals are correctly rounded with math.fsum, as
+        # PricingEngine.calculateSubtotal computes them, so that they are
+        # bit-identical to the scalar engine's.
+        values = values.tolist() if self.useNumpy else values
+        sums   = [math.fsum(values[start:end]) for start, end in zip(offsets, offsets[1:])]
+
+        return numpy.asarray(sums, dtype=float) if self.useNumpy else sums
+
+
+    def _sumPerInvoice(self, values: Sequence[float], offsets: List[int]) -> Sequence[float]:
+
+        # Values are added in order, as the sum() in PricingEngine.calculateTotal
+        # adds discount amounts; bincount accumulates each bin in order too.
+        if not self.useNumpy:
+
+            return [sum(values[start:end]) for start, end in zip(offsets, offsets[1:])]
+
+        if self.money is not None:
+
+            # Minor units are summed exactly as integers; bincount would
+            # round them through float weights.
+            sums = numpy.concatenate(([0], numpy.cumsum(values, dtype=numpy.int64)))
+
+            return sums[offsets[1:]] - sums[offsets[:-1]]
+
+        counts = numpy.diff(offsets)
+        owners = numpy.repeat(numpy.arange(len(counts)), counts)
+
+        return numpy.bincount(owners, weights=values, minlength=len(counts))
+
+
+    def price(
+            self,
+            invoiceables: Sequence[Invoiceable],
+            discounts: Optional[Sequence[Sequence[Discount]]] = None
+    ) -> BatchPricing:
+        """
+        Prices a batch of invoiceables.
+
+        Parameters
+        ----------
+        invoiceables : Sequence[Invoiceable]
+            The invoiceable entities to price.
+
+        discounts : Optional[Sequence[Sequence[Discount]]]
+            The discounts offered to each invoiceable, aligned with invoiceables.
+
+        Returns
+        -------
+        BatchPricing
+            The priced lines and the per-invoice subtotals and totals.
+        """
+
+        if discounts is not None and len(discounts) != len(invoiceables):
+
+            raise ValueError("discounts must hold one list of discounts per invoiceable")
+
+        names: List[str]        = []
+        rates: List[Rate]       = []
+        rateNames: List[str]    = []
+        quantities: List[float] = []
+        offsets: List[int]      = [0]
+
+        for invoiceable in invoiceables:
+
+            for rentable in chain(invoiceable.rooms, invoiceable.addOns):
+
+                names.append(rentable.name)
+                rates.append(rentable.rate)
+                rateNames.append(rentable.rate.name)
+                quantities.append(invoiceable.t)
+
+            offsets.append(len(names))
+
+        lineSubtotals = self._evaluate(rates, quantities)
+
+        if self.money is not None:
+
+            lineSubtotals = self._toMinor(lineSubtotals)
+
+        subtotals = self._subtotalPerInvoice(lineSubtotals, offsets)
+
+        discountNames: List[str]                              = []
+        discountAmounts: List[float]                          = []
+        discountOffsets: List[int]                            = [0]
+        discountIndexes: Dict[Tuple[int, ...], DiscountIndex] = {}
+
+        for index, invoiceable in enumerate(invoiceables):
+
+            offered = discounts[index] if discounts is not None else ()
+            key     = tuple(map(id, offered))
+
+            if key not in discountIndexes:
+
+                discountIndexes[key] = DiscountIndex(offered)
+
+            for discount in discountIndexes[key].applicable(invoiceable):
+
+                discountNames.append(discount.name)
+                discountAmounts.append(self._discountAmount(discount, subtotals[index]))
+
+            discountOffsets.append(len(discountNames))
+
+        amounts = discountAmounts
+
+        if self.useNumpy:
+
+            amounts = numpy.asarray(discountAmounts, dtype=float if self.money is None else numpy.int64)
+
+        discountTotals = self._sumPerInvoice(amounts, discountOffsets)
+
+        if self.useNumpy:
+
+            totals = subtotals - discountTotals
+
+        else:
+
+            totals = [subtotal - discountTotal for subtotal, discountTotal in zip(subtotals, discountTotals)]
+
+        return BatchPricing(
+            lineNames=names,
+            lineRates=rateNames,
+            lineQuantities=quantities,
+            lineSubtotals=lineSubtotals,
+            lineOffsets=offsets,
+            discountNames=discountNames,
+            discountAmounts=amounts,
+            discountOffsets=discountOffsets,
+            subtotals=subtotals,
+            totals=totals
+        )
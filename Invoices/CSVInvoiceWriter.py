@@ -0,0 +1,103 @@
+from datetime import date
+from typing import Dict, TextIO, Union
+import re
+from .Invoice import Invoice
+from .ColumnarInvoice import ColumnarInvoice
+from .InvoiceWriter import InvoiceWriter, ValueEncoder
+
+
+_needsQuotes = re.compile(r'[",\r\n]').search
+
+
+def _encodeString(value: str) -> str:
+
+    if _needsQuotes(value):
+
+        return '"' + value.replace('"', '""') + '"'
+
+    return value
+
+
+class CSVInvoiceWriter(InvoiceWriter):
+    """
+    Streams invoices as flattened CSV, one row per line item.
+
+    Every row repeats the invoice header (invoiceNum, payee, dateCreated,
+    dateDue, subtotal, total) followed by the line columns: lineType is
+    "item" for invoice line items, whose amount is the line subtotal, and
+    "discount" for discount line items, which leave rate and quantity empty.
+    An invoice without any line items is written as a single row with empty
+    line columns. Amounts are in major units, and fields are quoted as the
+    csv module's default dialect would quote them.
+
+    Attributes
+    ----------
+    columns : Tuple[str, ...]
+        The column names, written as the first row when header is True.
+    """
+
+
+    columns = (
+        "invoiceNum",
+        "payee",
+        "dateCreated",
+        "dateDue",
+        "subtotal",
+        "total",
+        "lineType",
+        "name",
+        "rate",
+        "quantity",
+        "amount"
+    )
+
+    valueEncoders: Dict[type, ValueEncoder] = {
+        str: _encodeString,
+        bool: str,
+        int: int.__repr__,
+        float: float.__repr__,
+        date: date.isoformat,
+        type(None): lambda value: ""
+    }
+
+
+    def __init__(
+            self,
+            file: TextIO,
+            bufferSize: int = 1 << 16,
+            header: bool = True,
+            lineTerminator: str = "\r\n"
+    ):
+
+        super().__init__(file, bufferSize)
+
+        self.lineTerminator = lineTerminator
+
+        if header:
+
+            self._append(",".join(self.columns) + lineTerminator)
+
+
+    def encode(self, invoice: Union[Invoice, ColumnarInvoice]) -> str:
+
+        value  = self._encodeValue
+        amount = self._amountEncoder(invoice)
+        end    = self.lineTerminator
+
+        prefix = (
+            f"{value(invoice.invoiceNum)},{value(invoice.payee)},"
+            f"{value(invoice.dateCreated)},{value(invoice.dateDue)},"
+            f"{amount(invoice.subtotal)},{amount(invoice.total)},"
+        )
+
+        rows = [
+            f"{prefix}item,{value(name)},{value(rate)},{value(quantity)},{amount(subtotal)}{end}"
+            for name, rate, quantity, subtotal in self._invoiceLines(invoice)
+        ]
+
+        rows.extend(
+            f"{prefix}discount,{value(line.name)},,,{amount(line.amount)}{end}"
+            for line in invoice.discountItems
+        )
+
+        return "".join(rows) if rows else f"{prefix},,,,{end}"
@@ -0,0 +1,283 @@
+from array import array
+from collections.abc import Sequence
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Union, overload
+from .Invoice import Invoice
+from .InvoiceLine import InvoiceLine
+from .DiscountLine import DiscountLine
+
+
+class StringTable:
+    """
+    Interns strings to small integer ids so that columnar invoices can store
+    repeated names (rooms, add-ons, rates) once across a whole run.
+
+    Methods
+    -------
+    intern(value: str) -> int
+        Returns the id of a string, assigning the next id if it is new.
+    """
+
+
+    __slots__ = ("strings", "_ids")
+
+
+    def __init__(self):
+
+        self.strings: List[str]   = []
+        self._ids: Dict[str, int] = {}
+
+
+    def intern(self, value: str) -> int:
+        """
+        Returns the id of a string, assigning the next id if it is new.
+
+        Parameters
+        ----------
+        value : str
+            The string to intern.
+
+        Returns
+        -------
+        int
+            The string's id.
+        """
+
+        stringID = self._ids.get(value)
+
+        if stringID is None:
+
+            stringID = self._ids[value] = len(self.strings)
+
+            self.strings.append(value)
+
+        return stringID
+
+
+    def __getitem__(self, stringID: int) -> str:
+
+        return self.strings[stringID]
+
+
+    def __len__(self) -> int:
+
+        return len(self.strings)
+
+
+class InvoiceLineColumns(Sequence):
+    """
+    A read-only sequence of InvoiceLine objects stored as parallel arrays of
+    name ids, rate ids, quantities and subtotals. Lines are built on access.
+
+    Attributes
+    ----------
+    table : StringTable
+        The table that the name and rate ids refer to.
+
+    names : array
+        The name id of each line.
+
+    rates : array
+        The rate name id of each line.
+
+    quantities : array
+        The quantity of each line.
+
+    subtotals : array
+        The subtotal of each line, as doubles, or as 64-bit integers when
+        the lines are in integer minor units.
+    """
+
+
+    __slots__ = ("table", "names", "rates", "quantities", "subtotals")
+
+
+    def __init__(self, table: StringTable, lines: List[InvoiceLine], minorUnits: bool = False):
+
+        self.table      = table
+        self.names      = array("I", [table.intern(line.name) for line in lines])
+        self.rates      = array("I", [table.intern(line.rate) for line in lines])
+        self.quantities = array("d", [line.quantity for line in lines])
+        self.subtotals  = array("q" if minorUnits else "d", [line.subtotal for line in lines])
+
+
+    def __len__(self) -> int:
+
+        return len(self.subtotals)
+
+
+    def _line(self, index: int) -> InvoiceLine:
+
+        return InvoiceLine(
+            name=self.table[self.names[index]],
+            rate=self.table[self.rates[index]],
+            quantity=self.quantities[index],
+            subtotal=self.subtotals[index]
+        )
+
+
+    @overload
+    def __getitem__(self, index: int) -> InvoiceLine: ...
+
+
+    @overload
+    def __getitem__(self, index: slice) -> List[InvoiceLine]: ...
+
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[InvoiceLine, List[InvoiceLine]]:
+
+        if isinstance(index, slice):
+
+            return [self._line(line) for line in range(*index.indices(len(self)))]
+
+        if index < 0:
+
+            index += len(self)
+
+        if not 0 <= index < len(self):
+
+            raise IndexError("invoice line index out of range")
+
+        return self._line(index)
+
+
+    def __iter__(self) -> Iterator[InvoiceLine]:
+
+        return map(self._line, range(len(self)))
+
+
+    def __eq__(self, other: object) -> bool:
+
+        if not isinstance(other, Sequence):
+
+            return NotImplemented
+
+        return len(self) == len(other) and all(line == otherLine for line, otherLine in zip(self, other))
+
+
+    def __repr__(self) -> str:
+
+        return f"InvoiceLineColumns({list(self)!r})"
+
+
+class ColumnarInvoice:
+    """
+    A compact, read-only counterpart of Invoice whose invoice line items are
+    held in parallel arrays (see InvoiceLineColumns). It exposes the same
+    attributes as Invoice; line subtotals in integer minor units (when scale
+    is set) are stored as integers, so they round-trip exactly.
+
+    Methods
+    -------
+    fromInvoice(invoice: Invoice, table: StringTable) -> ColumnarInvoice
+        Builds the columnar form of an invoice.
+
+    toInvoice() -> Invoice
+        Builds the equivalent Invoice.
+    """
+
+
+    __slots__ = (
+        "invoiceNum",
+        "payee",
+        "dateCreated",
+        "dateDue",
+        "invoiceItems",
+        "discountItems",
+        "subtotal",
+        "total",
+        "scale"
+    )
+
+
+    def __init__(
+            self,
+            invoiceNum: int,
+            payee: str,
+            dateCreated: date,
+            dateDue: date,
+            invoiceItems: InvoiceLineColumns,
+            discountItems: List[DiscountLine],
+            subtotal: float,
+            total: float,
+            scale: Optional[int] = None
+    ):
+
+        self.invoiceNum    = invoiceNum
+        self.payee         = payee
+        self.dateCreated   = dateCreated
+        self.dateDue       = dateDue
+        self.invoiceItems  = invoiceItems
+        self.discountItems = discountItems
+        self.subtotal      = subtotal
+        self.total         = total
+        self.scale         = scale
+
+
+    @classmethod
+    def fromInvoice(cls, invoice: Invoice, table: StringTable) -> "ColumnarInvoice":
+        """
+        Builds the columnar form of an invoice.
+
+        Parameters
+        ----------
+        invoice : Invoice
+            The invoice to convert.
+
+        table : StringTable
+            The string table shared by the invoices of a run.
+
+        Returns
+        -------
+        ColumnarInvoice
+            The columnar invoice.
+        """
+
+        return cls(
+            invoiceNum=invoice.invoiceNum,
+            payee=invoice.payee,
+            dateCreated=invoice.dateCreated,
+            dateDue=invoice.dateDue,
+            invoiceItems=InvoiceLineColumns(table, invoice.invoiceItems, invoice.scale is not None),
+            discountItems=list(invoice.discountItems),
+            subtotal=invoice.subtotal,
+            total=invoice.total,
+            scale=invoice.scale
+        )
+
+
+    def toInvoice(self) -> Invoice:
+        """
+        Builds the equivalent Invoice.
+
+        Returns
+        -------
+        Invoice
+            The invoice, with its line items as a list of InvoiceLine objects.
+        """
+
+        return Invoice(
+            invoiceNum=self.invoiceNum,
+            payee=self.payee,
+            dateCreated=self.dateCreated,
+            dateDue=self.dateDue,
+            invoiceItems=list(self.invoiceItems),
+            discountItems=list(self.discountItems),
+            subtotal=self.subtotal,
+            total=self.total,
+            scale=self.scale
+        )
+
+
+    def __eq__(self, other: object) -> bool:
+
+        if not isinstance(other, (Invoice, ColumnarInvoice)):
+
+            return NotImplemented
+
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
+
+
+    def __repr__(self) -> str:
+
+        return f"ColumnarInvoice(invoiceNum={self.invoiceNum!r}, payee={self.payee!r}, total={self.total!r})"
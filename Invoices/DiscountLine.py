@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscountLine:
     """
     Encapsulates a generic discount line item which has
@@ -13,7 +13,7 @@ class DiscountLine:
         A Human-readable identifier.
 
     amount : float
-        The discounted amount.
+        The discounted amount, in integer minor units under a FixedPoint money policy.
     """
 
 
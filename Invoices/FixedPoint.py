@@ -0,0 +1,196 @@
+from dataclasses import dataclass, field
+from decimal import (
+    Decimal,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP
+)
+from typing import Callable, Dict, Union
+
+
+Amount  = Union[int, float, Decimal]
+Rounder = Callable[[int, int], int]
+
+
+def _roundFloor(numerator: int, denominator: int) -> int:
+
+    return numerator // denominator
+
+
+def _roundCeiling(numerator: int, denominator: int) -> int:
+
+    return -(-numerator // denominator)
+
+
+def _roundDown(numerator: int, denominator: int) -> int:
+
+    quotient, remainder = divmod(numerator, denominator)
+
+    return quotient + 1 if remainder and numerator < 0 else quotient
+
+
+def _roundUp(numerator: int, denominator: int) -> int:
+
+    quotient, remainder = divmod(numerator, denominator)
+
+    return quotient + 1 if remainder and numerator > 0 else quotient
+
+
+def _halfRounder(tie: Callable[[int, int], int]) -> Rounder:
+
+    def roundHalf(numerator: int, denominator: int) -> int:
+
+        quotient, remainder = divmod(numerator, denominator)
+
+        if 2 * remainder < denominator:
+
+            return quotient
+
+        if 2 * remainder > denominator:
+
+            return quotient + 1
+
+        return quotient + tie(quotient, numerator)
+
+    return roundHalf
+
+
+ROUNDERS: Dict[str, Rounder] = {
+    ROUND_FLOOR: _roundFloor,
+    ROUND_CEILING: _roundCeiling,
+    ROUND_DOWN: _roundDown,
+    ROUND_UP: _roundUp,
+    ROUND_HALF_EVEN: _halfRounder(lambda quotient, numerator: quotient & 1),
+    ROUND_HALF_UP: _halfRounder(lambda quotient, numerator: int(numerator > 0)),
+    ROUND_HALF_DOWN: _halfRounder(lambda quotient, numerator: int(numerator < 0))
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FixedPoint:
+    """
+    Encapsulates a fixed-point money policy which has a number of minor units
+    per major unit and a rounding policy.
+
+    Amounts are converted to integer minor units (e.g. cents) exactly, from
+    the precise value of the float, int or Decimal, and rounded once as the
+    policy says. Integer minor units then add and subtract without drift.
+
+    Attributes
+    ----------
+    scale : int
+        The number of minor units per major unit, e.g. 100 for cents.
+
+    rounding : str
+        One of the decimal module's rounding modes (ROUND_HALF_EVEN, ROUND_HALF_UP,
+        ROUND_HALF_DOWN, ROUND_UP, ROUND_DOWN, ROUND_CEILING or ROUND_FLOOR).
+
+    Methods
+    -------
+    toMinor(amount: Amount) -> int
+        Converts an amount in major units to rounded integer minor units.
+
+    toMajor(units: int) -> float
+        Converts integer minor units to a float amount in major units.
+
+    toDecimal(units: int) -> Decimal
+        Converts integer minor units to an exact Decimal amount in major units.
+    """
+
+
+    scale: int = 100
+    rounding: str = ROUND_HALF_EVEN
+    rounder: Rounder = field(init=False, repr=False, compare=False)
+
+
+    def __post_init__(self):
+
+        if not isinstance(self.scale, int) or self.scale < 1:
+
+            raise ValueError("scale must be a positive integer")
+
+        if self.rounding not in ROUNDERS:
+
+            raise ValueError(f"Unsupported rounding policy '{self.rounding}'")
+
+        object.__setattr__(self, "rounder", ROUNDERS[self.rounding])
+
+
+    def __getstate__(self):
+
+        return (self.scale, self.rounding)
+
+
+    def __setstate__(self, state):
+
+        object.__setattr__(self, "scale", state[0])
+        object.__setattr__(self, "rounding", state[1])
+        object.__setattr__(self, "rounder", ROUNDERS[state[1]])
+
+
+    def toMinor(self, amount: Amount) -> int:
+        """
+        Converts an amount in major units to rounded integer minor units.
+
+        Parameters
+        ----------
+        amount : Amount
+            The amount, as an int, float or Decimal.
+
+        Returns
+        -------
+        int
+            The amount in minor units.
+
+        Raises
+        ------
+        ValueError
+            If the amount is NaN.
+
+        OverflowError
+            If the amount is infinite.
+        """
+
+        numerator, denominator = amount.as_integer_ratio()
+
+        return self.rounder(numerator * self.scale, denominator)
+
+
+    def toMajor(self, units: int) -> float:
+        """
+        Converts integer minor units to a float amount in major units.
+
+        Parameters
+        ----------
+        units : int
+            The amount in minor units.
+
+        Returns
+        -------
+        float
+            The amount in major units.
+        """
+
+        return units / self.scale
+
+
+    def toDecimal(self, units: int) -> Decimal:
+        """
+        Converts integer minor units to an exact Decimal amount in major units.
+
+        Parameters
+        ----------
+        units : int
+            The amount in minor units.
+
+        Returns
+        -------
+        Decimal
+            The amount in major units.
+        """
+
+        return Decimal(units) / Decimal(self.scale)
@@ -0,0 +1,471 @@
+from collections import Counter
+from datetime import date
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from Invoiceables import Invoiceable
+from Discounts import Discount
+from Rentables import AddOn, Rentable, Room
+from .PricingEngine import PricingEngine
+from .InvoiceLine import InvoiceLine
+from .DiscountLine import DiscountLine
+from .Invoice import Invoice
+
+
+class IncrementalInvoice:
+    """
+    A quote session that keeps an invoice up to date as rooms and add-ons
+    are added or removed one at a time.
+
+    Every change prices only the affected line and updates running state:
+    an exact running subtotal, the number of selected rooms supporting each
+    add-on (for approval), and, for each discount that declares its required
+    rooms (see Discount.requiredRoomNames), how many of them are still
+    missing. Reading the totals after a change therefore costs time
+    proportional to the change and to the number of eligible discounts, not
+    to the size of the basket. Discounts that do not declare their required
+    rooms are re-checked with applies() whenever the discount lines are read.
+
+    The lines, subtotal, discount lines and total are identical to what
+    InvoiceBuilder.build would produce for the same selection.
+
+    Attributes
+    ----------
+    pricingEngine : PricingEngine
+        The engine that prices each line.
+
+    discounts : List[Discount]
+        The discounts offered with this quote.
+
+    t : float
+        The duration of time over which the rooms and add-ons are rented.
+
+    rooms : List[Room]
+        The selected rooms, in the order they were added.
+
+    addOns : List[AddOn]
+        The selected add-ons, in the order they were added.
+
+    Methods
+    -------
+    addRoom(room: Room)
+        Adds a room to the selection.
+
+    removeRoom(room: Room)
+        Removes a room from the selection.
+
+    addAddOn(addOn: AddOn)
+        Adds an add-on to the selection.
+
+    removeAddOn(addOn: AddOn)
+        Removes an add-on from the selection.
+
+    setDuration(t: float)
+        Changes the rental duration, repricing every line.
+
+    approve()
+        Checks whether every selected add-on is supported by the selected rooms.
+
+    build(invoiceNum: int, payee: str, dateCreated: date, dateDue: date) -> Invoice
+        Builds the Invoice of the current selection.
+    """
+
+
+    def __init__(
+            self,
+            pricingEngine: PricingEngine,
+            discounts: List[Discount],
+            t: float,
+            rooms: Iterable[Room] = (),
+            addOns: Iterable[AddOn] = ()
+    ):
+
+        self.pricingEngine = pricingEngine
+        self.discounts     = list(discounts)
+        self.t             = t
+
+        self._rooms: Dict[int, Tuple[Room, InvoiceLine]]   = {}
+        self._addOns: Dict[int, Tuple[AddOn, InvoiceLine]] = {}
+        self._keys: Dict[int, List[int]]                   = {}
+        self._nextKey                                      = 0
+        self._exactSubtotal                                = Fraction(0)
+        self._roomNames: Counter                           = Counter()
+        self._supportCounts: Counter                       = Counter()
+        self._addOnCounts: Counter                         = Counter()
+        self._unsupported                                  = 0
+        self._missing: Dict[int, int]                      = {}
+        self._byRoom: Dict[str, List[int]]                 = {}
+        self._eligible: Set[int]                           = set()
+        self._opaque: List[int]                            = []
+        self._discountLines: Optional[List[DiscountLine]]  = None
+
+        for position, discount in enumerate(self.discounts):
+
+            required = discount.requiredRoomNames()
+
+            if required is None:
+
+                self._opaque.append(position)
+
+                continue
+
+            self._missing[position] = len(required)
+
+            if not required:
+
+                self._eligible.add(position)
+
+            for name in required:
+
+                self._byRoom.setdefault(name, []).append(position)
+
+        for room in rooms:
+
+            self.addRoom(room)
+
+        for addOn in addOns:
+
+            self.addAddOn(addOn)
+
+
+    def _select(self, entries: Dict[int, Tuple[Rentable, InvoiceLine]], rentable: Rentable):
+
+        line = self.pricingEngine.getInvoiceLine(rentable, self.t)
+        key  = self._nextKey
+
+        entries[key] = (rentable, line)
+
+        # Selections are keyed by identity first; the entry holds the
+        # rentable, so its id cannot be reused while it is selected.
+        self._keys.setdefault(id(rentable), []).append(key)
+
+        self._nextKey       += 1
+        self._exactSubtotal += Fraction(line.subtotal)
+        self._discountLines  = None
+
+
+    def _deselect(self, entries: Dict[int, Tuple[Rentable, InvoiceLine]], rentable: Rentable) -> Optional[Rentable]:
+
+        keys = self._keys.get(id(rentable))
+
+        if keys:
+
+            key = keys[0]
+
+        else:
+
+            key = next((key for key, (selected, _) in entries.items() if selected == rentable), None)
+
+            if key is None:
+
+                return None
+
+        selected, line = entries.pop(key)
+        keys           = self._keys[id(selected)]
+
+        keys.remove(key)
+
+        if not keys:
+
+            del self._keys[id(selected)]
+
+        self._exactSubtotal -= Fraction(line.subtotal)
+        self._discountLines  = None
+
+        return selected
+
+
+    def addRoom(self, room: Room):
+        """
+        Adds a room to the selection.
+
+        Parameters
+        ----------
+        room : Room
+            The room to add.
+        """
+
+        self._select(self._rooms, room)
+
+        self._roomNames[room.name] += 1
+
+        if self._roomNames[room.name] == 1:
+
+            for position in self._byRoom.get(room.name, ()):
+
+                self._missing[position] -= 1
+
+                if not self._missing[position]:
+
+                    self._eligible.add(position)
+
+        for addOnID in room.addOnIDs:
+
+            self._supportCounts[addOnID] += 1
+
+            if self._supportCounts[addOnID] == 1:
+
+                self._unsupported -= self._addOnCounts[addOnID]
+
+
+    def removeRoom(self, room: Room):
+        """
+        Removes a room from the selection.
+
+        Parameters
+        ----------
+        room : Room
+            The room to remove. If it was added more than once, its earliest addition is removed.
+
+        Raises
+        ------
+        ValueError
+            If the room is not selected.
+        """
+
+        if self._deselect(self._rooms, room) is None:
+
+            raise ValueError(f"Room '{room.name}' is not selected.")
+
+        self._roomNames[room.name] -= 1
+
+        if not self._roomNames[room.name]:
+
+            del self._roomNames[room.name]
+
+            for position in self._byRoom.get(room.name, ()):
+
+                self._eligible.discard(position)
+
+                self._missing[position] += 1
+
+        for addOnID in room.addOnIDs:
+
+            self._supportCounts[addOnID] -= 1
+
+            if not self._supportCounts[addOnID]:
+
+                del self._supportCounts[addOnID]
+
+                self._unsupported += self._addOnCounts[addOnID]
+
+
+    def addAddOn(self, addOn: AddOn):
+        """
+        Adds an add-on to the selection. Support is checked by approve() and build().
+
+        Parameters
+        ----------
+        addOn : AddOn
+            The add-on to add.
+        """
+
+        self._select(self._addOns, addOn)
+
+        self._addOnCounts[addOn.id] += 1
+
+        if not self._supportCounts[addOn.id]:
+
+            self._unsupported += 1
+
+
+    def removeAddOn(self, addOn: AddOn):
+        """
+        Removes an add-on from the selection.
+
+        Parameters
+        ----------
+        addOn : AddOn
+            The add-on to remove. If it was added more than once, its earliest addition is removed.
+
+        Raises
+        ------
+        ValueError
+            If the add-on is not selected.
+        """
+
+        if self._deselect(self._addOns, addOn) is None:
+
+            raise ValueError(f"Add-On '{addOn.name}' is not selected.")
+
+        self._addOnCounts[addOn.id] -= 1
+
+        if not self._addOnCounts[addOn.id]:
+
+            del self._addOnCounts[addOn.id]
+
+        if not self._supportCounts[addOn.id]:
+
+            self._unsupported -= 1
+
+
+    def setDuration(self, t: float):
+        """
+        Changes the rental duration, repricing every line.
+
+        Parameters
+        ----------
+        t : float
+            The new duration of time over which the rooms and add-ons are rented.
+        """
+
+        self.t = t
+
+        self._rooms = {
+            key: (room, self.pricingEngine.getInvoiceLine(room, t)) for key, (room, _) in self._rooms.items()
+        }
+
+        self._addOns = {
+            key: (addOn, self.pricingEngine.getInvoiceLine(addOn, t)) for key, (addOn, _) in self._addOns.items()
+        }
+
+        self._exactSubtotal = sum((Fraction(line.subtotal) for line in self.invoiceLines), Fraction(0))
+        self._discountLines = None
+
+
+    @property
+    def rooms(self) -> List[Room]:
+        """
+        The selected rooms, in the order they were added.
+        """
+
+        return [room for room, _ in self._rooms.values()]
+
+
+    @property
+    def addOns(self) -> List[AddOn]:
+        """
+        The selected add-ons, in the order they were added.
+        """
+
+        return [addOn for addOn, _ in self._addOns.values()]
+
+
+    @property
+    def invoiceable(self) -> Invoiceable:
+        """
+        The Invoiceable entity of the current selection.
+        """
+
+        return Invoiceable(addOns=self.addOns, rooms=self.rooms, t=self.t)
+
+
+    @property
+    def invoiceLines(self) -> List[InvoiceLine]:
+        """
+        The invoice line items, rooms first and then add-ons.
+        """
+
+        return [line for _, line in self._rooms.values()] + [line for _, line in self._addOns.values()]
+
+
+    @property
+    def subtotal(self) -> float:
+        """
+        The subtotal of the invoice line items.
+        """
+
+        if self.pricingEngine.money is not None:
+
+            return int(self._exactSubtotal)
+
+        return float(self._exactSubtotal)
+
+
+    @property
+    def discountLines(self) -> List[DiscountLine]:
+        """
+        The discount line items of the applicable discounts, in their original order.
+        """
+
+        if self._discountLines is None:
+
+            applicable = set(self._eligible)
+
+            if self._opaque:
+
+                invoiceable = self.invoiceable
+
+                applicable.update(
+                    position for position in self._opaque if self.discounts[position].applies(invoiceable)
+                )
+
+            subtotal = self.subtotal
+
+            self._discountLines = [
+                self.pricingEngine.getDiscountLine(self.discounts[position], subtotal)
+                for position in sorted(applicable)
+            ]
+
+        return list(self._discountLines)
+
+
+    @property
+    def total(self) -> float:
+        """
+        The subtotal less the discounted amounts.
+        """
+
+        return self.pricingEngine.calculateTotal(self.subtotal, self.discountLines)
+
+
+    def approve(self):
+        """
+        Checks whether every selected add-on is supported by the selected rooms.
+
+        Raises
+        ------
+        ValueError
+            Naming every add-on that no selected room supports, as Invoiceable.approve does.
+        """
+
+        if self._unsupported:
+
+            self.invoiceable.approve()
+
+
+    def build(self, invoiceNum: int, payee: str, dateCreated: date, dateDue: date) -> Invoice:
+        """
+        Builds the Invoice of the current selection.
+
+        Parameters
+        ----------
+        invoiceNum : int
+            The invoice number.
+
+        payee : str
+            A person to whom the generated invoice is payable to.
+
+        dateCreated : date
+            The date on which the generated invoice was created.
+
+        dateDue : date
+            The date on which the generated invoice is due.
+
+        Returns
+        -------
+        Invoice
+            The generated invoice, identical to InvoiceBuilder.build for the same selection.
+
+        Raises
+        ------
+        ValueError
+            If the selection fails approval (i.e., unsupported add-ons).
+        """
+
+        self.approve()
+
+        subtotal      = self.subtotal
+        discountLines = self.discountLines
+        money         = self.pricingEngine.money
+
+        return Invoice(
+            invoiceNum=invoiceNum,
+            payee=payee,
+            dateCreated=dateCreated,
+            dateDue=dateDue,
+            invoiceItems=self.invoiceLines,
+            discountItems=discountLines,
+            subtotal=subtotal,
+            total=self.pricingEngine.calculateTotal(subtotal, discountLines),
+            scale=None if money is None else money.scale
+        )
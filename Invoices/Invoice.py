@@ -1,11 +1,11 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 from datetime import date
 from .InvoiceLine import InvoiceLine
 from .DiscountLine import DiscountLine
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Invoice:
     """
     Encapsulates a generic invoice entity which has
@@ -41,6 +41,11 @@ class Invoice:
 
     total : float
         The invoice total.
+
+    scale : Optional[int]
+        The number of minor units per major unit when the invoice was priced
+        under a FixedPoint money policy, in which case every amount is in
+        integer minor units; None when amounts are floats in major units.
     """
 
 
@@ -52,3 +57,4 @@ class Invoice:
     discountItems: List[DiscountLine]
     subtotal: float
     total: float
+    scale: Optional[int] = None
@@ -1,7 +1,7 @@
 from datetime import date
-from typing import List
+from typing import List, Union
 from Invoiceables import Invoiceable
-from Discounts import Discount
+from Discounts import Discount, DiscountIndex
 from .PricingEngine import PricingEngine
 from .Invoice import Invoice
 
@@ -24,7 +24,7 @@ class InvoiceBuilder:
             dateCreated: date,
             dateDue: date,
             invoiceable: Invoiceable,
-            discounts: List[Discount]
+            discounts: Union[List[Discount], DiscountIndex]
     ) -> Invoice:
         """
         Builds an Invoice object from the given Invoiceable entity and discounts.
@@ -46,8 +46,8 @@ class InvoiceBuilder:
         invoiceable : Invoiceable
             An invoiceable entity from which the invoice is to be generated.
 
-        discounts : List[Discount]
-            A list of discounts.
+        discounts : Union[List[Discount], DiscountIndex]
+            A list of discounts, or a DiscountIndex over them (see PricingEngine.getDiscountLines).
 
         Returns
         -------
@@ -66,6 +66,7 @@ class InvoiceBuilder:
         subtotal      = self._pricingEngine.calculateSubtotal(invoiceLines)
         discountLines = self._pricingEngine.getDiscountLines(invoiceable, subtotal, discounts)
         total         = self._pricingEngine.calculateTotal(subtotal, discountLines)
+        money         = self._pricingEngine.money
 
         return Invoice(
             invoiceNum=invoiceNum,
@@ -75,5 +76,6 @@ class InvoiceBuilder:
             invoiceItems=invoiceLines,
             discountItems=discountLines,
             subtotal=subtotal,
-            total=total
+            total=total,
+            scale=None if money is None else money.scale
         )
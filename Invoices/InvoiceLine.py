@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvoiceLine:
     """
     Encapsulates a generic invoice line item which has
@@ -20,7 +20,7 @@ class InvoiceLine:
         The quantity of time rented.
 
     subtotal : float
-        The rental cost subtotal.
+        The rental cost subtotal, in integer minor units under a FixedPoint money policy.
     """
 
 
@@ -0,0 +1,235 @@
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+from .Invoice import Invoice
+from .ColumnarInvoice import ColumnarInvoice, InvoiceLineColumns
+
+
+ValueEncoder = Callable[[Any], str]
+
+
+def _majorUnits(scale: int) -> ValueEncoder:
+
+    return lambda units: format(Decimal(units) / scale, "f")
+
+
+class InvoiceWriter(ABC):
+    """
+    Streams invoices to a text file handle.
+
+    Each invoice is encoded to text as soon as it is written and appended to a
+    small buffer that is written out whenever it holds bufferSize characters,
+    so exporting any number of invoices keeps memory flat. Values are encoded
+    by per-type encoders (see valueEncoders) that are resolved once per type
+    and cached, rather than by building and dumping nested dicts.
+
+    Amounts are always written in major units: those of an invoice priced
+    under a money policy (see Invoice.scale) are integer minor units, and
+    are written as the exact decimal number of major units they stand for.
+
+    Attributes
+    ----------
+    file : TextIO
+        The file handle written to. The writer never closes it.
+
+    bufferSize : int
+        How many characters are buffered before they are written to the file.
+
+    count : int
+        How many invoices have been written.
+
+    Methods
+    -------
+    encode(invoice: Union[Invoice, ColumnarInvoice]) -> str
+        Encodes one invoice.
+
+    write(invoice: Union[Invoice, ColumnarInvoice])
+        Writes one invoice.
+
+    writeMany(invoices: Iterable[Union[Invoice, ColumnarInvoice]]) -> int
+        Writes every invoice of an iterable.
+
+    flush()
+        Writes out the buffer and flushes the file handle.
+
+    close()
+        Flushes the writer.
+    """
+
+
+    valueEncoders: Dict[type, ValueEncoder] = {}
+
+
+    def __init__(self, file: TextIO, bufferSize: int = 1 << 16):
+
+        if bufferSize < 1:
+
+            raise ValueError("bufferSize must be at least 1")
+
+        self.file       = file
+        self.bufferSize = bufferSize
+        self.count      = 0
+
+        self._parts: List[str]                   = []
+        self._buffered                           = 0
+        self._encoders: Dict[type, ValueEncoder] = dict(self.valueEncoders)
+
+
+    def _encodeValue(self, value: Any) -> str:
+
+        encoder = self._encoders.get(value.__class__)
+
+        if encoder is None:
+
+            encoder = self._resolveEncoder(value.__class__)
+
+        return encoder(value)
+
+
+    def _resolveEncoder(self, cls: type) -> ValueEncoder:
+
+        for base in cls.__mro__:
+
+            if base in self.valueEncoders:
+
+                encoder = self._encoders[cls] = self.valueEncoders[base]
+
+                return encoder
+
+        raise TypeError(f"Cannot encode values of type '{cls.__name__}'")
+
+
+    def _amountEncoder(self, invoice: Union[Invoice, ColumnarInvoice]) -> ValueEncoder:
+
+        if invoice.scale is None:
+
+            return self._encodeValue
+
+        return _majorUnits(invoice.scale)
+
+
+    @staticmethod
+    def _invoiceLines(invoice: Union[Invoice, ColumnarInvoice]) -> Iterator[Tuple[str, str, float, float]]:
+
+        items = invoice.invoiceItems
+
+        if isinstance(items, InvoiceLineColumns):
+
+            strings = items.table.strings
+
+            return zip(
+                map(strings.__getitem__, items.names),
+                map(strings.__getitem__, items.rates),
+                items.quantities,
+                items.subtotals
+            )
+
+        return ((line.name, line.rate, line.quantity, line.subtotal) for line in items)
+
+
+    @abstractmethod
+    def encode(self, invoice: Union[Invoice, ColumnarInvoice]) -> str:
+        """
+        Encodes one invoice.
+
+        Parameters
+        ----------
+        invoice : Union[Invoice, ColumnarInvoice]
+            The invoice to encode.
+
+        Returns
+        -------
+        str
+            The encoded invoice, including its trailing line terminator.
+        """
+
+        pass
+
+
+    def _append(self, text: str):
+
+        self._parts.append(text)
+
+        self._buffered += len(text)
+
+        if self._buffered >= self.bufferSize:
+
+            self._drain()
+
+
+    def _drain(self):
+
+        if self._parts:
+
+            self.file.write("".join(self._parts))
+
+            self._parts.clear()
+
+            self._buffered = 0
+
+
+    def write(self, invoice: Union[Invoice, ColumnarInvoice]):
+        """
+        Writes one invoice.
+
+        Parameters
+        ----------
+        invoice : Union[Invoice, ColumnarInvoice]
+            The invoice to write.
+        """
+
+        self._append(self.encode(invoice))
+
+        self.count += 1
+
+
+    def writeMany(self, invoices: Iterable[Union[Invoice, ColumnarInvoice]]) -> int:
+        """
+        Writes every invoice of an iterable, consuming it lazily.
+
+        Parameters
+        ----------
+        invoices : Iterable[Union[Invoice, ColumnarInvoice]]
+            The invoices to write, e.g. the generator returned by API.buildInvoicesFromJSON.
+
+        Returns
+        -------
+        int
+            How many invoices were written.
+        """
+
+        start = self.count
+
+        for invoice in invoices:
+
+            self.write(invoice)
+
+        return self.count - start
+
+
+    def flush(self):
+        """
+        Writes out the buffer and flushes the file handle.
+        """
+
+        self._drain()
+
+        self.file.flush()
+
+
+    def close(self):
+        """
+        Flushes the writer. The file handle is left open.
+        """
+
+        self.flush()
+
+
+    def __enter__(self) -> "InvoiceWriter":
+
+        return self
+
+
+    def __exit__(self, *exc):
+
+        self.close()
@@ -0,0 +1,68 @@
+from datetime import date
+from json.encoder import encode_basestring_ascii
+from typing import Dict, Union
+from .Invoice import Invoice
+from .ColumnarInvoice import ColumnarInvoice
+from .InvoiceWriter import InvoiceWriter, ValueEncoder
+
+
+def _encodeFloat(value: float) -> str:
+
+    if value != value:
+
+        return "NaN"
+
+    if value in (float("inf"), float("-inf")):
+
+        return "Infinity" if value > 0 else "-Infinity"
+
+    return float.__repr__(value)
+
+
+class NDJSONInvoiceWriter(InvoiceWriter):
+    """
+    Streams invoices as newline-delimited JSON, one invoice object per line.
+
+    Each line holds the same object json.dumps would produce for the invoice
+    with its dates in ISO format and its amounts in major units: the header
+    fields, the invoiceItems and discountItems arrays, the subtotal and the
+    total. Lines are assembled from pre-encoded keys rather than from
+    intermediate dicts.
+    """
+
+
+    valueEncoders: Dict[type, ValueEncoder] = {
+        str: encode_basestring_ascii,
+        bool: lambda value: "true" if value else "false",
+        int: int.__repr__,
+        float: _encodeFloat,
+        date: lambda value: f'"{value.isoformat()}"',
+        type(None): lambda value: "null"
+    }
+
+
+    def encode(self, invoice: Union[Invoice, ColumnarInvoice]) -> str:
+
+        value  = self._encodeValue
+        amount = self._amountEncoder(invoice)
+
+        invoiceItems = ",".join(
+            f'{{"name":{value(name)},"rate":{value(rate)},"quantity":{value(quantity)},"subtotal":{amount(subtotal)}}}'
+            for name, rate, quantity, subtotal in self._invoiceLines(invoice)
+        )
+
+        discountItems = ",".join(
+            f'{{"name":{value(line.name)},"amount":{amount(line.amount)}}}'
+            for line in invoice.discountItems
+        )
+
+        return (
+            f'{{"invoiceNum":{value(invoice.invoiceNum)},'
+            f'"payee":{value(invoice.payee)},'
+            f'"dateCreated":{value(invoice.dateCreated)},'
+            f'"dateDue":{value(invoice.dateDue)},'
+            f'"invoiceItems":[{invoiceItems}],'
+            f'"discountItems":[{discountItems}],'
+            f'"subtotal":{amount(invoice.subtotal)},'
+            f'"total":{amount(invoice.total)}}}\n'
+        )
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional, Tuple
+import threading
+import time
+from Rentables import Rentable
+
+
+class PricingCacheStats(NamedTuple):
+
+    hits: int
+    misses: int
+    size: int
+    maxSize: int
+
+    @property
+    def hitRate(self) -> float:
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class PricingCache:
+    """
+    A bounded LRU cache of rentable subtotals with optional expiry.
+
+    Entries are keyed by the fingerprint of the rentable's rate (its rate type,
+    the builder registered for it, and its params) and the duration, so a
+    rentable whose rate changes, or whose rate type is re-registered, misses
+    the cache instead of returning a stale price. Rates built outside a
+    RateRegistry carry no fingerprint and are always evaluated.
+
+    Attributes
+    ----------
+    maxSize : int
+        The maximum number of cached subtotals.
+
+    ttl : Optional[float]
+        How long, in seconds, an entry stays valid, or None to never expire.
+
+    Methods
+    -------
+    subtotal(rentable: Rentable, t: float) -> float
+        Returns the subtotal of a rentable, evaluating its rate on a miss.
+
+    stats() -> PricingCacheStats
+        Returns the hit and miss counts and the current size.
+
+    clear()
+        Drops every entry and resets the statistics.
+    """
+
+
+    def __init__(
+            self,
+            maxSize: int = 4096,
+            ttl: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic
+    ):
+
+        if maxSize < 1:
+
+            raise ValueError("maxSize must be at least 1")
+
+        self.maxSize = maxSize
+        self.ttl     = ttl
+
+        self._clock                                                 = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+        self._lock                                                  = threading.Lock()
+        self._hits                                                  = 0
+        self._misses                                                = 0
+
+
+    def subtotal(self, rentable: Rentable, t: float) -> float:
+        """
+        Returns the subtotal of a rentable, evaluating its rate on a miss.
+
+        Parameters
+        ----------
+        rentable : Rentable
+            The rentable to price.
+
+        t : float
+            The duration of time for which the rentable is rented.
+
+        Returns
+        -------
+        float
+            The subtotal.
+        """
+
+        rate = rentable.rate
+
+        if rate.fingerprint is None:
+
+            return rate.calculate(t)
+
+        key = (rate.fingerprint, t)
+        now = self._clock()
+
+        with self._lock:
+
+            entry = self._entries.get(key)
+
+            if entry is not None and (self.ttl is None or now - entry[1] < self.ttl):
+
+                self._entries.move_to_end(key)
+
+                self._hits += 1
+
+                return entry[0]
+
+            self._misses += 1
+
+        subtotal = rate.calculate(t)
+
+        with self._lock:
+
+            self._entries[key] = (subtotal, now)
+
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxSize:
+
+                self._entries.popitem(last=False)
+
+        return subtotal
+
+
+    def stats(self) -> PricingCacheStats:
+        """
+        Returns the hit and miss counts and the current size.
+
+        Returns
+        -------
+        PricingCacheStats
+            The cache statistics; hitRate is derived from hits and misses.
+        """
+
+        with self._lock:
+
+            return PricingCacheStats(self._hits, self._misses, len(self._entries), self.maxSize)
+
+
+    def clear(self):
+        """
+        Drops every entry and resets the statistics.
+        """
+
+        with self._lock:
+
+            self._entries.clear()
+
+            self._hits   = 0
+            self._misses = 0
@@ -1,17 +1,116 @@
-from typing import List
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+import threading
+import math
 from Invoiceables import Invoiceable
-from Discounts import Discount
+from Discounts import Discount, DiscountIndex
+from Rentables import Rentable
 from .InvoiceLine import InvoiceLine
 from .DiscountLine import DiscountLine
+from .PricingCache import PricingCache
+from .FixedPoint import FixedPoint
+
+
+DISCOUNT_INDEX_CACHE_SIZE = 64
 
 
 class PricingEngine:
     """
     Encapsulates the pricing logic for generating invoice line items,
     applying discounts, and computing totals from an Invoiceable object.
+
+    Attributes
+    ----------
+    cache : Optional[PricingCache]
+        An opt-in cache of rentable subtotals, or None to always evaluate rates.
+
+    money : Optional[FixedPoint]
+        An opt-in fixed-point money policy. When set, every line subtotal and
+        discounted amount is rounded once to integer minor units, and the
+        subtotal and total are exact integer sums; otherwise amounts are floats.
     """
 
 
+    def __init__(self, cache: Optional[PricingCache] = None, money: Optional[FixedPoint] = None):
+
+        self.cache = cache
+        self.money = money
+
+        self._discountIndexes: "OrderedDict[Tuple[Discount, ...], DiscountIndex]" = OrderedDict()
+        self._discountIndexLock                                                   = threading.Lock()
+
+
+    def _discountIndex(self, discounts: List[Discount]) -> Optional[DiscountIndex]:
+
+        # Keyed by the discounts themselves, which the entry keeps alive, so a
+        # list that is priced again (e.g. the API's shared discounts) compiles
+        # once. Discounts that cannot be hashed are matched with applies().
+        key = tuple(discounts)
+
+        with self._discountIndexLock:
+
+            try:
+
+                index = self._discountIndexes.get(key)
+
+            except TypeError:
+
+                return None
+
+            if index is not None:
+
+                self._discountIndexes.move_to_end(key)
+
+                return index
+
+        index = DiscountIndex(key)
+
+        with self._discountIndexLock:
+
+            index = self._discountIndexes.setdefault(key, index)
+
+            self._discountIndexes.move_to_end(key)
+
+            while len(self._discountIndexes) > DISCOUNT_INDEX_CACHE_SIZE:
+
+                self._discountIndexes.popitem(last=False)
+
+        return index
+
+
+    def _subtotal(self, rentable: Rentable, t: float) -> float:
+
+        subtotal = rentable.subtotal(t) if self.cache is None else self.cache.subtotal(rentable, t)
+
+        return subtotal if self.money is None else self.money.toMinor(subtotal)
+
+
+    def getInvoiceLine(self, rentable: Rentable, t: float) -> InvoiceLine:
+        """
+        Generates the invoice line item of a single room or add-on.
+
+        Parameters
+        ----------
+        rentable : Rentable
+            The room or add-on to price.
+
+        t : float
+            The duration of time for which the rentable is rented.
+
+        Returns
+        -------
+        InvoiceLine
+            The generated invoice line item.
+        """
+
+        return InvoiceLine(
+            name=rentable.name,
+            rate=rentable.rate.name,
+            quantity=t,
+            subtotal=self._subtotal(rentable, t)
+        )
+
+
     def getInvoiceLines(self, invoiceable: Invoiceable) -> List[InvoiceLine]:
         """
         Generates invoice line items for each room and add-on in the given Invoiceable entity.
@@ -32,29 +131,11 @@ class PricingEngine:
 
         for room in invoiceable.rooms:
 
-            subtotal = room.subtotal(invoiceable.t)
-
-            invoiceLines.append(
-                InvoiceLine(
-                    name=room.name,
-                    rate=room.rate.name,
-                    quantity=invoiceable.t,
-                    subtotal=subtotal
-                )
-            )
+            invoiceLines.append(self.getInvoiceLine(room, invoiceable.t))
 
         for addOn in invoiceable.addOns:
 
-            subtotal = addOn.subtotal(invoiceable.t)
-
-            invoiceLines.append(
-                InvoiceLine(
-                    name=addOn.name,
-                    rate=addOn.rate.name,
-                    quantity=invoiceable.t,
-                    subtotal=subtotal
-                )
-            )
+            invoiceLines.append(self.getInvoiceLine(addOn, invoiceable.t))
 
         return invoiceLines
 
@@ -71,17 +152,55 @@ class PricingEngine:
         Returns
         -------
         float
-            The final, summed-subtotal of the given list of invoice line items.
+            The final, summed-subtotal of the given list of invoice line items,
+            correctly rounded so that it does not depend on the order of the lines
+            (an exact int of minor units under a money policy).
         """
 
-        return sum(invoiceLine.subtotal for invoiceLine in invoiceLines)
+        if self.money is not None:
+
+            return sum(invoiceLine.subtotal for invoiceLine in invoiceLines)
+
+        return math.fsum(invoiceLine.subtotal for invoiceLine in invoiceLines)
+
+
+    def getDiscountLine(self, discount: Discount, subtotal: float) -> DiscountLine:
+        """
+        Generates the discount line item of a single applicable discount.
+
+        Parameters
+        ----------
+        discount : Discount
+            The discount to apply.
+
+        subtotal : float
+            The subtotal from which the discounted amount will be subtracted.
+
+        Returns
+        -------
+        DiscountLine
+            The generated discount line item.
+        """
+
+        if self.money is None:
+
+            amount = discount.rate(subtotal)
+
+        else:
+
+            amount = self.money.toMinor(discount.rate(self.money.toMajor(subtotal)))
+
+        return DiscountLine(
+            name=discount.name,
+            amount=amount
+        )
 
 
     def getDiscountLines(
             self,
             invoiceable: Invoiceable,
             subtotal: float,
-            discounts: List[Discount]
+            discounts: Union[List[Discount], DiscountIndex]
     ) -> List[DiscountLine]:
         """
         Determines which discounts apply to the given Invoiceable entity
@@ -95,8 +214,10 @@ class PricingEngine:
         subtotal : float
             The subtotal from which the applicable discounted amounts will be subtracted.
 
-        discounts : List[Discount]
-            A list of discounts.
+        discounts : Union[List[Discount], DiscountIndex]
+            A list of discounts, matched through a DiscountIndex the engine
+            compiles once per distinct list and keeps in a small LRU, or a
+            DiscountIndex compiled by the caller.
 
         Returns
         -------
@@ -106,18 +227,19 @@ class PricingEngine:
 
         discountLines: List[DiscountLine] = []
 
-        for discount in discounts:
+        index = discounts if isinstance(discounts, DiscountIndex) else self._discountIndex(discounts)
+
+        if index is not None:
+
+            applicable = index.applicable(invoiceable)
+
+        else:
+
+            applicable = [discount for discount in discounts if discount.applies(invoiceable)]
 
-            if discount.applies(invoiceable):
+        for discount in applicable:
 
-                amount = discount.rate(subtotal)
-                
-                discountLines.append(
-                    DiscountLine(
-                        name=discount.name,
-                        amount=amount
-                    )
-                )
+            discountLines.append(self.getDiscountLine(discount, subtotal))
 
         return discountLines
 
@@ -1,5 +1,14 @@
 from .PricingEngine import PricingEngine
+from .PricingCache import PricingCache, PricingCacheStats
+from .FixedPoint import FixedPoint
+from .BatchPricingEngine import BatchPricingEngine
+from .BatchPricing import BatchPricing
 from .InvoiceBuilder import InvoiceBuilder
+from .IncrementalInvoice import IncrementalInvoice
 from .Invoice import Invoice
+from .ColumnarInvoice import ColumnarInvoice, StringTable
+from .InvoiceWriter import InvoiceWriter
+from .NDJSONInvoiceWriter import NDJSONInvoiceWriter
+from .CSVInvoiceWriter import CSVInvoiceWriter
 
-__all__ = ["PricingEngine", "InvoiceBuilder", "Invoice"]
+__all__ = ["PricingEngine", "PricingCache", "PricingCacheStats", "FixedPoint", "BatchPricingEngine", "BatchPricing", "InvoiceBuilder", "IncrementalInvoice", "Invoice", "ColumnarInvoice", "StringTable", "InvoiceWriter", "NDJSONInvoiceWriter", "CSVInvoiceWriter"]
@@ -0,0 +1,88 @@
+import random
+import pytest
+from Invoiceables import Invoiceable
+from Invoices import PricingEngine, BatchPricingEngine, FixedPoint
+from Invoices.BatchPricingEngine import numpy
+
+
+RATES = [
+    {"rateType": "Fixed Rate", "params": {"Rate": 12.5}},
+    {"rateType": "Fixed Rate", "params": {"Rate": 0.1}},
+    {"rateType": "Flat Rate", "params": {"Rate": 19.99}},
+    {"rateType": "Tiered Rate", "params": {"Breakpoints": [2, 8], "Rates": [30, 17.3, 0.7]}},
+    {"rateType": "Piecewise Linear Rate", "params": {"Times": [1, 4], "Costs": [10, 33.3]}}
+]
+
+MODES = [False, True] if numpy is not None else [False]
+
+
+def makeBatch(api, count, seed=0):
+
+    rng    = random.Random(seed)
+    addOns = [api.buildAddOnFromJSON({"id": f"a{i}", "name": f"A{i}", "rate": rate}) for i, rate in enumerate(RATES)]
+    rooms  = [
+        api.buildRoomFromJSON(
+            {"id": f"r{i}", "name": f"R{i}", "rate": rng.choice(RATES), "addOns": [addOn.id for addOn in addOns]},
+            addOns={addOn.id: addOn for addOn in addOns}
+        )
+        for i in range(12)
+    ]
+    discounts = [
+        api.buildDiscountFromJSON({
+            "discountType": "Room Bundle Discount",
+            "params": {"room bundle names": rng.sample([room.name for room in rooms], 2), "rate": rng.random() / 10}
+        })
+        for _ in range(6)
+    ]
+
+    invoiceables = [
+        Invoiceable(rooms=rng.sample(rooms, rng.randint(0, 6)), addOns=rng.sample(addOns, rng.randint(0, 3)), t=rng.uniform(0, 12))
+        for _ in range(count)
+    ]
+
+    return invoiceables, [discounts] * count
+
+
+def scalarPrices(engine, invoiceables, discounts):
+
+    for invoiceable, offered in zip(invoiceables, discounts):
+
+        lines         = engine.getInvoiceLines(invoiceable)
+        subtotal      = engine.calculateSubtotal(lines)
+        discountLines = engine.getDiscountLines(invoiceable, subtotal, offered)
+
+        yield lines, subtotal, discountLines, engine.calculateTotal(subtotal, discountLines)
+
+
+@pytest.mark.parametrize("useNumpy", MODES)
+@pytest.mark.parametrize("money", [None, FixedPoint()])
+def testMatchesPricingEngine(api, useNumpy, money):
+
+    invoiceables, discounts = makeBatch(api, 3000)
+
+    batch    = BatchPricingEngine(useNumpy=useNumpy, money=money).price(invoiceables, discounts)
+    expected = scalarPrices(PricingEngine(money=money), invoiceables, discounts)
+
+    for index, (lines, subtotal, discountLines, total) in enumerate(expected):
+
+        assert batch.getInvoiceLines(index) == lines
+        assert batch.getDiscountLines(index) == discountLines
+        assert batch.subtotals[index] == subtotal
+        assert batch.totals[index] == total
+
+
+def testEmptyBatch():
+
+    batch = BatchPricingEngine(useNumpy=False).price([])
+
+    assert len(batch) == 0
+    assert list(batch.subtotals) == []
+
+
+def testRejectsMisalignedDiscounts(api):
+
+    invoiceables, discounts = makeBatch(api, 3)
+
+    with pytest.raises(ValueError):
+
+        BatchPricingEngine().price(invoiceables, discounts[:2])
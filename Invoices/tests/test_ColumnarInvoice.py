@@ -0,0 +1,64 @@
+import pickle
+from dataclasses import replace
+import pytest
+from API import API
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+from Invoices import Invoice, FixedPoint, ColumnarInvoice, StringTable
+from Invoices.InvoiceLine import InvoiceLine
+
+
+def invoices(invoiceJSON, money=None):
+
+    api = API(money=money)
+
+    registerDefaultRates(api)
+    registerDefaultDiscounts(api)
+
+    return [api.buildInvoiceFromJSON(invoiceJSON(i, rooms=i + 1, t=i + 0.3)) for i in range(4)]
+
+
+@pytest.mark.parametrize("money", [None, FixedPoint(100)])
+def testRoundTripsThroughColumns(invoiceJSON, money):
+
+    table = StringTable()
+
+    for invoice in invoices(invoiceJSON, money):
+
+        columnar = ColumnarInvoice.fromInvoice(invoice, table)
+
+        assert columnar == invoice
+        assert columnar.toInvoice() == invoice
+        assert list(columnar.invoiceItems) == invoice.invoiceItems
+        assert columnar.invoiceItems[-1] == invoice.invoiceItems[-1]
+        assert columnar.invoiceItems[1:3] == invoice.invoiceItems[1:3]
+        assert [type(line.subtotal) for line in columnar.invoiceItems] == [type(line.subtotal) for line in invoice.invoiceItems]
+
+    # Room, add-on and rate names are stored once for the whole run.
+    assert len(table) == len({name for invoice in invoices(invoiceJSON) for line in invoice.invoiceItems for name in (line.name, line.rate)})
+
+
+def testLinesAreReadOnly(invoiceJSON):
+
+    columnar = ColumnarInvoice.fromInvoice(invoices(invoiceJSON)[0], StringTable())
+
+    with pytest.raises(IndexError):
+
+        columnar.invoiceItems[len(columnar.invoiceItems)]
+
+    with pytest.raises(TypeError):
+
+        columnar.invoiceItems[0] = columnar.invoiceItems[1]
+
+    assert not hasattr(columnar, "__dict__")
+
+
+def testSlottedValueObjectsStillCopy(invoiceJSON):
+
+    invoice = invoices(invoiceJSON, FixedPoint(100))[1]
+    line    = invoice.invoiceItems[0]
+
+    assert not hasattr(line, "__dict__") and not hasattr(invoice, "__dict__")
+    assert pickle.loads(pickle.dumps(invoice)) == invoice
+    assert replace(line, quantity=2) == InvoiceLine(name=line.name, rate=line.rate, quantity=2, subtotal=line.subtotal)
+    assert isinstance(replace(invoice, payee="Other"), Invoice)
@@ -0,0 +1,106 @@
+import pickle
+import random
+from decimal import Decimal
+import pytest
+from API import API
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+from Invoices import FixedPoint
+from Invoices.FixedPoint import ROUNDERS
+
+
+def amounts():
+
+    rng    = random.Random(24)
+    values = [0, 1, -1, 0.5, -0.5, 2.5, -2.5, 0.125, -0.375, 0.1, 1e-9, Decimal("1.005"), Decimal("-1.015")]
+
+    for _ in range(2000):
+
+        values.append(rng.uniform(-1e4, 1e4))
+        values.append(rng.randint(-10 ** 6, 10 ** 6))
+        values.append(Decimal(rng.randint(-10 ** 7, 10 ** 7)) / 1000)
+        values.append(rng.randint(-400, 400) / 200)
+
+    return values
+
+
+@pytest.mark.parametrize("rounding", list(ROUNDERS))
+@pytest.mark.parametrize("scale", [1, 100, 1000])
+def testToMinorMatchesDecimalQuantize(rounding, scale):
+
+    money = FixedPoint(scale, rounding)
+
+    for amount in amounts():
+
+        expected = (Decimal(amount) * scale).quantize(Decimal(1), rounding=rounding)
+
+        assert money.toMinor(amount) == int(expected), amount
+
+
+def testRejectsInvalidPolicies():
+
+    with pytest.raises(ValueError, match="positive integer"):
+
+        FixedPoint(0)
+
+    with pytest.raises(ValueError, match="positive integer"):
+
+        FixedPoint(100.0)
+
+    with pytest.raises(ValueError, match="Unsupported rounding"):
+
+        FixedPoint(100, "ROUND_05UP")
+
+
+def testRejectsNonFiniteAmounts():
+
+    money = FixedPoint()
+
+    with pytest.raises(ValueError):
+
+        money.toMinor(float("nan"))
+
+    with pytest.raises(OverflowError):
+
+        money.toMinor(float("inf"))
+
+
+def testConvertsBackToMajorUnits():
+
+    money = FixedPoint(1000)
+
+    assert money.toMinor(1.2345) == 1234
+    assert money.toMajor(1234) == 1.234
+    assert money.toDecimal(1234) == Decimal("1.234")
+    assert money.toDecimal(-5) == Decimal("-0.005")
+
+
+def testPickles():
+
+    money = pickle.loads(pickle.dumps(FixedPoint(1000, "ROUND_UP")))
+
+    assert money == FixedPoint(1000, "ROUND_UP")
+    assert money.toMinor(0.0001) == 1
+
+
+def testMoneyModeProducesExactIntegerTotals(invoiceJSON):
+
+    floats = API()
+    money  = API(money=FixedPoint())
+
+    for api in (floats, money):
+
+        registerDefaultRates(api)
+        registerDefaultDiscounts(api)
+
+    for i in range(1, 6):
+
+        spec     = invoiceJSON(i, rooms=i, t=i / 3)
+        expected = floats.buildInvoiceFromJSON(spec)
+        invoice  = money.buildInvoiceFromJSON(spec)
+
+        assert invoice.scale == 100 and expected.scale is None
+        assert all(isinstance(line.subtotal, int) for line in invoice.invoiceItems)
+        assert invoice.subtotal == sum(line.subtotal for line in invoice.invoiceItems)
+        assert invoice.total == invoice.subtotal - sum(line.amount for line in invoice.discountItems)
+        assert invoice.total == pytest.approx(expected.total * 100, abs=len(invoice.invoiceItems) + 1)
@@ -0,0 +1,140 @@
+import random
+from dataclasses import dataclass
+from datetime import date
+import pytest
+from Rentables import AddOn, Room
+from Invoiceables import Invoiceable
+from Discounts import Discount
+from Invoices import PricingEngine, InvoiceBuilder, IncrementalInvoice, FixedPoint
+
+
+DATES = (date(2024, 1, 1), date(2024, 1, 31))
+
+
+@dataclass(frozen=True)
+class LongStayDiscount(Discount):
+
+
+    def applies(self, invoiceable: Invoiceable) -> bool:
+
+        return invoiceable.t >= 5
+
+
+def catalog(api, rng):
+
+    addOns = [
+        AddOn(id=f"a{i}", name=f"Add-On {i}", rate=api.buildRateFromJSON({"rateType": "Fixed Rate", "params": {"Rate": rng.random() * 9}}))
+        for i in range(5)
+    ]
+    rooms  = [
+        Room(
+            id=f"r{i}",
+            name=f"Room {i % 5}",
+            rate=api.buildRateFromJSON({"rateType": ["Fixed Rate", "Flat Rate"][i % 2], "params": {"Rate": rng.random() * 50}}),
+            addOns=tuple(rng.sample(addOns, 2))
+        )
+        for i in range(7)
+    ]
+
+    return rooms, addOns
+
+
+def offers(api, rng):
+
+    bundles = [
+        api.buildDiscountFromJSON({"discountType": "Room Bundle Discount", "params": {"room bundle names": names, "rate": rng.random() / 4}})
+        for names in ([], ["Room 0"], ["Room 1", "Room 2"], ["Room 3", "Room 4", "Room 0"])
+    ]
+
+    return [*bundles, LongStayDiscount(name="Long Stay", rateFunc=lambda subtotal: subtotal * 0.05)]
+
+
+def rebuilt(engine, quote, discounts):
+
+    invoiceable = Invoiceable(rooms=list(quote.rooms), addOns=list(quote.addOns), t=quote.t)
+
+    try:
+
+        return InvoiceBuilder(engine).build(1, "Payee", *DATES, invoiceable, discounts)
+
+    except ValueError as e:
+
+        return str(e)
+
+
+def built(quote):
+
+    try:
+
+        return quote.build(1, "Payee", *DATES)
+
+    except ValueError as e:
+
+        return str(e)
+
+
+@pytest.mark.parametrize("money", [None, FixedPoint(100)])
+def testMatchesAFullRebuild(api, money):
+
+    rng           = random.Random(23)
+    engine        = PricingEngine(money=money)
+    rooms, addOns = catalog(api, rng)
+    discounts     = offers(api, rng)
+    quote         = IncrementalInvoice(engine, discounts, 2.5)
+    discounted    = 0
+    rejected      = 0
+
+    for step in range(400):
+
+        action = rng.random()
+
+        if action < 0.35:
+
+            quote.addRoom(rng.choice(rooms))
+
+        elif action < 0.55 and quote.rooms:
+
+            quote.removeRoom(rng.choice(quote.rooms))
+
+        elif action < 0.75:
+
+            quote.addAddOn(rng.choice(addOns))
+
+        elif action < 0.9 and quote.addOns:
+
+            quote.removeAddOn(rng.choice(quote.addOns))
+
+        else:
+
+            quote.setDuration(rng.choice([0.5, 1, 3.25, 5, 8.125]))
+
+        invoice = built(quote)
+
+        assert invoice == rebuilt(engine, quote, discounts), step
+
+        rejected   += isinstance(invoice, str)
+        discounted += not isinstance(invoice, str) and len(invoice.discountItems) > 1
+
+    # Both approved selections with several discounts and rejected ones were compared.
+    assert discounted > 20 and rejected > 5
+
+
+def testRemovingAnUnselectedRentableFails(api):
+
+    rooms, addOns = catalog(api, random.Random(1))
+    quote         = api.startQuote([], 1)
+
+    quote.addRoom(rooms[0])
+
+    with pytest.raises(ValueError, match="is not selected"):
+
+        quote.removeRoom(rooms[1])
+
+    with pytest.raises(ValueError, match="is not selected"):
+
+        quote.removeAddOn(addOns[0])
+
+    # Equal rooms are found by value as well as by identity.
+    quote.removeRoom(Room(id=rooms[0].id, name=rooms[0].name, rate=rooms[0].rate, addOns=rooms[0].addOns))
+
+    assert quote.rooms == [] and quote.subtotal == 0
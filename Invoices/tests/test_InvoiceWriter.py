@@ -0,0 +1,136 @@
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+import pytest
+from API import API
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+from Invoices import Invoice, FixedPoint, ColumnarInvoice, StringTable, NDJSONInvoiceWriter, CSVInvoiceWriter
+
+
+PAYEES = ["Plain", 'Quote "and", comma', "Line\nbreak", "Ünïcode ✓"]
+
+
+def invoices(invoiceJSON, money=None):
+
+    api = API(money=money)
+
+    registerDefaultRates(api)
+    registerDefaultDiscounts(api)
+
+    # An invoice without any line items is written too.
+    empty = Invoice(
+        invoiceNum=99,
+        payee="Empty",
+        dateCreated=date(2024, 2, 1),
+        dateDue=date(2024, 3, 1),
+        invoiceItems=[],
+        discountItems=[],
+        subtotal=0.0 if money is None else 0,
+        total=0.0 if money is None else 0,
+        scale=None if money is None else money.scale
+    )
+
+    return [
+        *(api.buildInvoiceFromJSON({**invoiceJSON(i, rooms=i % 3 + 1, t=i * 0.7 + 0.1), "payee": PAYEES[i % len(PAYEES)]}) for i in range(8)),
+        empty
+    ]
+
+
+def major(invoice, amount):
+
+    # Written floats are parsed back as Decimals, so they compare exactly.
+    if invoice.scale is None:
+
+        return Decimal(repr(amount))
+
+    return Decimal(amount) / invoice.scale
+
+
+def written(writerCls, invoices, **options):
+
+    file = io.StringIO(newline="")
+
+    with writerCls(file, **options) as writer:
+
+        assert writer.writeMany(invoices) == len(invoices)
+
+    return file.getvalue()
+
+
+@pytest.mark.parametrize("money", [None, FixedPoint(100)])
+def testNDJSONMatchesJSON(invoiceJSON, money):
+
+    batch = invoices(invoiceJSON, money)
+    lines = written(NDJSONInvoiceWriter, batch, bufferSize=7).splitlines()
+
+    assert len(lines) == len(batch)
+
+    for line, invoice in zip(lines, batch):
+
+        assert json.loads(line, parse_float=Decimal) == {
+            "invoiceNum": invoice.invoiceNum,
+            "payee": invoice.payee,
+            "dateCreated": invoice.dateCreated.isoformat(),
+            "dateDue": invoice.dateDue.isoformat(),
+            "invoiceItems": [
+                {"name": item.name, "rate": item.rate, "quantity": Decimal(repr(item.quantity)), "subtotal": major(invoice, item.subtotal)}
+                for item in invoice.invoiceItems
+            ],
+            "discountItems": [{"name": item.name, "amount": major(invoice, item.amount)} for item in invoice.discountItems],
+            "subtotal": major(invoice, invoice.subtotal),
+            "total": major(invoice, invoice.total)
+        }
+
+
+@pytest.mark.parametrize("money", [None, FixedPoint(100)])
+def testCSVMatchesTheCSVModule(invoiceJSON, money):
+
+    batch    = invoices(invoiceJSON, money)
+    expected = io.StringIO(newline="")
+    rows     = csv.writer(expected)
+
+    rows.writerow(CSVInvoiceWriter.columns)
+
+    def amount(invoice, value):
+
+        return value if invoice.scale is None else format(Decimal(value) / invoice.scale, "f")
+
+    for invoice in batch:
+
+        header = [
+            invoice.invoiceNum, invoice.payee, invoice.dateCreated, invoice.dateDue,
+            amount(invoice, invoice.subtotal), amount(invoice, invoice.total)
+        ]
+        lines  = [
+            *(["item", item.name, item.rate, item.quantity, amount(invoice, item.subtotal)] for item in invoice.invoiceItems),
+            *(["discount", item.name, "", "", amount(invoice, item.amount)] for item in invoice.discountItems)
+        ]
+
+        rows.writerows([*header, *line] for line in lines or [["", "", "", "", ""]])
+
+    assert written(CSVInvoiceWriter, batch, bufferSize=1) == expected.getvalue()
+
+
+@pytest.mark.parametrize("writerCls", [NDJSONInvoiceWriter, CSVInvoiceWriter])
+def testColumnarInvoicesWriteTheSame(invoiceJSON, writerCls):
+
+    batch = invoices(invoiceJSON, FixedPoint(100))
+    table = StringTable()
+
+    assert written(writerCls, [ColumnarInvoice.fromInvoice(invoice, table) for invoice in batch]) == written(writerCls, batch)
+
+
+def testRejectsUnknownValuesAndEmptyBuffers(invoiceJSON):
+
+    with pytest.raises(ValueError, match="bufferSize"):
+
+        NDJSONInvoiceWriter(io.StringIO(), bufferSize=0)
+
+    writer = NDJSONInvoiceWriter(io.StringIO())
+
+    with pytest.raises(TypeError, match="Cannot encode values of type 'object'"):
+
+        writer._encodeValue(object())
@@ -0,0 +1,94 @@
+import pytest
+from API import API
+from Rentables.utils import registerDefaultRates
+from Rentables import AddOn
+from Rentables.utils.Rate import Rate
+from Discounts import registerDefaultDiscounts
+from Invoices import PricingCache
+from Invoices.PricingCache import PricingCacheStats
+
+
+class Clock:
+
+
+    def __init__(self):
+
+        self.now = 0.0
+
+
+    def __call__(self) -> float:
+
+        return self.now
+
+
+def room(api, roomID, rate):
+
+    return api.buildRoomFromJSON({"id": roomID, "name": roomID, "rate": {"rateType": "Fixed Rate", "params": {"Rate": rate}}, "addOns": []})
+
+
+def testCachedInvoicesMatchUncachedOnes(api, invoiceJSON):
+
+    cached = API(pricingCache=PricingCache(maxSize=8))
+
+    registerDefaultRates(cached)
+    registerDefaultDiscounts(cached)
+
+    specs = [invoiceJSON(i, rooms=i % 3 + 1, t=i % 2 + 1) for i in range(6)]
+
+    assert [cached.buildInvoiceFromJSON(spec) for spec in specs] == [api.buildInvoiceFromJSON(spec) for spec in specs]
+    assert cached.pricingCacheStats().hits > 0
+    assert api.pricingCacheStats() is None
+
+
+def testKeysOnTheRateAndDuration(api):
+
+    cache = PricingCache()
+
+    assert cache.subtotal(room(api, "a", 10), 2) == 20
+    assert cache.subtotal(room(api, "b", 10), 2) == 20
+    assert cache.subtotal(room(api, "a", 10), 3) == 30
+    assert cache.subtotal(room(api, "a", 11), 2) == 22
+    assert cache.stats() == PricingCacheStats(hits=1, misses=3, size=3, maxSize=4096)
+    assert cache.stats().hitRate == 0.25
+
+
+def testEvictsAndExpires(api):
+
+    clock = Clock()
+    cache = PricingCache(maxSize=2, ttl=10, clock=clock)
+    first = room(api, "a", 1)
+
+    cache.subtotal(first, 1)
+    cache.subtotal(room(api, "b", 2), 1)
+    cache.subtotal(first, 1)
+    cache.subtotal(room(api, "c", 3), 1)
+
+    assert cache.stats()[:3] == (1, 3, 2)
+
+    clock.now = 10
+
+    cache.subtotal(first, 1)
+
+    assert cache.stats()[:2] == (1, 4)
+
+    cache.clear()
+
+    assert cache.stats() == PricingCacheStats(0, 0, 0, 2)
+
+
+def testRatesWithoutAFingerprintAreAlwaysEvaluated():
+
+    calls = []
+    cache = PricingCache()
+    rent  = AddOn(id="a", name="A", rate=Rate(name="Counted", rateFunc=lambda t: calls.append(t) or t))
+
+    assert [cache.subtotal(rent, 2) for _ in range(3)] == [2, 2, 2]
+    assert calls == [2, 2, 2]
+    assert cache.stats().size == 0
+
+
+def testRejectsAnEmptyCache():
+
+    with pytest.raises(ValueError, match="maxSize"):
+
+        PricingCache(maxSize=0)
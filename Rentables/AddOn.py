@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .Rentable import Rentable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AddOn(Rentable):
     """
     Encapsulates an optional rentable add-on.
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .utils import Rate
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rentable:
     """
     Encapsulates a generic rentable entity which has a name and a pricing function.
@@ -1,10 +1,10 @@
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import FrozenSet, Tuple
 from .Rentable import Rentable
 from .AddOn import AddOn
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Room(Rentable):
     """
     Encapsulates a rentable room which may support optional add-ons.
@@ -14,6 +14,9 @@ class Room(Rentable):
     addOns : Tuple[AddOn, ...]
         A tuple of add-ons (possibly empty) which may be supported by this room.
 
+    addOnIDs : FrozenSet[str]
+        The ids of addOns, precomputed so support checks are a set lookup.
+
     Methods
     -------
     supports(addOn: AddOn) -> bool
@@ -22,6 +25,12 @@ class Room(Rentable):
 
 
     addOns: Tuple[AddOn, ...] = ()
+    addOnIDs: FrozenSet[str]  = field(init=False, repr=False, compare=False)
+
+
+    def __post_init__(self):
+
+        object.__setattr__(self, "addOnIDs", frozenset(addOn.id for addOn in self.addOns))
 
 
     def supports(self, addOn: AddOn) -> bool:
@@ -39,4 +48,4 @@ class Room(Rentable):
             True if the add-on is in this room's addOns, False otherwise.
         """
 
-        return any(a.id == addOn.id for a in self.addOns)
+        return addOn.id in self.addOnIDs
@@ -0,0 +1,211 @@
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Any, Optional, Sequence, Tuple
+
+try:
+
+    import numpy
+
+except ImportError:
+
+    numpy = None
+
+
+@dataclass(frozen=True, slots=True)
+class BreakpointTable:
+    """
+    Encapsulates a compiled piecewise-linear cost schedule which has sorted
+    segment starts, the cumulative cost at each start, and the cost per unit
+    time within each segment.
+
+    Tables are compiled once from rate params, so evaluating a cost is a
+    bisect over the segment starts followed by one multiply-add, in
+    O(log segments) rather than a loop over the tiers.
+
+    Attributes
+    ----------
+    starts : Tuple[float, ...]
+        The strictly increasing durations at which each segment starts.
+
+    costs : Tuple[float, ...]
+        The cumulative cost at the start of each segment.
+
+    slopes : Tuple[float, ...]
+        The cost per unit time within each segment; the last one applies past the last start.
+
+    Methods
+    -------
+    fromTiers(breakpoints: Sequence[float], rates: Sequence[float]) -> BreakpointTable
+        Compiles a graduated tier schedule.
+
+    fromPoints(times: Sequence[float], costs: Sequence[float]) -> BreakpointTable
+        Compiles a piecewise-linear schedule through the given points.
+
+    evaluate(t: float) -> float
+        Computes the cost over a given duration of time.
+
+    evaluateMany(ts: numpy.ndarray) -> numpy.ndarray
+        Computes the cost over each of the given durations of time.
+    """
+
+
+    starts: Tuple[float, ...]
+    costs: Tuple[float, ...]
+    slopes: Tuple[float, ...]
+    arrays: Optional[Tuple[Any, Any, Any]] = field(init=False, repr=False, compare=False)
+
+
+    def __post_init__(self):
+
+        if not self.starts or not len(self.starts) == len(self.costs) == len(self.slopes):
+
+            raise ValueError("starts, costs and slopes must be non-empty and of equal length")
+
+        if any(start >= end for start, end in zip(self.starts, self.starts[1:])):
+
+            raise ValueError("Breakpoints must be strictly increasing")
+
+        arrays = None
+
+        if numpy is not None:
+
+            arrays = tuple(numpy.asarray(column, dtype=float) for column in (self.starts, self.costs, self.slopes))
+
+        object.__setattr__(self, "arrays", arrays)
+
+
+    @classmethod
+    def fromTiers(cls, breakpoints: Sequence[float], rates: Sequence[float]) -> "BreakpointTable":
+        """
+        Compiles a graduated tier schedule, where each unit of time is charged
+        at the rate of the tier it falls in.
+
+        Parameters
+        ----------
+        breakpoints : Sequence[float]
+            The strictly increasing, positive durations at which the next tier starts.
+
+        rates : Sequence[float]
+            The cost per unit time of each tier, one more than there are breakpoints.
+
+        Returns
+        -------
+        BreakpointTable
+            The compiled table.
+
+        Raises
+        ------
+        ValueError
+            If the breakpoints and rates do not describe a valid schedule.
+        """
+
+        if len(rates) != len(breakpoints) + 1:
+
+            raise ValueError("Rates must have exactly one more entry than Breakpoints")
+
+        if breakpoints and breakpoints[0] <= 0:
+
+            raise ValueError("Breakpoints must be positive")
+
+        starts = (0.0, *map(float, breakpoints))
+        slopes = tuple(map(float, rates))
+        widths = (end - start for start, end in zip(starts, starts[1:]))
+        costs  = tuple(accumulate((slope * width for slope, width in zip(slopes, widths)), initial=0.0))
+
+        return cls(starts=starts, costs=costs, slopes=slopes)
+
+
+    @classmethod
+    def fromPoints(cls, times: Sequence[float], costs: Sequence[float]) -> "BreakpointTable":
+        """
+        Compiles a piecewise-linear schedule through the given (time, cost)
+        points. The cost is the first point's cost before it (a minimum charge)
+        and the last point's cost after it (a cap).
+
+        Parameters
+        ----------
+        times : Sequence[float]
+            The strictly increasing, non-negative durations of the points.
+
+        costs : Sequence[float]
+            The cost at each point.
+
+        Returns
+        -------
+        BreakpointTable
+            The compiled table.
+
+        Raises
+        ------
+        ValueError
+            If the times and costs do not describe a valid schedule.
+        """
+
+        if not times or len(times) != len(costs):
+
+            raise ValueError("Times and Costs must be non-empty and of equal length")
+
+        if times[0] < 0:
+
+            raise ValueError("Times must be non-negative")
+
+        starts = tuple(map(float, times))
+        values = tuple(map(float, costs))
+
+        if starts[0] > 0:
+
+            starts = (0.0, *starts)
+            values = (values[0], *values)
+
+        if any(start >= end for start, end in zip(starts, starts[1:])):
+
+            raise ValueError("Breakpoints must be strictly increasing")
+
+        slopes = tuple(
+            (high - low) / (end - start)
+            for start, end, low, high in zip(starts, starts[1:], values, values[1:])
+        )
+
+        return cls(starts=starts, costs=values, slopes=(*slopes, 0.0))
+
+
+    def evaluate(self, t: float) -> float:
+        """
+        Computes the cost over a given duration of time.
+
+        Parameters
+        ----------
+        t : float
+            The duration of time.
+
+        Returns
+        -------
+        float
+            The cost.
+        """
+
+        segment = max(bisect_right(self.starts, t) - 1, 0)
+
+        return self.costs[segment] + self.slopes[segment] * (t - self.starts[segment])
+
+
+    def evaluateMany(self, ts: "numpy.ndarray") -> "numpy.ndarray":
+        """
+        Computes the cost over each of the given durations of time. Requires NumPy.
+
+        Parameters
+        ----------
+        ts : numpy.ndarray
+            The durations of time.
+
+        Returns
+        -------
+        numpy.ndarray
+            The costs, of the same shape as ts.
+        """
+
+        starts, costs, slopes = self.arrays
+        segments              = numpy.maximum(numpy.searchsorted(starts, ts, side="right") - 1, 0)
+
+        return costs[segments] + slopes[segments] * (ts - starts[segments])
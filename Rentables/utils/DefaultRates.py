@@ -1,6 +1,15 @@
 from typing import TYPE_CHECKING, Dict, Any
 from .Rate import Rate
 from .Param import Param
+from .BreakpointTable import BreakpointTable
+
+try:
+
+    import numpy
+
+except ImportError:
+
+    numpy = None
 
 
 if TYPE_CHECKING:
@@ -8,7 +17,17 @@ if TYPE_CHECKING:
     from API import API
 
 
-def registerDefaultRates(api: API):
+def registerDefaultRates(api: "API"):
+
+
+    def fixedRateMany(params: Dict[str, Any], ts: "numpy.ndarray") -> "numpy.ndarray":
+
+        return numpy.asarray(params["Rate"], dtype=float) * ts
+
+
+    def flatRateMany(params: Dict[str, Any], ts: "numpy.ndarray") -> "numpy.ndarray":
+
+        return numpy.asarray(params["Rate"], dtype=float)
 
 
     @api.registerRate(
@@ -27,7 +46,9 @@ def registerDefaultRates(api: API):
 
         return Rate(
             name="Fixed Rate",
-            rateFunc=lambda t: rate * t
+            rateFunc=lambda t: rate * t,
+            vectorFunc=lambda ts: rate * ts,
+            batchFunc=fixedRateMany
         )
 
 
@@ -47,5 +68,130 @@ def registerDefaultRates(api: API):
 
         return Rate(
             name="Flat Rate",
-            rateFunc=lambda t: rate
+            rateFunc=lambda t: rate,
+            vectorFunc=lambda ts: rate,
+            batchFunc=flatRateMany
+        )
+
+
+    @api.registerRate(
+            "Tiered Rate",
+            [
+                Param(
+                    name="Breakpoints",
+                    type="list[float]",
+                    description="Durations at which the next tier starts, ascending",
+                    constraints={"min": 0}
+                ),
+                Param(
+                    name="Rates",
+                    type="list[float]",
+                    description="Cost per unit time of each tier, one more than Breakpoints"
+                )
+            ]
+    )
+    def buildTieredRate(params: Dict[str, Any]) -> Rate:
+
+        table = BreakpointTable.fromTiers(params["Breakpoints"], params["Rates"])
+
+        return Rate(
+            name="Tiered Rate",
+            rateFunc=table.evaluate,
+            vectorFunc=table.evaluateMany
+        )
+
+
+    @api.registerRate(
+            "Piecewise Linear Rate",
+            [
+                Param(
+                    name="Times",
+                    type="list[float]",
+                    description="Durations of the schedule points, ascending",
+                    constraints={"min": 0}
+                ),
+                Param(
+                    name="Costs",
+                    type="list[float]",
+                    description="Total cost at each point, held flat before the first and after the last"
+                )
+            ]
+    )
+    def buildPiecewiseLinearRate(params: Dict[str, Any]) -> Rate:
+
+        table = BreakpointTable.fromPoints(params["Times"], params["Costs"])
+
+        return Rate(
+            name="Piecewise Linear Rate",
+            rateFunc=table.evaluate,
+            vectorFunc=table.evaluateMany
+        )
+
+
+    @api.registerRate(
+            "Capped Tiered Rate",
+            [
+                Param(
+                    name="Breakpoints",
+                    type="list[float]",
+                    description="Durations at which the next tier starts, ascending",
+                    constraints={"min": 0}
+                ),
+                Param(
+                    name="Rates",
+                    type="list[float]",
+                    description="Cost per unit time of each tier, one more than Breakpoints"
+                ),
+                Param(
+                    name="Cap",
+                    type="float",
+                    description="Maximum cost per cap period",
+                    constraints={"min": 0}
+                ),
+                Param(
+                    name="Cap Period",
+                    type="float",
+                    description="Length of each capped period, e.g. 24 for a day cap; 0 caps the whole duration",
+                    constraints={"min": 0}
+                )
+            ]
+    )
+    def buildCappedTieredRate(params: Dict[str, Any]) -> Rate:
+
+        table  = BreakpointTable.fromTiers(params["Breakpoints"], params["Rates"])
+        cap    = float(params["Cap"])
+        period = float(params["Cap Period"])
+
+        if period < 0:
+
+            raise ValueError("Cap Period must not be negative")
+
+        if not period:
+
+            return Rate(
+                name="Capped Tiered Rate",
+                rateFunc=lambda t: min(cap, table.evaluate(t)),
+                vectorFunc=lambda ts: numpy.minimum(cap, table.evaluateMany(ts))
+            )
+
+        # Every full period costs the capped price of one period; only the
+        # remainder is looked up in the tier table.
+        periodCost = min(cap, table.evaluate(period))
+
+        def rateFunc(t: float) -> float:
+
+            periods, remainder = divmod(t, period)
+
+            return periods * periodCost + min(cap, table.evaluate(remainder))
+
+        def vectorFunc(ts):
+
+            periods, remainder = numpy.divmod(ts, period)
+
+            return periods * periodCost + numpy.minimum(cap, table.evaluateMany(remainder))
+
+        return Rate(
+            name="Capped Tiered Rate",
+            rateFunc=rateFunc,
+            vectorFunc=vectorFunc
         )
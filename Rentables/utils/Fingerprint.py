@@ -0,0 +1,34 @@
+from typing import Any, Hashable, Mapping
+
+
+def fingerprint(value: Any) -> Hashable:
+    """
+    Builds a canonical, hashable key for a JSON-like value.
+
+    Mappings compare regardless of key order and scalars keep their type, so
+    that `{"Rate": 1}` and `{"Rate": 1.0}` stay distinct.
+
+    Parameters
+    ----------
+    value : Any
+        The value to fingerprint.
+
+    Returns
+    -------
+    Hashable
+        A nested tuple/frozenset structure that is equal for equal values.
+    """
+
+    if isinstance(value, Mapping):
+
+        return (dict, frozenset((key, fingerprint(val)) for key, val in value.items()))
+
+    if isinstance(value, (list, tuple)):
+
+        return (list, tuple(fingerprint(item) for item in value))
+
+    if isinstance(value, (set, frozenset)):
+
+        return (frozenset, frozenset(fingerprint(item) for item in value))
+
+    return (type(value), value)
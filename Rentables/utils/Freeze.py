@@ -0,0 +1,62 @@
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def freeze(value: Any) -> Any:
+    """
+    Builds a deeply immutable copy of a JSON-like value.
+
+    Mappings become read-only mappings, lists and tuples become tuples, and
+    sets become frozensets, at every level, so that a value shared between
+    interned rates cannot be changed through any of them.
+
+    Parameters
+    ----------
+    value : Any
+        The value to freeze.
+
+    Returns
+    -------
+    Any
+        The frozen copy; scalars are returned as they are.
+    """
+
+    if isinstance(value, Mapping):
+
+        return MappingProxyType({key: freeze(val) for key, val in value.items()})
+
+    if isinstance(value, (list, tuple)):
+
+        return tuple(freeze(item) for item in value)
+
+    if isinstance(value, (set, frozenset)):
+
+        return frozenset(freeze(item) for item in value)
+
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Builds a plain, JSON-serializable copy of a frozen value.
+
+    Parameters
+    ----------
+    value : Any
+        The value to thaw, e.g. the params of a rate.
+
+    Returns
+    -------
+    Any
+        The copy, with mappings as dicts and tuples and frozensets as lists.
+    """
+
+    if isinstance(value, Mapping):
+
+        return {key: thaw(val) for key, val in value.items()}
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+
+        return [thaw(item) for item in value]
+
+    return value
@@ -1,11 +1,21 @@
 from dataclasses import dataclass, field
-from typing import Dict, Callable, Any
+from typing import Mapping, Callable, Hashable, Optional, Sequence, Union, List, Any
 
+try:
 
-RateFunc = Callable[[float], float]
+    import numpy
 
+except ImportError:
 
-@dataclass(frozen=True)
+    numpy = None
+
+
+RateFunc   = Callable[[float], float]
+VectorFunc = Callable[[Any], Any]
+BatchFunc  = Callable[[Mapping[str, Any], Any], Any]
+
+
+@dataclass(frozen=True, slots=True)
 class Rate:
     """
     Encapsulates a generic rate entity which has a name and a pricing function.
@@ -18,19 +28,38 @@ class Rate:
     rateFunc : Callable[[float], float]
         A function that computes the rental cost over a given duration of time.
 
-    params : Dict[str, Any]
+    vectorFunc : Optional[Callable[[numpy.ndarray], Any]]
+        An optional NumPy implementation of rateFunc over an array of durations.
+        It may return a scalar, which is broadcast to the shape of the input.
+
+    params : Mapping[str, Any]
         The rate function's parameters.
 
+    fingerprint : Optional[Hashable]
+        Canonical (name, builder, params) key set by the registry for shared rates.
+
+    batchFunc : Optional[Callable[[Mapping[str, Sequence[Any]], numpy.ndarray], Any]]
+        An optional NumPy implementation shared by every rate of this rate type.
+        It takes a column of values per param, aligned with an array of
+        durations, so rows priced at many different params are evaluated in
+        a single call.
+
     Methods
     -------
     calculate(t: float) -> float
         Computes the rental cost over a given duration of time.
+
+    calculateMany(ts: Sequence[float]) -> Union[numpy.ndarray, List[float]]
+        Computes the rental cost over each of the given durations of time.
     """
 
 
     name: str
     rateFunc: RateFunc
-    params: Dict[str, Any] = field(default_factory=dict)
+    params: Mapping[str, Any] = field(default_factory=dict)
+    vectorFunc: Optional[VectorFunc] = field(default=None, compare=False, repr=False)
+    fingerprint: Optional[Hashable] = field(default=None, compare=False, repr=False)
+    batchFunc: Optional[BatchFunc] = field(default=None, compare=False, repr=False)
 
 
     def calculate(self, t: float) -> float:
@@ -49,3 +78,35 @@ class Rate:
         """
 
         return self.rateFunc(t)
+
+
+    def calculateMany(self, ts: Sequence[float]) -> Union["numpy.ndarray", List[float]]:
+        """
+        Computes the rental cost over each of the given durations of time.
+
+        Uses vectorFunc when NumPy is installed and one is available, and
+        otherwise evaluates rateFunc element-wise.
+
+        Parameters
+        ----------
+        ts : Sequence[float]
+            The durations of time, as a NumPy array or any sequence of floats.
+
+        Returns
+        -------
+        Union[numpy.ndarray, List[float]]
+            The rental costs, as a float array of the same shape as ts if NumPy
+            is installed, or as a list otherwise.
+        """
+
+        if numpy is None:
+
+            return [self.rateFunc(t) for t in ts]
+
+        ts = numpy.asarray(ts, dtype=float)
+
+        if self.vectorFunc is not None:
+
+            return numpy.broadcast_to(numpy.asarray(self.vectorFunc(ts), dtype=float), ts.shape).copy()
+
+        return numpy.fromiter(map(self.rateFunc, ts.ravel()), dtype=float, count=ts.size).reshape(ts.shape)
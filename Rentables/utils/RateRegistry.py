@@ -1,16 +1,34 @@
-from typing import List, Dict, Callable, Any
+from collections import OrderedDict
+from typing import List, Dict, Callable, Hashable, NamedTuple, Optional, Any
+import threading
 from .Rate import Rate
 from .Param import Param
+from .Fingerprint import fingerprint
+from .Freeze import freeze
+
+
+class RateCacheInfo(NamedTuple):
+
+    hits: int
+    misses: int
+    size: int
+    maxSize: int
 
 
 class RateRegistry:
 
     
-    def __init__(self):
+    def __init__(self, cacheSize: int = 1024):
 
         self._builders: Dict[str, Callable[[Dict[str, Any]], Rate]] = {}
         self._params: Dict[str, List[Param]] = {}
 
+        self._cache: "OrderedDict[Hashable, Rate]" = OrderedDict()
+        self._cacheSize                            = cacheSize
+        self._cacheLock                            = threading.Lock()
+        self._hits                                 = 0
+        self._misses                               = 0
+
     
     def registerRate(self, name: str, params: List[Param]):
 
@@ -19,20 +37,100 @@ class RateRegistry:
             self._builders[name] = func
             self._params[name]   = params
 
+            with self._cacheLock:
+
+                for key in [key for key in self._cache if key[0] == name]:
+
+                    del self._cache[key]
+
             return func
         
         return decorator
     
 
+    def _buildRate(self, name: str, params: Dict[str, Any], key: Optional[Hashable]) -> Rate:
+
+        rate = self._builders[name](params)
+
+        return Rate(
+            name=rate.name,
+            rateFunc=rate.rateFunc,
+            vectorFunc=rate.vectorFunc,
+            batchFunc=rate.batchFunc,
+            params=freeze(params),
+            fingerprint=key
+        )
+
+
     def getRate(self, name: str, params: Dict[str, Any]) -> Rate:
 
         if name not in self._builders:
 
             raise ValueError(f"Unknown rate type: {name}")
-        
-        rate = self._builders[name](params)
 
-        return Rate(name=rate.name, rateFunc=rate.rateFunc, params=params)
+        # Rates are interned by (name, builder, params) so that repeated price
+        # points share one immutable instance; params that cannot be hashed
+        # skip the cache. The builder is part of the key (and so of the rate's
+        # fingerprint) so that re-registering a rate type never matches prices
+        # cached for the old one, in this registry or in a PricingCache.
+        try:
+
+            key = (name, self._builders[name], fingerprint(params))
+
+            hash(key)
+
+        except TypeError:
+
+            return self._buildRate(name, params, None)
+
+        with self._cacheLock:
+
+            rate = self._cache.get(key)
+
+            if rate is not None:
+
+                self._cache.move_to_end(key)
+
+                self._hits += 1
+
+                return rate
+
+            self._misses += 1
+
+        rate = self._buildRate(name, params, key)
+
+        if self._cacheSize <= 0:
+
+            return rate
+
+        with self._cacheLock:
+
+            rate = self._cache.setdefault(key, rate)
+
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > self._cacheSize:
+
+                self._cache.popitem(last=False)
+
+        return rate
+
+
+    def cacheInfo(self) -> RateCacheInfo:
+
+        with self._cacheLock:
+
+            return RateCacheInfo(self._hits, self._misses, len(self._cache), self._cacheSize)
+
+
+    def clearCache(self):
+
+        with self._cacheLock:
+
+            self._cache.clear()
+
+            self._hits   = 0
+            self._misses = 0
     
     
     def getRateParams(self, name: str) -> List[Param]:
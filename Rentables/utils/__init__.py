@@ -1,6 +1,9 @@
 from .Rate import Rate
 from .Param import Param
-from .RateRegistry import RateRegistry
+from .RateRegistry import RateRegistry, RateCacheInfo
+from .Fingerprint import fingerprint
+from .Freeze import freeze, thaw
+from .BreakpointTable import BreakpointTable
 from .DefaultRates import registerDefaultRates
 
-__all__ = ["Rate", "Param", "RateRegistry", "registerDefaultRates"]
+__all__ = ["Rate", "Param", "RateRegistry", "RateCacheInfo", "fingerprint", "freeze", "thaw", "BreakpointTable", "registerDefaultRates"]
@@ -0,0 +1,139 @@
+import random
+import pytest
+from API import RegistryError
+from Rentables.utils.BreakpointTable import BreakpointTable
+
+
+def tieredCost(breakpoints, rates, t):
+
+    cost  = 0.0
+    start = 0.0
+
+    for end, rate in zip([*breakpoints, float("inf")], rates):
+
+        cost  += rate * max(0.0, min(t, end) - start)
+        start  = end
+
+    return cost
+
+
+def pointCost(times, costs, t):
+
+    if t <= times[0]:
+
+        return costs[0]
+
+    for start, end, low, high in zip(times, times[1:], costs, costs[1:]):
+
+        if t <= end:
+
+            return low + (high - low) * (t - start) / (end - start)
+
+    return costs[-1]
+
+
+def schedules(rng, count=200):
+
+    for _ in range(count):
+
+        size  = rng.randint(0, 12)
+        times = sorted(rng.sample(range(1, 500), size))
+
+        yield [time / 4 for time in times], [rng.uniform(0, 50) for _ in range(size + 1)]
+
+
+def durations(rng, last):
+
+    return [0, last, last + 1, *(rng.uniform(0, last * 1.5 + 2) for _ in range(30))]
+
+
+def testTiersMatchALoopOverTiers():
+
+    rng = random.Random(25)
+
+    for breakpoints, rates in schedules(rng):
+
+        table = BreakpointTable.fromTiers(breakpoints, rates)
+
+        for t in durations(rng, breakpoints[-1] if breakpoints else 10):
+
+            assert table.evaluate(t) == pytest.approx(tieredCost(breakpoints, rates, t))
+
+
+def testPointsMatchLinearInterpolation():
+
+    rng = random.Random(26)
+
+    for times, costs in schedules(rng):
+
+        # Points may start at zero; tiers never do.
+        times = [0.0, *times] if rng.random() < 0.5 else times or [1.0]
+        costs = costs[:len(times)] + [rng.uniform(0, 50) for _ in range(len(times) - len(costs))]
+        table = BreakpointTable.fromPoints(times, costs)
+
+        for t in durations(rng, times[-1]):
+
+            assert table.evaluate(t) == pytest.approx(pointCost(times, costs, t))
+
+
+def testEvaluateManyMatchesEvaluate():
+
+    numpy = pytest.importorskip("numpy")
+    rng   = random.Random(27)
+
+    for breakpoints, rates in schedules(rng, 50):
+
+        table = BreakpointTable.fromTiers(breakpoints, rates)
+        ts    = numpy.array(durations(rng, breakpoints[-1] if breakpoints else 10))
+
+        assert table.evaluateMany(ts).tolist() == pytest.approx([table.evaluate(t) for t in ts])
+
+    assert table.evaluateMany(ts[:32].reshape(4, 8)).shape == (4, 8)
+
+
+@pytest.mark.parametrize("build, args, message", [
+    (BreakpointTable.fromTiers, ([2, 1], [1, 2, 3]), "strictly increasing"),
+    (BreakpointTable.fromTiers, ([1, 1], [1, 2, 3]), "strictly increasing"),
+    (BreakpointTable.fromTiers, ([0, 1], [1, 2, 3]), "positive"),
+    (BreakpointTable.fromTiers, ([1, 2], [1, 2]), "one more entry"),
+    (BreakpointTable.fromPoints, ([], []), "non-empty"),
+    (BreakpointTable.fromPoints, ([1, 2], [1]), "equal length"),
+    (BreakpointTable.fromPoints, ([-1, 2], [1, 2]), "non-negative"),
+    (BreakpointTable.fromPoints, ([2, 1], [1, 2]), "strictly increasing")
+])
+def testRejectsInvalidSchedules(build, args, message):
+
+    with pytest.raises(ValueError, match=message):
+
+        build(*args)
+
+
+def testDefaultRatesMatchTheirSchedules(api):
+
+    numpy = pytest.importorskip("numpy")
+    ts    = [0, 0.5, 3, 4, 7.25, 24, 30, 49.5, 100]
+
+    tiered    = api.buildRateFromJSON({"rateType": "Tiered Rate", "params": {"Breakpoints": [4, 10], "Rates": [10, 6, 2]}})
+    piecewise = api.buildRateFromJSON({"rateType": "Piecewise Linear Rate", "params": {"Times": [1, 8], "Costs": [15, 50]}})
+    capped    = api.buildRateFromJSON({"rateType": "Capped Tiered Rate", "params": {"Breakpoints": [4], "Rates": [10, 5], "Cap": 60, "Cap Period": 24}})
+    uncapped  = api.buildRateFromJSON({"rateType": "Capped Tiered Rate", "params": {"Breakpoints": [4], "Rates": [10, 5], "Cap": 60, "Cap Period": 0}})
+
+    assert [tiered.calculate(t) for t in ts] == pytest.approx([tieredCost([4, 10], [10, 6, 2], t) for t in ts])
+    assert [piecewise.calculate(t) for t in ts] == pytest.approx([pointCost([1, 8], [15, 50], t) for t in ts])
+    assert [capped.calculate(t) for t in (3, 12, 24, 27, 54)] == pytest.approx([30, 60, 60, 90, 170])
+    assert [uncapped.calculate(t) for t in (3, 12, 100)] == pytest.approx([30, 60, 60])
+
+    for rate in (tiered, piecewise, capped, uncapped):
+
+        assert rate.calculateMany(numpy.array(ts)).tolist() == pytest.approx([rate.calculate(t) for t in ts])
+
+
+def testInvalidSchedulesAreRegistryErrors(api):
+
+    with pytest.raises(RegistryError):
+
+        api.buildRateFromJSON({"rateType": "Tiered Rate", "params": {"Breakpoints": [4, 2], "Rates": [1, 2, 3]}})
+
+    with pytest.raises(RegistryError):
+
+        api.buildRateFromJSON({"rateType": "Capped Tiered Rate", "params": {"Breakpoints": [], "Rates": [1], "Cap": 5, "Cap Period": -1}})
@@ -0,0 +1,45 @@
+import sys
+import pytest
+from Rentables.utils.Rate import Rate
+
+numpy = pytest.importorskip("numpy")
+
+
+TS = [0, 0.25, 1, 2.5, 7, 24, 100.125]
+
+
+def testMatchesCalculate(api):
+
+    for rateJSON in ({"rateType": "Fixed Rate", "params": {"Rate": 12.5}}, {"rateType": "Flat Rate", "params": {"Rate": 40}}):
+
+        rate = api.buildRateFromJSON(rateJSON)
+
+        assert rate.calculateMany(TS).tolist() == [rate.calculate(t) for t in TS]
+
+
+def testKeepsTheShapeOfTheInput(api):
+
+    rate = api.buildRateFromJSON({"rateType": "Flat Rate", "params": {"Rate": 40}})
+    ts   = numpy.arange(6, dtype=float).reshape(2, 3)
+
+    assert rate.calculateMany(ts).shape == (2, 3)
+    assert rate.calculateMany([]).shape == (0,)
+
+    # A broadcast scalar result is copied, so callers may write to it.
+    costs = rate.calculateMany(ts)
+
+    costs[0, 0] = 0
+
+    assert costs.sum() == 200
+
+
+def testFallsBackToRateFunc(monkeypatch):
+
+    rate = Rate(name="Step", rateFunc=lambda t: 10 if t < 2 else 15)
+
+    assert rate.calculateMany(numpy.array([[1, 2], [3, 0]])).tolist() == [[10, 15], [15, 10]]
+
+    # The Rentables.utils package re-exports the Rate class under the module's name.
+    monkeypatch.setattr(sys.modules["Rentables.utils.Rate"], "numpy", None)
+
+    assert rate.calculateMany(TS) == [rate.calculate(t) for t in TS]
@@ -0,0 +1,89 @@
+import pytest
+from API import API
+from Rentables.utils import registerDefaultRates
+from Rentables.utils.Rate import Rate
+from Rentables.utils.Param import Param
+
+
+def rates(cacheSize=1024):
+
+    api = API(rateCacheSize=cacheSize)
+
+    registerDefaultRates(api)
+
+    return api._rateRegistry
+
+
+def testEqualParamsShareOneRate():
+
+    registry = rates()
+    tiered   = {"Breakpoints": [2, 5], "Rates": [10, 8, 6]}
+
+    assert registry.getRate("Fixed Rate", {"Rate": 10}) is registry.getRate("Fixed Rate", {"Rate": 10})
+    assert registry.getRate("Tiered Rate", tiered) is registry.getRate("Tiered Rate", {"Rates": [10, 8, 6], "Breakpoints": [2, 5]})
+    assert registry.getRate("Fixed Rate", {"Rate": 10}) is not registry.getRate("Fixed Rate", {"Rate": 10.0})
+    assert registry.getRate("Fixed Rate", {"Rate": 10}) is not registry.getRate("Flat Rate", {"Rate": 10})
+    assert registry.cacheInfo()[:3] == (4, 4, 4)
+
+
+def testParamsAreFrozenCopies():
+
+    registry = rates()
+    params   = {"Breakpoints": [2], "Rates": [10, 8]}
+    rate     = registry.getRate("Tiered Rate", params)
+
+    params["Rates"].append(1)
+
+    assert rate.params["Rates"] == (10, 8)
+    assert rate.calculate(3) == 28
+
+    with pytest.raises(TypeError):
+
+        rate.params["Rates"] = (1, 1)
+
+
+def testEvictsTheLeastRecentlyUsedRate():
+
+    registry = rates(cacheSize=2)
+    first    = registry.getRate("Fixed Rate", {"Rate": 1})
+    second   = registry.getRate("Fixed Rate", {"Rate": 2})
+
+    registry.getRate("Fixed Rate", {"Rate": 1})
+    registry.getRate("Fixed Rate", {"Rate": 3})
+
+    assert registry.getRate("Fixed Rate", {"Rate": 1}) is first
+    assert registry.getRate("Fixed Rate", {"Rate": 2}) is not second
+    assert registry.cacheInfo().size == 2
+
+
+def testUncachedRegistriesAndUnhashableParams():
+
+    assert rates(cacheSize=0).getRate("Flat Rate", {"Rate": 4}).calculate(9) == 4
+
+    registry = rates()
+
+    @registry.registerRate("Dict Rate", [Param(name="Rates", type="dict", description="")])
+    def buildDictRate(params):
+
+        return Rate(name="Dict Rate", rateFunc=lambda t: params["Rates"][t])
+
+    rate = registry.getRate("Dict Rate", {"Rates": {1: 5}, "Extra": bytearray(b"unhashable")})
+
+    assert rate.calculate(1) == 5
+    assert rate.fingerprint is None
+
+
+def testReregisteringARateTypeDropsItsRates():
+
+    registry = rates()
+    old      = registry.getRate("Flat Rate", {"Rate": 4})
+
+    @registry.registerRate("Flat Rate", [Param(name="Rate", type="float", description="")])
+    def buildDoubleFlatRate(params):
+
+        return Rate(name="Flat Rate", rateFunc=lambda t: 2 * params["Rate"])
+
+    new = registry.getRate("Flat Rate", {"Rate": 4})
+
+    assert new is not old and new.fingerprint != old.fingerprint
+    assert (old.calculate(1), new.calculate(1)) == (4, 8)
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from API import API
+from Rentables.utils import registerDefaultRates
+from Discounts import registerDefaultDiscounts
+
+
+@pytest.fixture
+def api() -> API:
+
+    api = API()
+
+    registerDefaultRates(api)
+    registerDefaultDiscounts(api)
+
+    return api
+
+
+@pytest.fixture
+def invoiceJSON():
+
+    def make(invoiceNum=1, rooms=3, t=3, bundle=("Room 0", "Room 1")):
+
+        addOns = [
+            {"id": f"addOn{i}", "name": f"Add-On {i}", "rate": {"rateType": ["Flat Rate", "Fixed Rate"][i % 2], "params": {"Rate": 5 + i}}}
+            for i in range(2)
+        ]
+
+        return {
+            "invoiceNum": invoiceNum,
+            "payee": "Payee",
+            "dateCreated": "2024-01-01",
+            "dateDue": "2024-01-31",
+            "invoiceable": {
+                "rooms": [
+                    {
+                        "id": f"room{i}",
+                        "name": f"Room {i}",
+                        "rate": {"rateType": "Fixed Rate", "params": {"Rate": 20 + i}},
+                        "addOns": addOns
+                    }
+                    for i in range(rooms)
+                ],
+                "addOns": addOns[:1],
+                "t": t
+            },
+            "discounts": [{"discountType": "Room Bundle Discount", "params": {"room bundle names": list(bundle), "rate": 0.1}}]
+        }
+
+    return make